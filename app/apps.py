@@ -15,3 +15,44 @@ class AppConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
+
+    def ready(self):
+        """
+        Si `SQLITE_PRODUCTION` está activo, configura cada conexión nueva a SQLite con
+        `SQLITE_PRAGMAS` (ver app/sqlite.py). Después de cada `migrate` vuelve a crear los
+        triggers de búsqueda por palabras que el schema editor de SQLite haya eliminado
+        (ver `app.fulltext.restore_triggers`).
+
+        Con una réplica de lectura (`REPLICA_DB_NAME`) se niega a iniciar si el cache es
+        propio de cada proceso: `sync_replica` publica las nuevas versiones de los modelos
+        en el cache, y con LocMemCache los workers nunca las verían, por lo que los
+        listados seguirían respondiendo 304 y páginas cacheadas con datos viejos.
+
+        El precalentamiento de `WARMUP_ON_BOOT` no se hace acá sino en `vetsoft/wsgi.py`:
+        compilar los templates importa los context processors, que cargan el URLconf, y
+        esta aplicación se inicializa antes que el admin registre sus modelos, por lo que
+        el resolver quedaría cacheado con un admin vacío.
+
+        Raises:
+            ImproperlyConfigured: Si hay réplica y el cache por defecto es por proceso.
+        """
+        from django.conf import settings
+        from django.core.exceptions import ImproperlyConfigured
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_migrate
+
+        from . import checks  # (registra los system checks)
+        from .fulltext import restore_triggers
+
+        if settings.REPLICA_DATABASE and checks.per_process_cache():
+            raise ImproperlyConfigured(
+                "REPLICA_DB_NAME requiere un cache compartido entre procesos: configure "
+                "CACHE_BACKEND con FileBasedCache, Redis o Memcached.",
+            )
+
+        post_migrate.connect(restore_triggers, sender=self, dispatch_uid="app.fulltext")
+
+        if settings.SQLITE_PRODUCTION:
+            from .sqlite import configure_connection
+
+            connection_created.connect(configure_connection, dispatch_uid="app.sqlite")
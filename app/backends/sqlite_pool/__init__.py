@@ -0,0 +1,5 @@
+"""
+Backend SQLite con pool de conexiones en el proceso.
+
+Se usa con `DB_ENGINE="app.backends.sqlite_pool"`; ver `base.py`.
+"""
@@ -0,0 +1,254 @@
+import sqlite3
+import threading
+import time
+
+from django.conf import settings
+from django.db.backends.sqlite3 import base
+
+# Pools del proceso, uno por archivo de base de datos.
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones `sqlite3` abiertas, compartido por todos los hilos del proceso.
+
+    Una conexión devuelta al pool queda abierta para la próxima request en lugar de
+    cerrarse, así abrirla (y ejecutar los PRAGMA iniciales) se paga una sola vez. El pool
+    no supera `max_size` conexiones: con todas en uso, quien pide una espera hasta
+    `timeout` segundos a que se libere alguna.
+
+    Registra métricas de uso (ver `stats`): conexiones reutilizadas (`hits`), creadas
+    (`misses`), esperas y su duración, tiempo total abriendo conexiones nuevas
+    (`setup_seconds`, sin los PRAGMA que se ejecutan después con `connection_created`),
+    conexiones descartadas por no estar sanas y pedidos que agotaron la espera.
+
+    Args:
+        max_size (int): Cantidad máxima de conexiones abiertas.
+        timeout (float): Segundos que se espera una conexión libre.
+    """
+
+    def __init__(self, max_size, timeout):
+        """Crea el pool vacío; las conexiones se abren a medida que se piden."""
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle = []
+        self._size = 0
+        self._available = threading.Condition()
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.setup_seconds = 0.0
+        self.discarded = 0
+        self.timeouts = 0
+
+    def acquire(self, connect, health_check=False):
+        """
+        Retorna una conexión libre del pool, o una nueva si todavía hay lugar.
+
+        Args:
+            connect (callable): Abre una conexión nueva.
+            health_check (bool): Si se verifica con `SELECT 1` la conexión reutilizada.
+
+        Returns:
+            sqlite3.Connection: La conexión.
+
+        Raises:
+            sqlite3.OperationalError: Si no se liberó ninguna conexión en `timeout` segundos.
+        """
+        with self._available:
+            waited = None
+            while True:
+                while self._idle:
+                    connection = self._idle.pop()
+                    if not health_check or self.is_usable(connection):
+                        self.hits += 1
+                        return connection
+                    self._discard(connection)
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                if waited is None:
+                    self.waits += 1
+                    waited = time.perf_counter()
+                remaining = self.timeout - (time.perf_counter() - waited)
+                if remaining <= 0 or not self._available.wait(remaining):
+                    self.wait_seconds += time.perf_counter() - waited
+                    self.timeouts += 1
+                    raise sqlite3.OperationalError(
+                        f"No se liberó ninguna conexión del pool en {self.timeout} s",
+                    )
+                self.wait_seconds += time.perf_counter() - waited
+                waited = time.perf_counter()
+
+        start = time.perf_counter()
+        try:
+            connection = connect()
+        except BaseException:
+            with self._available:
+                self._size -= 1
+                self._available.notify()
+            raise
+        with self._available:
+            self.misses += 1
+            self.setup_seconds += time.perf_counter() - start
+        return connection
+
+    def release(self, connection):
+        """
+        Devuelve una conexión al pool, revirtiendo la transacción que haya quedado abierta.
+
+        Args:
+            connection (sqlite3.Connection): La conexión obtenida con `acquire`.
+        """
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error:
+            self.discard(connection)
+            return
+
+        with self._available:
+            self._idle.append(connection)
+            self._available.notify()
+
+    def discard(self, connection):
+        """
+        Cierra una conexión obtenida con `acquire` en lugar de devolverla al pool.
+
+        Args:
+            connection (sqlite3.Connection): La conexión.
+        """
+        with self._available:
+            self._discard(connection)
+            self._available.notify()
+
+    def _discard(self, connection):
+        """Cierra una conexión y libera su lugar; requiere tener tomado el lock."""
+        self._size -= 1
+        self.discarded += 1
+        try:
+            connection.close()
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def is_usable(connection):
+        """
+        Verifica que una conexión siga respondiendo.
+
+        Args:
+            connection (sqlite3.Connection): La conexión.
+
+        Returns:
+            bool: Si la conexión ejecutó `SELECT 1` sin errores.
+        """
+        try:
+            connection.execute("SELECT 1")
+        except sqlite3.Error:
+            return False
+        return True
+
+    def close_all(self):
+        """Cierra las conexiones libres del pool (las que están en uso no se tocan)."""
+        with self._available:
+            while self._idle:
+                self._discard(self._idle.pop())
+
+    def stats(self):
+        """
+        Retorna las métricas del pool.
+
+        Returns:
+            dict: Conexiones abiertas (`size`) y libres (`idle`), `hits`, `misses`, `waits`,
+                `wait_seconds`, `setup_seconds`, `discarded` y `timeouts`.
+        """
+        with self._available:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "wait_seconds": self.wait_seconds,
+                "setup_seconds": self.setup_seconds,
+                "discarded": self.discarded,
+                "timeouts": self.timeouts,
+            }
+
+
+def get_pool(name):
+    """
+    Retorna el pool de conexiones de un archivo de base de datos, creándolo si no existe.
+
+    Args:
+        name (str): La ruta de la base de datos.
+
+    Returns:
+        ConnectionPool: El pool.
+    """
+    with _pools_lock:
+        if name not in _pools:
+            _pools[name] = ConnectionPool(settings.DB_POOL_MAX_SIZE, settings.DB_POOL_TIMEOUT)
+        return _pools[name]
+
+
+def pool_stats():
+    """
+    Retorna las métricas de todos los pools del proceso.
+
+    Returns:
+        dict: Las métricas de cada pool (ver `ConnectionPool.stats`), por base de datos.
+    """
+    with _pools_lock:
+        pools = dict(_pools)
+    return {name: pool.stats() for name, pool in pools.items()}
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    """
+    Backend SQLite de Django que toma sus conexiones de un `ConnectionPool`.
+
+    Django abre una conexión por hilo y, con `CONN_MAX_AGE = 0`, la cierra al terminar cada
+    request. Con este backend "abrir" toma una conexión libre del pool y "cerrar" la
+    devuelve, así el costo de conectarse desaparece de cada request. Las bases en memoria
+    (las de los tests) no se agrupan: Django nunca las cierra.
+
+    Con `CONN_HEALTH_CHECKS` activo cada conexión reutilizada se verifica antes de usarse.
+    `reused_connection` indica si la conexión actual salió del pool ya configurada, para
+    que los receptores de `connection_created` (ver `app.sqlite.configure_connection`) no
+    repitan los PRAGMA en cada request.
+    """
+
+    reused_connection = False
+
+    def get_new_connection(self, conn_params):
+        """Toma una conexión del pool del archivo de la base, o abre una nueva."""
+        self.reused_connection = False
+        if self.is_in_memory_db():
+            return super().get_new_connection(conn_params)
+
+        def connect():
+            self.reused_connection = False
+            return super(DatabaseWrapper, self).get_new_connection(conn_params)
+
+        self.reused_connection = True
+        return get_pool(self.settings_dict["NAME"]).acquire(
+            connect, health_check=self.settings_dict["CONN_HEALTH_CHECKS"],
+        )
+
+    def _close(self):
+        """Devuelve la conexión al pool en lugar de cerrarla."""
+        if self.connection is None or self.is_in_memory_db():
+            return super()._close()
+
+        pool = get_pool(self.settings_dict["NAME"])
+        if self.in_atomic_block:
+            # Django conserva la conexión hasta salir del bloque; no se puede compartir.
+            pool.discard(self.connection)
+        else:
+            pool.release(self.connection)
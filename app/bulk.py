@@ -0,0 +1,177 @@
+from itertools import islice
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from .unit_of_work import written
+from .validation import validate_rows
+
+
+def existing_values(model, field, values):
+    """
+    Retorna cuáles de los valores ya están guardados en un campo del modelo.
+
+    Los valores se consultan con un `WHERE field IN (...)` por cada tanda que respeta el
+    límite de parámetros por consulta de la base.
+
+    Args:
+        model (type): El modelo a consultar.
+        field (str): El nombre del campo.
+        values (list): Los valores a buscar.
+
+    Returns:
+        set: Los valores que ya existen.
+    """
+    size = connection.features.max_query_params or len(values) or 1
+    found = set()
+    for start in range(0, len(values), size):
+        found.update(
+            model.objects.filter(**{f"{field}__in": values[start:start + size]})
+            .values_list(field, flat=True),
+        )
+    return found
+
+
+def bulk_save(model, rows, validate, build, batch_size=None, unique_fields=None, unique_errors=None):
+    """
+    Valida e inserta muchas filas de un modelo con `bulk_create`.
+
+    Las filas se recorren una sola vez (puede ser un generador) y se insertan en lotes de
+    `batch_size`, por lo que solo un lote está en memoria a la vez. Todos los lotes se
+    insertan dentro de una única transacción: si la base falla a mitad de la carga no
+    queda ninguna fila guardada. Cada lote se valida por columnas (`validate_rows`), con
+    el mismo resultado que validar fila por fila. Las filas que no pasan la validación se
+    omiten y sus errores se informan por posición.
+
+    Sin `unique_fields`, las filas que repiten un campo de `unique_errors` (dentro de la
+    carga o respecto de un registro ya guardado) también se rechazan con el mensaje de
+    ese campo, en lugar de hacer fallar toda la carga con un `IntegrityError`. Los
+    valores existentes se consultan una vez por lote.
+
+    Con `unique_fields` la carga es un upsert (`INSERT ... ON CONFLICT DO UPDATE`): las
+    filas cuya clave ya existe actualizan el registro existente en lugar de duplicarlo.
+
+    Args:
+        model (type): El modelo a poblar.
+        rows (iterable): Diccionarios con los datos de cada fila, como en `save_*`.
+        validate (callable): La función `validate_*` del modelo.
+        build (callable): Arma la instancia (sin guardar) a partir de una fila válida.
+        batch_size (int): Filas por lote; por defecto `BULK_BATCH_SIZE`.
+        unique_fields (tuple): Campos de la clave natural (con restricción única) para
+            hacer upsert.
+        unique_errors (dict): Mensaje de error por cada campo con restricción única, para
+            rechazar las filas repetidas cuando la carga no es un upsert.
+
+    Returns:
+        tuple: La cantidad de filas insertadas (o actualizadas) y un diccionario con los
+            errores de validación de cada fila rechazada, indexado por su posición en `rows`.
+    """
+    batch_size = batch_size or settings.BULK_BATCH_SIZE
+    options = {}
+    if unique_fields:
+        options = {
+            "update_conflicts": True,
+            "unique_fields": unique_fields,
+            "update_fields": [
+                field.name for field in model._meta.concrete_fields
+                if not field.primary_key and field.name not in unique_fields
+            ],
+        }
+
+    def insert(batch):
+        """Inserta un lote y retorna la cantidad de filas escritas."""
+        if unique_fields:
+            # Una clave repetida dentro del mismo lote se escribe una sola vez (gana la
+            # última fila), igual que si las filas se hubieran guardado de a una.
+            batch = list({
+                tuple(getattr(instance, field) for field in unique_fields): instance
+                for instance in batch
+            }.values())
+        model.objects.bulk_create(batch, **options)
+        return len(batch)
+
+    # Sin upsert, los valores únicos ya vistos en la carga (para rechazar repetidos)
+    unique_errors = {} if unique_fields else unique_errors or {}
+    seen = {field: set() for field in unique_errors}
+
+    created = 0
+    errors = {}
+    batch = []
+
+    rows = iter(rows)
+    start = 0
+
+    with transaction.atomic():
+        while chunk := list(islice(rows, batch_size)):
+            valid = []
+            for index, (data, row_errors) in enumerate(
+                zip(chunk, validate_rows(validate, chunk)), start,
+            ):
+                if row_errors:
+                    errors[index] = row_errors
+                else:
+                    valid.append((index, build(data)))
+
+            existing = {
+                field: existing_values(
+                    model, field, [getattr(instance, field) for _, instance in valid],
+                )
+                for field in unique_errors
+            }
+            for index, instance in valid:
+                repeated = {
+                    field: message for field, message in unique_errors.items()
+                    if getattr(instance, field) in existing[field]
+                    or getattr(instance, field) in seen[field]
+                }
+                if repeated:
+                    errors[index] = repeated
+                    continue
+                for field in unique_errors:
+                    seen[field].add(getattr(instance, field))
+
+                batch.append(instance)
+                if len(batch) == batch_size:
+                    created += insert(batch)
+                    batch = []
+            start += len(chunk)
+
+        if batch:
+            created += insert(batch)
+
+    if created:
+        written(model, created)
+
+    return created, errors
+
+
+def bulk_delete(model, ids, batch_size=None):
+    """
+    Elimina muchas filas de un modelo por id, con un `DELETE ... WHERE id IN (...)` por lote.
+
+    Los modelos no tienen relaciones ni señales de eliminación, así que Django borra cada
+    lote con una única consulta, sin cargar las instancias. Los lotes respetan el límite
+    de parámetros por consulta de la base (999 en SQLite) y se eliminan todos dentro de
+    una misma transacción.
+
+    Args:
+        model (type): El modelo del que se eliminan filas.
+        ids (iterable): Los ids a eliminar; los que no existen se ignoran.
+        batch_size (int): Ids por consulta; por defecto el máximo que admite la base.
+
+    Returns:
+        int: La cantidad de filas eliminadas.
+    """
+    ids = list(dict.fromkeys(ids))
+    batch_size = batch_size or connection.features.max_query_params or len(ids) or 1
+    deleted = 0
+
+    with transaction.atomic():
+        for start in range(0, len(ids), batch_size):
+            count, _ = model.objects.filter(pk__in=ids[start:start + batch_size]).delete()
+            deleted += count
+
+    if deleted:
+        written(model, deleted)
+
+    return deleted
@@ -0,0 +1,59 @@
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+
+def changed_fields(instance, values):
+    """
+    Asigna valores a una instancia y retorna los campos cuyo valor cambió.
+
+    Los valores se comparan ya convertidos al tipo del campo (`field.to_python`), así
+    "5" y 5 o "2020-01-01" y la fecha correspondiente se consideran iguales. Si un
+    valor no se puede convertir se considera cambiado y el error lo informa la base al
+    guardar, como hasta ahora.
+
+    Args:
+        instance (Model): La instancia cargada de la base.
+        values (dict): Los valores nuevos por nombre de campo.
+
+    Returns:
+        list: Los nombres de los campos que cambiaron, en el orden de `values`.
+    """
+    changed = []
+    for name, value in values.items():
+        field = instance._meta.get_field(name)
+        current = getattr(instance, field.attname)
+        try:
+            same = field.to_python(current) == field.to_python(value)
+        except ValidationError:
+            same = False
+
+        if not same:
+            setattr(instance, field.attname, value)
+            changed.append(field.attname)
+    return changed
+
+
+def save_changes(instance, values):
+    """
+    Guarda solo los campos que cambiaron, o no escribe nada si no cambió ninguno.
+
+    La actualización usa `save(update_fields=...)` con los campos modificados más
+    `updated_at` (que con `auto_now` solo se actualiza si se incluye), en lugar de
+    reescribir la fila completa. Se ejecuta en su propia transacción (o savepoint), así
+    quien llama puede capturar un `IntegrityError` (por ejemplo un email repetido) y
+    seguir usando la conexión.
+
+    Args:
+        instance (Model): La instancia cargada de la base.
+        values (dict): Los valores nuevos por nombre de campo.
+
+    Returns:
+        bool: Si se escribió algún cambio en la base.
+    """
+    changed = changed_fields(instance, values)
+    if not changed:
+        return False
+
+    with transaction.atomic():
+        instance.save(update_fields=[*changed, "updated_at"])
+    return True
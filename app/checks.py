@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+# Backends de cache cuyo contenido es propio de cada proceso.
+PER_PROCESS_CACHES = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+def per_process_cache():
+    """
+    Indica si el cache por defecto es propio de cada proceso.
+
+    Returns:
+        bool: True si cada worker tiene su propio cache (por ejemplo LocMemCache).
+    """
+    return settings.CACHES["default"]["BACKEND"] in PER_PROCESS_CACHES
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Advierte (con `manage.py check --deploy`) si las versiones de los modelos viven en un
+    cache por proceso.
+
+    Las respuestas condicionales de los listados (ETag / Last-Modified, ver app/versions.py)
+    y el cache de páginas dependen de la versión de cada modelo. Con varios workers y un
+    cache por proceso, una escritura en un worker no cambia la versión de los demás, que
+    siguen respondiendo 304 a los ETag anteriores y muestran listados desactualizados.
+    """
+    if not per_process_cache():
+        return []
+    return [
+        Warning(
+            "El cache por defecto es LocMemCache: cada worker tiene sus propias versiones "
+            "de los modelos y puede responder 304 con listados desactualizados.",
+            hint="Con más de un proceso configure CACHE_BACKEND con un backend compartido "
+            "(FileBasedCache, Redis o Memcached).",
+            id="app.W001",
+        ),
+    ]
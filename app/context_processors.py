@@ -1,46 +1,96 @@
+from functools import partial
+from typing import NamedTuple
+
 from django.urls import reverse
 
-links = [
-    {"label": "Home", "href": reverse("home"), "icon": "bi bi-house-door"},
-    {"label": "Clientes", "href": reverse("clients_repo"), "icon": "bi bi-people"},
-    {"label": "Proveedores", "href": reverse("providers_repo"), "icon": "bi bi-people"},
-    {"label": "Productos", "href": reverse("products_repo"), "icon": "bi bi-basket3"},
-    {"label": "Medicinas", "href": reverse("medicine_repo"), "icon": "bi bi-capsule"},
-    {"label": "Mascotas", "href": reverse("pets_repo"), "icon": "bi bi-github"},
-    {"label": "Veterinarios", "href": reverse("vets_repo"), "icon": "bi bi-people"},
-]
 
+class Link(NamedTuple):
+    """
+    An immutable navbar link.
 
-def navbar(request):
+    :param label: Text shown in the navbar.
+    :param href: URL the link points to.
+    :param icon: Bootstrap icon classes.
+    :param active: Whether the link belongs to the section being browsed.
     """
-    Generate a dictionary with links and their active status based on the request path.
 
-    This function takes a Django HttpRequest object and generates a dictionary
-    where each link in `links` is checked against the request path to determine
-    if it should be marked as active. The active status is added to the link's
-    dictionary.
+    label: str
+    href: str
+    icon: str
+    active: bool = False
 
-    :param request: The HttpRequest object containing metadata about the request.
-    :return: A dictionary containing the links with their active status.
+
+links = (
+    Link("Home", reverse("home"), "bi bi-house-door"),
+    Link("Clientes", reverse("clients_repo"), "bi bi-people"),
+    Link("Proveedores", reverse("providers_repo"), "bi bi-people"),
+    Link("Productos", reverse("products_repo"), "bi bi-basket3"),
+    Link("Medicinas", reverse("medicine_repo"), "bi bi-capsule"),
+    Link("Mascotas", reverse("pets_repo"), "bi bi-github"),
+    Link("Veterinarios", reverse("vets_repo"), "bi bi-people"),
+    Link("Buscar", reverse("fulltext_repo"), "bi bi-search"),
+    Link("Importaciones", reverse("imports_repo"), "bi bi-upload"),
+)
+
+
+def section(path):
+    """
+    Return the top-level section of a path, e.g. "/clientes/" for "/clientes/editar/1/".
+
+    Every navbar href other than home is a top-level section, so a link is active
+    exactly when its href is the section of the request path (the same result as
+    checking ``path.startswith(href)`` against each link).
+
+    :param path: The request path.
+    :return: The section prefix, "/" for the home page, or None if the path has no section.
+    """
+    if path == "/":
+        return "/"
+
+    end = path.find("/", 1)
+    if end == -1:
+        return None
+    return path[: end + 1]
+
+
+def _build_navbars():
+    """
+    Precompute the immutable tuple of links for every section of the navbar.
+
+    :return: A dict mapping each section to its links, plus the key None for pages
+        outside every section (no link active).
     """
-    def add_active(link):
-        """
-        Add an 'active' key to the link dictionary based on the request path.
+    navbars = {None: links}
+    for current in links:
+        navbars[current.href] = tuple(
+            link._replace(active=link.href == current.href) for link in links
+        )
+    return navbars
+
 
-        This helper function creates a copy of the link dictionary and determines
-        if the link should be marked as active based on whether the request path
-        matches or starts with the link's href.
+navbars = _build_navbars()
 
-        :param link: A dictionary representing a link with at least an 'href' key.
-        :return: A copy of the link dictionary with an added 'active' key.
-        """
-        copy = link.copy()
 
-        if copy["href"] == "/":
-            copy["active"] = request.path == "/"
-        else:
-            copy["active"] = request.path.startswith(copy.get("href", ""))
+def links_for(path):
+    """
+    Return the precomputed navbar links for a request path.
+
+    :param path: The request path.
+    :return: A tuple of ``Link`` with the section of ``path`` marked as active.
+    """
+    return navbars.get(section(path), links)
 
-        return copy
 
-    return {"links": map(add_active, links)}
\ No newline at end of file
+def navbar(request):
+    """
+    Expose the navbar links to the templates.
+
+    The links are passed as a callable, which the template engine only calls when a
+    template actually uses ``links``; renders that never include the navbar pay nothing
+    beyond building this dict. When it is called, the result is a dict lookup into the
+    tuples precomputed at import time.
+
+    :param request: The HttpRequest object containing metadata about the request.
+    :return: A dictionary containing the lazily evaluated links.
+    """
+    return {"links": partial(links_for, request.path)}
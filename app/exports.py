@@ -0,0 +1,101 @@
+import csv
+import io
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, StreamingHttpResponse
+
+from .imports import batches
+
+# Formatos de exportación: tipo de contenido de la respuesta.
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "jsonl": "application/jsonl; charset=utf-8",
+}
+
+
+def export_fields(model):
+    """
+    Retorna las columnas que se exportan de un modelo: todas sus columnas concretas.
+
+    Args:
+        model (type): La clase del modelo.
+
+    Returns:
+        list: Los nombres de las columnas, en el orden en que se declararon.
+    """
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def csv_chunks(fields, rows):
+    """
+    Genera el CSV de las filas en bloques de texto.
+
+    Args:
+        fields (list): Nombres de las columnas, para la fila de encabezado.
+        rows (iterable): Bloques (listas) de tuplas con los valores de cada fila.
+
+    Yields:
+        str: El encabezado y luego el texto CSV de cada bloque.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(fields)
+    for chunk in rows:
+        writer.writerows(chunk)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    yield buffer.getvalue()
+
+
+def jsonl_chunks(fields, rows):
+    """
+    Genera las filas como JSON Lines (un objeto JSON por línea) en bloques de texto.
+
+    Args:
+        fields (list): Nombres de las columnas, usados como claves de cada objeto.
+        rows (iterable): Bloques (listas) de tuplas con los valores de cada fila.
+
+    Yields:
+        str: El texto JSON Lines de cada bloque.
+    """
+    encode = DjangoJSONEncoder(ensure_ascii=False).encode
+    for chunk in rows:
+        yield "".join(encode(dict(zip(fields, row))) + "\n" for row in chunk)
+
+
+def export_repository(queryset, name, export_format):
+    """
+    Exporta todas las filas de un queryset como CSV o JSON Lines en streaming.
+
+    Las filas se leen con `values_list().iterator()` y se envían en bloques de
+    `REPOSITORY_STREAM_CHUNK_SIZE`, así la memoria del worker no depende de la cantidad
+    de filas y la descarga empieza antes de terminar de leer la tabla.
+
+    Args:
+        queryset (QuerySet): Las filas a exportar, ya filtradas y ordenadas.
+        name (str): Nombre del archivo descargado, sin extensión (por ejemplo "clientes").
+        export_format (str): "csv" o "jsonl".
+
+    Returns:
+        StreamingHttpResponse: La descarga del archivo.
+
+    Raises:
+        Http404: Si el formato no es uno de `EXPORT_FORMATS`.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise Http404(f"Formato de exportación desconocido: {export_format}")
+
+    chunk_size = settings.REPOSITORY_STREAM_CHUNK_SIZE
+    fields = export_fields(queryset.model)
+    rows = batches(queryset.values_list(*fields).iterator(chunk_size=chunk_size), chunk_size)
+    chunks = csv_chunks if export_format == "csv" else jsonl_chunks
+
+    response = StreamingHttpResponse(
+        chunks(fields, rows), content_type=EXPORT_FORMATS[export_format],
+    )
+    response["Content-Disposition"] = f'attachment; filename="{name}.{export_format}"'
+    return response
@@ -0,0 +1,214 @@
+import re
+
+from django.db import connections, router
+from django.db.models import Q
+
+# Tokenizador de las tablas FTS5: palabras Unicode, sin distinguir mayúsculas ni acentos
+# ("perez" encuentra "Pérez"). Los índices de prefijo de 2 y 3 letras aceleran las
+# búsquedas de palabras incompletas ("ibu*").
+TOKENIZE = "unicode61 remove_diacritics 2"
+PREFIX = "2 3"
+
+# Palabras del término de búsqueda.
+WORD_RE = re.compile(r"\w+")
+
+
+def fulltext_table(table):
+    """
+    Retorna el nombre de la tabla FTS5 de una tabla.
+
+    Args:
+        table (str): La tabla del modelo, por ejemplo "app_client".
+
+    Returns:
+        str: La tabla FTS5, por ejemplo "app_client_fts".
+    """
+    return f"{table}_fts"
+
+
+def create_statements(table, fields):
+    """
+    Arma el SQL que crea la tabla FTS5 de una tabla y los triggers que la mantienen al día.
+
+    La tabla FTS5 es de contenido externo (`content=`): guarda solo el índice de palabras,
+    no una copia de las columnas. Los triggers la actualizan en cada INSERT, DELETE y
+    UPDATE de las columnas indexadas, incluidos los de `bulk_create`, `QuerySet.update()`
+    y `bulk_delete`, que no pasan por `save()`.
+
+    Args:
+        table (str): La tabla del modelo.
+        fields (tuple): Las columnas indexadas.
+
+    Returns:
+        list: Las sentencias, en orden, incluida la carga inicial del índice.
+    """
+    fts = fulltext_table(table)
+    columns = ", ".join(fields)
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({columns}, content='{table}', "
+        f"content_rowid='id', tokenize='{TOKENIZE}', prefix='{PREFIX}')",
+        *trigger_statements(table, fields).values(),
+        rebuild_statement(table),
+    ]
+
+
+def trigger_statements(table, fields):
+    """
+    Arma el SQL de los triggers que mantienen al día la tabla FTS5 de una tabla.
+
+    Args:
+        table (str): La tabla del modelo.
+        fields (tuple): Las columnas indexadas.
+
+    Returns:
+        dict: La sentencia `CREATE TRIGGER` de cada trigger, por nombre.
+    """
+    fts = fulltext_table(table)
+    columns = ", ".join(fields)
+    new = ", ".join(f"new.{field}" for field in fields)
+    old = ", ".join(f"old.{field}" for field in fields)
+    delete = f"INSERT INTO {fts} ({fts}, rowid, {columns}) VALUES ('delete', old.id, {old});"
+    insert = f"INSERT INTO {fts} (rowid, {columns}) VALUES (new.id, {new});"
+    return {
+        f"{fts}_insert": f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN {insert} END",
+        f"{fts}_delete": f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN {delete} END",
+        f"{fts}_update": f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {columns} ON {table} "
+        f"BEGIN {delete} {insert} END",
+    }
+
+
+def restore_triggers(sender, using, **kwargs):
+    """
+    Vuelve a crear los triggers FTS5 que falten después de migrar (señal `post_migrate`).
+
+    Para alterar una columna, el schema editor de SQLite copia la tabla a una nueva y
+    elimina la anterior, y con ella sus triggers: la tabla FTS5 dejaría de actualizarse
+    sin ningún error. Si a una tabla con búsqueda por palabras le falta algún trigger, se
+    crea de nuevo y se reconstruye su índice, por si cambiaron filas mientras faltaba.
+
+    Args:
+        sender (AppConfig): La aplicación migrada.
+        using (str): El alias de la base migrada.
+    """
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT type, name FROM sqlite_master WHERE type IN ('table', 'trigger')")
+        existing = set(cursor.fetchall())
+        for model in sender.get_models():
+            fields = getattr(model, "fulltext_fields", None)
+            table = model._meta.db_table
+            if not fields or ("table", fulltext_table(table)) not in existing:
+                continue
+
+            missing = [
+                statement for name, statement in trigger_statements(table, fields).items()
+                if ("trigger", name) not in existing
+            ]
+            for statement in missing:
+                cursor.execute(statement)
+            if missing:
+                cursor.execute(rebuild_statement(table))
+
+
+def drop_statements(table):
+    """
+    Arma el SQL que elimina la tabla FTS5 de una tabla y sus triggers.
+
+    Args:
+        table (str): La tabla del modelo.
+
+    Returns:
+        list: Las sentencias, en orden.
+    """
+    fts = fulltext_table(table)
+    return [
+        *(f"DROP TRIGGER IF EXISTS {fts}_{event}" for event in ("insert", "delete", "update")),
+        f"DROP TABLE IF EXISTS {fts}",
+    ]
+
+
+def rebuild_statement(table):
+    """
+    Arma el SQL que reconstruye el índice FTS5 de una tabla a partir de sus filas.
+
+    Args:
+        table (str): La tabla del modelo.
+
+    Returns:
+        str: La sentencia.
+    """
+    fts = fulltext_table(table)
+    return f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')"
+
+
+def match_expression(term):
+    """
+    Convierte el texto ingresado en una consulta FTS5.
+
+    Cada palabra se busca como prefijo (`"pere"*` encuentra "Perez") y todas deben
+    aparecer, en cualquier orden y en cualquiera de las columnas indexadas. Las palabras
+    van entre comillas, así los operadores de FTS5 (AND, OR, NEAR, `-`, `:`) que escriba
+    el usuario se buscan como texto.
+
+    Args:
+        term (str): El texto ingresado en `?q=`.
+
+    Returns:
+        str: La consulta para `MATCH`, o "" si el texto no tiene palabras.
+    """
+    return " ".join(f'"{word}"*' for word in WORD_RE.findall(term.lower()))
+
+
+def fulltext_search(model, term, limit):
+    """
+    Busca por palabras en los `fulltext_fields` de un modelo, de la más a la menos relevante.
+
+    En SQLite la búsqueda usa la tabla FTS5 del modelo, ordenada por `rank` (bm25: las palabras
+    poco frecuentes y los textos cortos pesan más). En otros motores, que no tienen esas
+    tablas, se filtra con `icontains` por cada palabra y se ordena por id.
+
+    Args:
+        model (type): El modelo (Client, Pet o Medicine).
+        term (str): El texto ingresado.
+        limit (int): Cantidad máxima de resultados.
+
+    Returns:
+        list: Los registros encontrados, cada uno con el atributo `rank` (menor es más
+            relevante; None fuera de SQLite).
+    """
+    expression = match_expression(term)
+    if not expression:
+        return []
+
+    alias = router.db_for_read(model)
+    connection = connections[alias]
+    if connection.vendor != "sqlite":
+        condition = Q()
+        for word in WORD_RE.findall(term):
+            matches = Q()
+            for field in model.fulltext_fields:
+                matches |= Q(**{f"{field}__icontains": word})
+            condition &= matches
+        results = list(model.objects.using(alias).filter(condition).order_by("id")[:limit])
+        for result in results:
+            result.rank = None
+        return results
+
+    fts = fulltext_table(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, rank FROM {fts} WHERE {fts} MATCH %s ORDER BY rank LIMIT %s",
+            [expression, limit],
+        )
+        ranks = dict(cursor.fetchall())
+
+    records = model.objects.using(alias).in_bulk(ranks)
+    results = []
+    for pk, rank in ranks.items():
+        if pk in records:
+            records[pk].rank = rank
+            results.append(records[pk])
+    return results
@@ -0,0 +1,186 @@
+import csv
+import time
+from itertools import islice
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import DataError, IntegrityError, transaction
+
+from .models import Client, Medicine, Pet, Product, Provider, Vet
+
+# Modelos que se pueden importar, por el nombre que se usa en la línea de comandos.
+IMPORTERS = {
+    "clients": Client.save_client_bulk,
+    "providers": Provider.save_provider_bulk,
+    "medicines": Medicine.save_medicine_bulk,
+    "products": Product.save_product_bulk,
+    "pets": Pet.save_pet_bulk,
+    "vets": Vet.save_vet_bulk,
+}
+
+# Modelos con clave natural (email único) que se pueden sincronizar con upsert: las filas
+# que ya existen se actualizan en lugar de rechazarse por duplicadas.
+UPSERTERS = {
+    "clients": Client.upsert_client_bulk,
+    "providers": Provider.upsert_provider_bulk,
+    "vets": Vet.upsert_vet_bulk,
+}
+
+# Columna que se agrega al archivo de filas rechazadas con los mensajes de error.
+ERRORS_COLUMN = "errors"
+
+# Errores de la base al insertar un lote que se deben a los datos de alguna fila (por
+# ejemplo una fecha inexistente) y no a la base en sí.
+ROW_ERRORS = (ValidationError, ValueError, TypeError, IntegrityError, DataError)
+
+
+class ImportResult(NamedTuple):
+    """
+    Resultado (parcial o final) de una importación.
+
+    Args:
+        imported (int): Filas guardadas.
+        rejected (int): Filas rechazadas.
+        seconds (float): Tiempo transcurrido desde el comienzo de la importación.
+        rows (int): Filas leídas del CSV. Puede ser mayor que la suma de importadas y
+            rechazadas: en un upsert las filas repetidas de un lote se guardan una vez.
+    """
+
+    imported: int
+    rejected: int
+    seconds: float
+    rows: int
+
+    @property
+    def rows_per_second(self):
+        """
+        Filas procesadas por segundo.
+        """
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def batches(rows, size):
+    """
+    Agrupa un iterable en listas de `size` elementos, leyendo solo un lote a la vez.
+
+    Args:
+        rows (iterable): Los elementos a agrupar.
+        size (int): Tamaño de cada lote.
+
+    Yields:
+        list: El siguiente lote.
+    """
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def format_errors(errors):
+    """
+    Convierte los errores de validación de una fila en un texto para el archivo de rechazos.
+
+    Args:
+        errors (dict): Los errores por campo retornados por `validate_*`.
+
+    Returns:
+        str: Los errores con el formato "campo: mensaje; campo: mensaje".
+    """
+    return "; ".join(f"{field}: {message}" for field, message in errors.items())
+
+
+def save_batch(save_bulk, batch):
+    """
+    Guarda un lote de filas y, si la base rechaza el lote, lo reintenta fila por fila.
+
+    Los validadores no detectan todo lo que la base puede rechazar (por ejemplo
+    "2020-02-30" como fecha). En ese caso el lote completo se revierte y se guarda cada
+    fila por separado para rechazar solo las que fallan.
+
+    Args:
+        save_bulk (callable): El `save_*_bulk` del modelo.
+        batch (list): Las filas del lote.
+
+    Returns:
+        tuple: Las filas guardadas y los errores de cada fila rechazada, por posición.
+    """
+    try:
+        return save_bulk(batch, len(batch))
+    except ROW_ERRORS:
+        pass
+
+    imported = 0
+    errors = {}
+    for index, row in enumerate(batch):
+        try:
+            created, row_errors = save_bulk([row], 1)
+        except ROW_ERRORS as e:
+            errors[index] = {"__all__": "; ".join(getattr(e, "messages", [str(e)]))}
+            continue
+
+        imported += created
+        if row_errors:
+            errors[index] = row_errors[0]
+    return imported, errors
+
+
+def import_csv(
+    model, source, rejected, batch_size=None, on_batch=None, upsert=False, skip=0, header=True,
+):
+    """
+    Importa un CSV a un modelo leyendo y guardando de a un lote por vez.
+
+    El archivo se recorre como stream: en memoria solo está el lote actual, por lo que el
+    tamaño del archivo no afecta el consumo de memoria. Cada lote se valida con la función
+    `validate_*` del modelo y se guarda en su propia transacción, así una importación
+    larga no retiene la base bloqueada ni tiene que rehacerse completa si se interrumpe.
+    Las filas rechazadas se escriben en `rejected` con sus columnas originales más la
+    columna `errors`, listas para corregirse y volver a importarse.
+
+    Para continuar una importación interrumpida se pasan en `skip` las filas de los lotes
+    ya confirmados (`ImportResult.rows`) y `header=False` si el archivo de rechazadas ya
+    tiene el encabezado.
+
+    Args:
+        model (str): Nombre del modelo en `IMPORTERS` (por ejemplo "clients").
+        source (file): El CSV a importar, abierto en modo texto; la primera fila son los
+            nombres de los campos.
+        rejected (file): Archivo de texto donde se escriben las filas rechazadas.
+        batch_size (int): Filas por lote; por defecto `BULK_BATCH_SIZE`.
+        on_batch (callable): Se invoca con el `ImportResult` acumulado después de cada lote,
+            dentro de la transacción del lote: lo que escriba en la base se confirma junto
+            con el lote.
+        upsert (bool): Si las filas cuyo email ya existe actualizan el registro existente
+            (solo para los modelos de `UPSERTERS`).
+        skip (int): Filas del comienzo del CSV que se saltean.
+        header (bool): Si se escribe el encabezado del archivo de rechazadas.
+
+    Returns:
+        ImportResult: Las filas importadas y rechazadas y el tiempo total (sin contar las
+            filas salteadas).
+    """
+    save_bulk = UPSERTERS[model] if upsert else IMPORTERS[model]
+    batch_size = batch_size or settings.BULK_BATCH_SIZE
+    start = time.perf_counter()
+
+    reader = csv.DictReader(source, restval="")
+    writer = csv.DictWriter(
+        rejected, fieldnames=[*(reader.fieldnames or []), ERRORS_COLUMN], extrasaction="ignore",
+    )
+    if header:
+        writer.writeheader()
+
+    imported = rejected_rows = rows = 0
+    for batch in batches(islice(reader, skip, None), batch_size):
+        with transaction.atomic():
+            created, errors = save_batch(save_bulk, batch)
+            imported += created
+            rejected_rows += len(errors)
+            rows += len(batch)
+            for index, row_errors in errors.items():
+                writer.writerow({**batch[index], ERRORS_COLUMN: format_errors(row_errors)})
+
+            if on_batch:
+                on_batch(ImportResult(imported, rejected_rows, time.perf_counter() - start, rows))
+
+    return ImportResult(imported, rejected_rows, time.perf_counter() - start, rows)
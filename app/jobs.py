@@ -0,0 +1,228 @@
+import csv
+import datetime
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .imports import import_csv
+from .models import ImportJob, ImportStatus
+
+# Pool de hilos del proceso que ejecuta las importaciones; se crea con el primer trabajo.
+_executor = None
+_executor_lock = threading.Lock()
+
+# Instante (`time.monotonic`) en que este proceso buscó por última vez importaciones para
+# retomar, o None si todavía no lo hizo.
+_last_resume = None
+
+
+def spool_upload(upload, model, upsert=False):
+    """
+    Guarda un CSV subido en `IMPORT_JOBS_DIR` y crea su importación pendiente.
+
+    El archivo se copia de a bloques (`upload.chunks()`), sin cargarlo completo en
+    memoria, así la request termina apenas se recibe el archivo.
+
+    Args:
+        upload (UploadedFile): El archivo subido.
+        model (str): Nombre del modelo en `IMPORTERS`.
+        upsert (bool): Si las filas cuyo email ya existe actualizan el registro existente.
+
+    Returns:
+        ImportJob: La importación creada.
+    """
+    directory = Path(settings.IMPORT_JOBS_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = uuid.uuid4().hex
+    source = directory / f"{name}.csv"
+
+    with source.open("wb") as destination:
+        for chunk in upload.chunks():
+            destination.write(chunk)
+
+    return ImportJob.objects.create(
+        model=model,
+        upsert=upsert,
+        source=str(source),
+        rejected_path=str(directory / f"{name}.rejected.csv"),
+    )
+
+
+def resumable():
+    """
+    Condición de las importaciones que se pueden ejecutar: pendientes o interrumpidas.
+
+    Returns:
+        Q: El filtro sobre `ImportJob`.
+    """
+    stale = timezone.now() - datetime.timedelta(seconds=settings.IMPORT_JOB_STALE_SECONDS)
+    return Q(status=ImportStatus.pending.name) | Q(
+        status=ImportStatus.running.name, updated_at__lt=stale,
+    )
+
+
+def claim_job(job_id):
+    """
+    Marca una importación como en curso si está pendiente o si quedó interrumpida.
+
+    La actualización es una sola consulta condicional, así si varios procesos intentan
+    retomar la misma importación solo uno la obtiene.
+
+    Args:
+        job_id (int): El id de la importación.
+
+    Returns:
+        bool: Si este proceso obtuvo la importación.
+    """
+    claimed = ImportJob.objects.filter(resumable(), pk=job_id).update(
+        status=ImportStatus.running.name, updated_at=timezone.now(),
+    )
+    return claimed == 1
+
+
+def open_rejected(job):
+    """
+    Abre el CSV de filas rechazadas de una importación para continuar escribiéndolo.
+
+    Se descarta lo escrito después del último lote confirmado, que se vuelve a procesar.
+
+    Args:
+        job (ImportJob): La importación.
+
+    Returns:
+        file: El archivo abierto en modo texto, posicionado al final de lo confirmado.
+    """
+    path = Path(job.rejected_path)
+    path.touch()
+    rejected = path.open("r+", newline="", encoding="utf-8")
+    rejected.truncate(job.rejected_offset)
+    rejected.seek(job.rejected_offset)
+    return rejected
+
+
+def run_job(job_id):
+    """
+    Ejecuta una importación desde el último lote confirmado hasta el final del CSV.
+
+    Con cada lote se guarda el avance (filas procesadas, importadas y rechazadas, tiempo y
+    largo del archivo de rechazadas) en la misma transacción que el lote, así lo guardado
+    y el avance nunca quedan desfasados. Si la importación falla queda con estado
+    "failed" y el error.
+
+    Args:
+        job_id (int): El id de la importación.
+
+    Returns:
+        bool: Si la importación se ejecutó (False si otro proceso la está ejecutando).
+    """
+    if not claim_job(job_id):
+        return False
+
+    job = ImportJob.objects.get(pk=job_id)
+    progress = ImportJob.objects.filter(pk=job_id)
+
+    try:
+        with (
+            Path(job.source).open(newline="", encoding="utf-8-sig") as source,
+            open_rejected(job) as rejected,
+        ):
+            def save_progress(result):
+                """Guarda el avance dentro de la transacción del lote."""
+                rejected.flush()
+                progress.update(
+                    rows=job.rows + result.rows,
+                    imported=job.imported + result.imported,
+                    rejected=job.rejected + result.rejected,
+                    rejected_offset=rejected.tell(),
+                    seconds=job.seconds + result.seconds,
+                    updated_at=timezone.now(),
+                )
+
+            import_csv(
+                job.model,
+                source,
+                rejected,
+                on_batch=save_progress,
+                upsert=job.upsert,
+                skip=job.rows,
+                header=job.rejected_offset == 0,
+            )
+    except (DatabaseError, OSError, UnicodeDecodeError, csv.Error) as e:
+        progress.update(
+            status=ImportStatus.failed.name, error=str(e), updated_at=timezone.now(),
+        )
+        return True
+
+    progress.update(status=ImportStatus.done.name, updated_at=timezone.now())
+    return True
+
+
+def run_in_thread(job_id):
+    """
+    Ejecuta una importación en un hilo del pool y cierra la conexión del hilo al terminar.
+
+    Args:
+        job_id (int): El id de la importación.
+    """
+    try:
+        run_job(job_id)
+    finally:
+        connections.close_all()
+
+
+def start_job(job_id):
+    """
+    Encola una importación en el pool de hilos del proceso.
+
+    Con `IMPORT_JOB_WORKERS = 0` la importación se ejecuta en el momento.
+
+    Args:
+        job_id (int): El id de la importación.
+    """
+    global _executor
+    if settings.IMPORT_JOB_WORKERS == 0:
+        run_job(job_id)
+        return
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.IMPORT_JOB_WORKERS, thread_name_prefix="import-job",
+            )
+    _executor.submit(run_in_thread, job_id)
+
+
+def unfinished_jobs():
+    """
+    Retorna las importaciones que se pueden retomar: pendientes o interrumpidas.
+
+    Returns:
+        QuerySet: Las importaciones, de la más antigua a la más nueva.
+    """
+    return ImportJob.objects.filter(resumable()).order_by("id")
+
+
+def resume_jobs():
+    """
+    Encola las importaciones que quedaron sin terminar.
+
+    Se llama desde las vistas de importaciones, así después de reiniciar los workers las
+    importaciones interrumpidas continúan en cuanto alguien abre o consulta una. Cada
+    proceso busca a lo sumo una vez cada `IMPORT_JOB_STALE_SECONDS`, así también retoma
+    las que otro worker deja interrumpidas mientras este sigue vivo.
+    """
+    global _last_resume
+    now = time.monotonic()
+    if _last_resume is not None and now - _last_resume < settings.IMPORT_JOB_STALE_SECONDS:
+        return
+    _last_resume = now
+
+    for job_id in unfinished_jobs().values_list("id", flat=True):
+        start_job(job_id)
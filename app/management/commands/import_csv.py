@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError
+
+from app.imports import IMPORTERS, UPSERTERS, import_csv
+
+
+class Command(BaseCommand):
+    """
+    Comando `python manage.py import_csv <modelo> <archivo>`: importa un CSV en lotes,
+    informa las filas por segundo y escribe las filas rechazadas en otro CSV.
+    """
+
+    help = "Importa un CSV de clientes, proveedores, medicamentos, productos, mascotas o veterinarios."
+
+    def add_arguments(self, parser):
+        """Define el modelo, el archivo y las opciones de la importación."""
+        parser.add_argument("model", choices=sorted(IMPORTERS))
+        parser.add_argument("file", type=Path)
+        parser.add_argument(
+            "--rejected",
+            type=Path,
+            help="CSV donde se escriben las filas rechazadas (por defecto <archivo>.rejected.csv).",
+        )
+        parser.add_argument(
+            "--upsert",
+            action="store_true",
+            help="Actualiza los registros que ya existen con el mismo email en lugar de rechazarlos "
+            f"({', '.join(sorted(UPSERTERS))}).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Filas por lote (por defecto BULK_BATCH_SIZE).",
+        )
+
+    def handle(self, *args, **options):
+        """Ejecuta la importación e informa el resultado."""
+        source_path = options["file"]
+        rejected_path = options["rejected"] or source_path.with_name(
+            f"{source_path.name}.rejected.csv",
+        )
+        if not source_path.is_file():
+            raise CommandError(f"No existe el archivo {source_path}")
+        if options["upsert"] and options["model"] not in UPSERTERS:
+            raise CommandError(f"--upsert no está disponible para {options['model']}")
+
+        def progress(result):
+            """Informa el avance después de cada lote (con --verbosity 2)."""
+            if options["verbosity"] >= 2:
+                self.stdout.write(
+                    f"{result.rows} filas ({result.imported} importadas, "
+                    f"{result.rejected} rechazadas) - {result.rows_per_second:,.0f} filas/s",
+                )
+
+        with (
+            source_path.open(newline="", encoding="utf-8-sig") as source,
+            rejected_path.open("w", newline="", encoding="utf-8") as rejected,
+        ):
+            try:
+                result = import_csv(
+                    options["model"],
+                    source,
+                    rejected,
+                    options["batch_size"],
+                    progress,
+                    upsert=options["upsert"],
+                )
+            except (DatabaseError, UnicodeDecodeError) as e:
+                raise CommandError(
+                    f"La importación se interrumpió: {e}. Los lotes anteriores al error "
+                    "ya quedaron guardados.",
+                ) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.imported} filas importadas y {result.rejected} rechazadas en "
+                f"{result.seconds:.2f} s ({result.rows_per_second:,.0f} filas/s)",
+            ),
+        )
+        if result.rejected:
+            self.stdout.write(f"Filas rechazadas: {rejected_path}")
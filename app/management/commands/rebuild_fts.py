@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from app.fulltext import fulltext_table, rebuild_statement
+from app.models import Client, Medicine, Pet
+
+# Modelos con búsqueda por palabras, por el nombre que se usa en la línea de comandos.
+FULLTEXT_MODELS = {
+    "clients": Client,
+    "pets": Pet,
+    "medicines": Medicine,
+}
+
+
+class Command(BaseCommand):
+    """
+    Comando `python manage.py rebuild_fts [modelo ...]`: reconstruye los índices FTS5 de la
+    búsqueda por palabras a partir de las tablas, por ejemplo después de cargar datos con
+    los triggers desactivados o de restaurar una copia parcial.
+    """
+
+    help = "Reconstruye los índices de búsqueda por palabras (FTS5) de clientes, mascotas y medicamentos."
+
+    def add_arguments(self, parser):
+        """Define los modelos a reconstruir y la opción de optimizar."""
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help=f"Modelos a reconstruir ({', '.join(sorted(FULLTEXT_MODELS))}); por defecto todos.",
+        )
+        parser.add_argument(
+            "--optimize",
+            action="store_true",
+            help="Además une los segmentos del índice en uno solo (más lento, búsquedas más rápidas).",
+        )
+
+    def handle(self, *args, **options):
+        """Reconstruye cada índice e informa cuántas filas indexó."""
+        if connection.vendor != "sqlite":
+            raise CommandError("La búsqueda por palabras con FTS5 solo existe en SQLite")
+        unknown = sorted(set(options["models"]) - set(FULLTEXT_MODELS))
+        if unknown:
+            raise CommandError(f"Modelos sin búsqueda por palabras: {', '.join(unknown)}")
+
+        for name in options["models"] or sorted(FULLTEXT_MODELS):
+            table = FULLTEXT_MODELS[name]._meta.db_table
+            fts = fulltext_table(table)
+            with connection.cursor() as cursor:
+                cursor.execute(rebuild_statement(table))
+                if options["optimize"]:
+                    cursor.execute(f"INSERT INTO {fts} ({fts}) VALUES ('optimize')")
+                cursor.execute(f"SELECT count(*) FROM {table}")
+                rows = cursor.fetchone()[0]
+            self.stdout.write(f"{fts}: {rows} filas indexadas")
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from app.jobs import run_job, unfinished_jobs
+from app.models import ImportJob
+
+
+class Command(BaseCommand):
+    """
+    Comando `python manage.py run_import_jobs`: ejecuta en primer plano las importaciones
+    pendientes o interrumpidas, continuando cada una desde su último lote confirmado.
+    """
+
+    help = "Ejecuta las importaciones pendientes o interrumpidas."
+
+    def handle(self, *args, **options):
+        """Ejecuta cada importación pendiente e informa cómo terminó."""
+        job_ids = list(unfinished_jobs().values_list("id", flat=True))
+        if not job_ids:
+            self.stdout.write("No hay importaciones pendientes.")
+            return
+
+        for job_id in job_ids:
+            if not run_job(job_id):
+                continue
+
+            job = ImportJob.objects.get(pk=job_id)
+            self.stdout.write(
+                f"Importación {job.pk} ({job.model}): {job.get_status_display()}, "
+                f"{job.imported} filas importadas y {job.rejected} rechazadas"
+                + (f" - {job.error}" if job.error else ""),
+            )
@@ -0,0 +1,50 @@
+import time
+from contextlib import closing
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.replicas import connect, data_version, sync_replica
+
+
+class Command(BaseCommand):
+    """
+    Comando `python manage.py sync_replica`: copia la base SQLite primaria sobre la réplica
+    de lectura `REPLICA_DATABASE` con la API de backup de SQLite, una vez o, con
+    `--interval`, cada vez que el primario cambia.
+    """
+
+    help = "Sincroniza la réplica de lectura SQLite con la base primaria."
+
+    def add_arguments(self, parser):
+        """Define el intervalo de sincronización."""
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Segundos entre sincronizaciones; sin este valor se sincroniza una sola vez.",
+        )
+
+    def handle(self, *args, **options):
+        """Sincroniza la réplica e informa cada copia."""
+        alias = settings.REPLICA_DATABASE
+        if not alias:
+            raise CommandError("No hay réplica configurada (REPLICA_DB_NAME)")
+        for name in ("default", alias):
+            if settings.DATABASES[name]["ENGINE"].rsplit(".", 1)[-1] not in ("sqlite3", "sqlite_pool"):
+                raise CommandError(f"La base {name} no es SQLite; use la replicación del motor")
+
+        with closing(connect("default")) as source, closing(connect(alias)) as target:
+            synced = None
+            while True:
+                version = data_version(source)
+                if version != synced:
+                    start = time.perf_counter()
+                    sync_replica(source, target)
+                    synced = version
+                    self.stdout.write(
+                        f"Réplica {settings.DATABASES[alias]['NAME']} sincronizada en "
+                        f"{time.perf_counter() - start:.2f} s",
+                    )
+                if not options["interval"]:
+                    return
+                time.sleep(options["interval"])
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from app.warmup import warm_up
+
+
+class Command(BaseCommand):
+    """
+    Comando `python manage.py warmup`: compila todos los templates y resuelve todas las
+    URLs, informando cuántos se precalentaron y cuánto tardó.
+    """
+
+    help = "Compila los templates y resuelve las URLs para precalentar el proceso."
+
+    def handle(self, *args, **options):
+        """Ejecuta el warm-up e informa el resultado."""
+        result = warm_up()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['templates']} templates compilados y {result['urls']} URLs "
+                f"resueltas en {result['seconds'] * 1000:.1f} ms",
+            ),
+        )
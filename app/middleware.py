@@ -0,0 +1,62 @@
+from django.conf import settings
+
+from .unit_of_work import UnitOfWork
+
+# Métodos HTTP que no modifican datos y no necesitan una unidad de trabajo.
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+
+class UnitOfWorkMiddleware:
+    """
+    Ejecuta cada vista que modifica datos (POST, PUT, PATCH, DELETE) dentro de una unidad de
+    trabajo (ver app/unit_of_work.py), si `UNIT_OF_WORK_REQUESTS` está activo.
+
+    Todas las escrituras de la request se confirman juntas (de a `UNIT_OF_WORK_BATCH_SIZE`)
+    en lugar de una transacción por fila, y si la vista lanza una excepción se revierten.
+    La vista se ejecuta desde `process_view`, así la excepción llega a la unidad antes de
+    convertirse en una respuesta de error; por eso va al final de `MIDDLEWARE`.
+    """
+
+    def __init__(self, get_response):
+        """Guarda el siguiente manejador de la cadena de middlewares."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Continúa la cadena; la unidad de trabajo se abre en `process_view`."""
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Ejecuta la vista dentro de una unidad de trabajo si la request modifica datos."""
+        if request.method in SAFE_METHODS or not settings.UNIT_OF_WORK_REQUESTS:
+            return None
+
+        with UnitOfWork():
+            return view_func(request, *view_args, **view_kwargs)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Después de cada request que modifica datos envía la cookie `REPLICA_STICKY_COOKIE`,
+    que vence a los `REPLICA_STICKY_SECONDS` segundos, si hay una réplica configurada.
+
+    Mientras la cookie exista las vistas de la sesión leen del primario (ver
+    app/replicas.py), así quien acaba de guardar un registro lo ve en el listado aunque la
+    réplica todavía no se haya sincronizado.
+    """
+
+    def __init__(self, get_response):
+        """Guarda el siguiente manejador de la cadena de middlewares."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Agrega la cookie a las respuestas de las requests que modifican datos."""
+        response = self.get_response(request)
+        if settings.REPLICA_DATABASE and request.method not in SAFE_METHODS:
+            response.set_cookie(
+                settings.REPLICA_STICKY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
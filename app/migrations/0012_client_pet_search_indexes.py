@@ -0,0 +1,34 @@
+# Generated by Django 5.0.4 on 2026-10-18 05:33
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_remove_provider_address_provider_city'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='app_client_name_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(django.db.models.functions.text.Lower('email'), name='app_client_email_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='client',
+            index=models.Index(django.db.models.functions.text.Lower('phone'), name='app_client_phone_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='app_pet_name_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(django.db.models.functions.text.Lower('breed'), name='app_pet_breed_lower_idx'),
+        ),
+    ]
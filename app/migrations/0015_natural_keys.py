@@ -0,0 +1,55 @@
+# Generated by Django 5.0.4 on 2026-10-18 06:10
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower, Trim
+
+NATURAL_KEY_MODELS = ("Client", "Provider", "Vet")
+
+
+def normalize_emails(apps, schema_editor):
+    """
+    Normaliza los emails existentes (sin espacios y en minúsculas) antes de exigir que
+    sean únicos, y se detiene con un mensaje claro si hay registros repetidos.
+    """
+    duplicated = []
+    for name in NATURAL_KEY_MODELS:
+        model = apps.get_model("app", name)
+        model.objects.update(email=Lower(Trim("email")))
+        count = (
+            model.objects.values("email")
+            .annotate(rows=Count("id"))
+            .filter(rows__gt=1)
+            .count()
+        )
+        if count:
+            duplicated.append(f"{name}: {count} emails repetidos")
+
+    if duplicated:
+        raise RuntimeError(
+            "No se puede crear la restricción única de email; unificar o eliminar los "
+            "registros repetidos y volver a migrar ({}).".format(", ".join(duplicated)),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0014_sort_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='client',
+            constraint=models.UniqueConstraint(fields=('email',), name='app_client_email_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='provider',
+            constraint=models.UniqueConstraint(fields=('email',), name='app_provider_email_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='vet',
+            constraint=models.UniqueConstraint(fields=('email',), name='app_vet_email_unique'),
+        ),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.0.4 on 2026-10-18 06:30
+
+from django.db import migrations
+
+# SQL congelado al crear la migración: las tablas FTS5 de clientes, mascotas y
+# medicamentos, los triggers que las mantienen al día y la carga inicial del índice. No
+# se arma con app/fulltext.py para que cambiarlo no altere esta migración.
+CREATE_SQL = [
+    "CREATE VIRTUAL TABLE app_client_fts USING fts5(name, email, content='app_client', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    """
+    CREATE TRIGGER app_client_fts_insert AFTER INSERT ON app_client BEGIN
+        INSERT INTO app_client_fts (rowid, name, email) VALUES (new.id, new.name, new.email);
+    END
+    """,
+    """
+    CREATE TRIGGER app_client_fts_delete AFTER DELETE ON app_client BEGIN
+        INSERT INTO app_client_fts (app_client_fts, rowid, name, email) VALUES ('delete', old.id, old.name, old.email);
+    END
+    """,
+    """
+    CREATE TRIGGER app_client_fts_update AFTER UPDATE OF name, email ON app_client BEGIN
+        INSERT INTO app_client_fts (app_client_fts, rowid, name, email) VALUES ('delete', old.id, old.name, old.email);
+        INSERT INTO app_client_fts (rowid, name, email) VALUES (new.id, new.name, new.email);
+    END
+    """,
+    "INSERT INTO app_client_fts (app_client_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE app_pet_fts USING fts5(name, breed, content='app_pet', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    """
+    CREATE TRIGGER app_pet_fts_insert AFTER INSERT ON app_pet BEGIN
+        INSERT INTO app_pet_fts (rowid, name, breed) VALUES (new.id, new.name, new.breed);
+    END
+    """,
+    """
+    CREATE TRIGGER app_pet_fts_delete AFTER DELETE ON app_pet BEGIN
+        INSERT INTO app_pet_fts (app_pet_fts, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed);
+    END
+    """,
+    """
+    CREATE TRIGGER app_pet_fts_update AFTER UPDATE OF name, breed ON app_pet BEGIN
+        INSERT INTO app_pet_fts (app_pet_fts, rowid, name, breed) VALUES ('delete', old.id, old.name, old.breed);
+        INSERT INTO app_pet_fts (rowid, name, breed) VALUES (new.id, new.name, new.breed);
+    END
+    """,
+    "INSERT INTO app_pet_fts (app_pet_fts) VALUES ('rebuild')",
+    "CREATE VIRTUAL TABLE app_medicine_fts USING fts5(name, description, content='app_medicine', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    """
+    CREATE TRIGGER app_medicine_fts_insert AFTER INSERT ON app_medicine BEGIN
+        INSERT INTO app_medicine_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER app_medicine_fts_delete AFTER DELETE ON app_medicine BEGIN
+        INSERT INTO app_medicine_fts (app_medicine_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER app_medicine_fts_update AFTER UPDATE OF name, description ON app_medicine BEGIN
+        INSERT INTO app_medicine_fts (app_medicine_fts, rowid, name, description) VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO app_medicine_fts (rowid, name, description) VALUES (new.id, new.name, new.description);
+    END
+    """,
+    "INSERT INTO app_medicine_fts (app_medicine_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS app_client_fts_insert',
+    'DROP TRIGGER IF EXISTS app_client_fts_delete',
+    'DROP TRIGGER IF EXISTS app_client_fts_update',
+    'DROP TABLE IF EXISTS app_client_fts',
+    'DROP TRIGGER IF EXISTS app_pet_fts_insert',
+    'DROP TRIGGER IF EXISTS app_pet_fts_delete',
+    'DROP TRIGGER IF EXISTS app_pet_fts_update',
+    'DROP TABLE IF EXISTS app_pet_fts',
+    'DROP TRIGGER IF EXISTS app_medicine_fts_insert',
+    'DROP TRIGGER IF EXISTS app_medicine_fts_delete',
+    'DROP TRIGGER IF EXISTS app_medicine_fts_update',
+    'DROP TABLE IF EXISTS app_medicine_fts',
+]
+
+
+def create_fulltext(apps, schema_editor):
+    """
+    Crea las tablas FTS5, sus triggers y el índice inicial. Solo en SQLite: en otros
+    motores la búsqueda por palabras usa `icontains` (ver app/fulltext.py).
+    """
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for statement in CREATE_SQL:
+        schema_editor.execute(statement)
+
+
+def drop_fulltext(apps, schema_editor):
+    """Elimina las tablas FTS5 y sus triggers."""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    for statement in DROP_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0016_import_jobs'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fulltext, drop_fulltext),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.4 on 2026-10-18 06:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0017_fulltext_search'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='importjob',
+            index=models.Index(fields=['status', 'updated_at'], name='app_importjob_status_idx'),
+        ),
+    ]
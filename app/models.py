@@ -1,228 +1,35 @@
-import datetime
-import re
 from enum import Enum
 
 from django.core.exceptions import ValidationError
-from django.db import models
-
-
-def validate_client(data):
-    """
-    Valida los datos de un cliente.
-
-    Args:
-        data (dict): Un diccionario que contiene los datos del cliente.
-
-    Returns:
-        dict: Un diccionario que contiene los errores encontrados durante la validación.
-    """
-    errors = {}
-
-    name = data.get("name", "")
-    phone = data.get("phone", "")
-    email = data.get("email", "")
-    city = data.get("city", "")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    elif not re.match(r"^[A-Za-z\s]+$", name):
-        errors["name"] = "El nombre debe contener solo letras y espacios"
-
-    if phone == "":
-        errors["phone"] = "Por favor ingrese un teléfono"
-    elif not phone.isdigit():
-        errors["phone"] = "El teléfono debe ser un número"
-    elif not phone.startswith("54"):
-        errors["phone"] = "El teléfono debe empezar con el prefijo 54"
-    if email == "":
-        errors["email"] = "Por favor ingrese un email"
-    elif email.count(" ") > 0:
-        errors["email"] = "Por favor ingrese un email sin espacios en blanco"
-    elif email.count("@") == 0 or email.count("@") > 1:
-        errors["email"] = "Por favor ingrese un email valido"
-    elif not email.endswith('@vetsoft.com'):
-        errors["email"] = "Por favor ingrese un email que incluya '@vetsoft.com'"
-    elif email == "@vetsoft.com":
-        errors["email"] = "Por favor ingrese un email válido, no solo '@vetsoft.com'"
-
-    if city == "":
-        errors["city"] = "Por favor seleccione una ciudad"
-
-    return errors
-
-def validate_provider(data):
-    """
-    Valida los datos de un proveedor.
-
-    Args:
-        data (dict): Un diccionario que contiene los datos del proveedor.
-
-    Returns:
-        dict: Un diccionario que contiene los errores encontrados durante la validación.
-    """
-    errors = {}
-    
-    name = data.get("name", "")
-    email = data.get("email", "")
-    city = data.get("city", "")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    elif not re.match(r"^[A-Za-z\s]+$", name):
-        errors["name"] = "El nombre debe contener solo letras y espacios"
-
-    if email == "":
-        errors["email"] = "Por favor ingrese un email"
-    elif email.count("@") == 0:
-        errors["email"] = "Por favor ingrese un email valido"
-
-    if city == "":
-        errors["city"] = "Por favor seleccione una ciudad"
-
-    return errors
-
-def validate_medicine(data):
+from django.db import IntegrityError, models, transaction
+
+from .bulk import bulk_save
+from .changes import save_changes
+from .search import search_index
+from .sorting import sort_index
+from .unit_of_work import written
+from .validation import (
+    validate_client,
+    validate_medicine,
+    validate_pet,
+    validate_product,
+    validate_provider,
+    validate_vet,
+)
+
+
+def normalize_email(email):
     """
-    Valida los datos de un medicamento.
+    Normaliza un email para usarlo como clave natural (sin espacios y en minúsculas).
 
     Args:
-        data (dict): Un diccionario que contiene los datos del medicamento.
+        email (str): El email ingresado.
 
     Returns:
-        dict: Un diccionario que contiene los errores encontrados durante la validación.
+        str: El email normalizado.
     """
-    errors = {}
+    return (email or "").strip().lower()
 
-    name = data.get("name", "")
-    description = data.get("description", "")
-    dose = data.get("dose")
-    if dose is not None:
-        try:
-            num = int(dose)
-        except ValueError:
-            num = None     
-
-    if name == "":
-        errors["name"] = "Por favor, ingrese un nombre de la medicina"
-    elif not re.match(r"^[A-Za-z\s]+$", name):
-        errors["name"] = "El nombre debe contener solo letras y espacios"
-    
-    if description == "":
-        errors["description"] = "Por favor, ingrese una descripcion de la medicina"
-    
-    if dose is None or dose == "":
-        errors["dose"] = "Por favor, ingrese una cantidad de la dosis de la medicina"
-    elif not isinstance(dose, str) or not dose.isdigit():
-        errors["dose"] = "La dosis debe ser un numero entero"
-    elif not (num > 0 and num < 11):
-        errors["dose"] = "La dosis debe estar entre 1 y 10"
-
-    return errors
-    
-def validate_product(data):
-    """
-    Valida los datos de un producto.
-
-    Args:
-        data (dict): Un diccionario que contiene los datos del producto.
-
-    Returns:
-        dict: Un diccionario que contiene los errores encontrados durante la validación.
-    """
-    errors={}
-
-    name = data.get("name","")
-    type = data.get("type","")
-    price = data.get("price","")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    elif not re.match(r"^[A-Za-z\s]+$", name):
-        errors["name"] = "El nombre debe contener solo letras y espacios"
-    
-    if type == "":
-        errors["type"] = "Por favor ingrese un tipo"
-
-    if price == "":
-        errors["price"] = "Por favor ingrese un precio"
-    else:
-        try:
-            price_value = float(price)
-            if price_value <= 0.0:
-                errors["price"] = "Por favor ingrese un precio mayor a cero"
-        except ValueError:
-            errors["price"] = "Por favor ingrese un precio válido"
-
-    return errors
-
-
-def validate_pet(data):
-    """
-    Valida los datos de una mascota.
-
-    Args:
-        data (dict): Un diccionario que contiene los datos de la mascota.
-
-    Returns:
-        dict: Un diccionario que contiene los errores encontrados durante la validación.
-    """
-    errors={}
-
-    name = data.get("name","")
-    breed = data.get("breed","")
-    birthday = data.get("birthday","")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    elif not re.match(r"^[A-Za-z\s]+$", name):
-        errors["name"] = "El nombre debe contener solo letras y espacios"
-    
-    if breed == "":
-        errors["breed"] = "Por favor ingrese una raza"
-
-    date_now = datetime.date.today().strftime("%Y-%m-%d")
-
-    if birthday == "" or birthday >= date_now: 
-        errors["birthday"] = "Por favor ingrese una fecha de nacimiento valida y anterior a la de hoy"
-
-    return errors
-
-def validate_vet(data):
-    """
-    Valida los datos de un veterinario.
-
-    Args:
-        data (dict): Un diccionario que contiene los datos del veterinario.
-
-    Returns:
-        dict: Un diccionario que contiene los errores encontrados durante la validación.
-    """
-    errors = {}
-
-    name = data.get("name", "")
-    email = data.get("email", "")
-    phone = data.get("phone", "")
-    speciality = data.get("speciality", "")
-
-    if name == "":
-        errors["name"] = "Por favor ingrese un nombre"
-    elif not re.match(r"^[A-Za-z\s]+$", name):
-        errors["name"] = "El nombre debe contener solo letras y espacios"
-
-    if email == "":
-        errors["email"] = "Por favor ingrese un email"
-    elif email.count("@") == 0:
-        errors["email"] = "Por favor ingrese un email valido"
-
-    if phone == "":
-        errors["phone"] = "Por favor ingrese un teléfono"
-    elif not phone.startswith("54"):
-        errors["phone"] = "El teléfono debe empezar con el prefijo 54"
-    
-    if speciality == "":
-        errors["speciality"] = "Por favor seleccione una especialidad"
-
-    return errors
 
 class City(Enum):
     """
@@ -249,12 +56,30 @@ class Client(models.Model):
         phone (str): Número de teléfono del cliente.
         email (EmailField): Dirección de correo electrónico del cliente.
         address (str): Dirección del cliente. Puede estar en blanco.
+        updated_at (datetime): Fecha de la última modificación; versiona la fila en el cache de fragmentos.
     """
 
     name = models.CharField(max_length=100)
     phone = models.IntegerField()
     email = models.EmailField()
     city = models.CharField(max_length=50, choices=City.choices(), default=City.LaPlata)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    listing_fields = ("id", "name", "phone", "email", "city", "updated_at")
+    search_fields = ("name", "email", "phone")
+    fulltext_fields = ("name", "email")
+    sort_fields = ("city",)
+
+    class Meta:
+        indexes = [
+            search_index("client", "name"),
+            search_index("client", "email"),
+            search_index("client", "phone"),
+            sort_index("client", "city"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["email"], name="app_client_email_unique"),
+        ]
 
     def __str__(self):
         """
@@ -274,6 +99,58 @@ class Client(models.Model):
             raise ValidationError("El teléfono debe ser un número")
     
 
+    @classmethod
+    def build_client(cls, client_data):
+        """
+        Arma un cliente a partir de sus datos, sin guardarlo en la base de datos.
+
+        Args:
+            client_data (dict): Un diccionario con los datos del cliente.
+
+        Returns:
+            Client: La instancia sin guardar.
+        """
+        return cls(
+            name=client_data.get("name"),
+            phone=client_data.get("phone"),
+            email=normalize_email(client_data.get("email")),
+            city=client_data.get("city", City.LaPlata),
+        )
+
+    @classmethod
+    def save_client_bulk(cls, clients_data, batch_size=None):
+        """
+        Guarda muchos clientes en la base de datos con `bulk_create`, en lotes y en una sola transacción.
+
+        Args:
+            clients_data (iterable): Diccionarios con los datos de cada cliente, como en `save_client`.
+            batch_size (int): Cantidad de clientes por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de clientes guardados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(
+            cls, clients_data, validate_client, cls.build_client, batch_size,
+            unique_errors={"email": "Ya existe un cliente con ese email"},
+        )
+
+    @classmethod
+    def upsert_client_bulk(cls, clients_data, batch_size=None):
+        """
+        Guarda muchos clientes actualizando, en lugar de duplicar, los que ya existen con el mismo email.
+
+        Cada lote se escribe con un único `INSERT ... ON CONFLICT (email) DO UPDATE`, sin consultar antes
+        qué clientes existen, por lo que una sincronización completa puede repetirse sin crear duplicados.
+
+        Args:
+            clients_data (iterable): Diccionarios con los datos de cada cliente, como en `save_client`.
+            batch_size (int): Cantidad de clientes por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de clientes creados o actualizados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(cls, clients_data, validate_client, cls.build_client, batch_size, unique_fields=("email",))
+
     @classmethod
     def save_client(cls, client_data):
         """
@@ -298,12 +175,12 @@ class Client(models.Model):
         if errors:
             return False, errors
 
-        Client.objects.create(
-            name=client_data.get("name"),
-            phone=client_data.get("phone"),
-            email=client_data.get("email"),
-            city=client_data.get("city", City.LaPlata),
-        )
+        try:
+            with transaction.atomic():
+                cls.build_client(client_data).save(force_insert=True)
+        except IntegrityError:
+            return False, {"email": "Ya existe un cliente con ese email"}
+        written(Client)
 
         return True, None
 
@@ -333,12 +210,17 @@ class Client(models.Model):
         if errors:
             return False, errors
 
-        self.name = client_data.get("name", "") or self.name
-        self.email = client_data.get("email", "") or self.email
-        self.phone = client_data.get("phone", "") or self.phone
-        self.city = client_data.get("city", "") or self.city
-
-        self.save()
+        try:
+            changed = save_changes(self, {
+                "name": client_data.get("name", "") or self.name,
+                "email": normalize_email(client_data.get("email", "")) or self.email,
+                "phone": client_data.get("phone", "") or self.phone,
+                "city": client_data.get("city", "") or self.city,
+            })
+        except IntegrityError:
+            return False, {"email": "Ya existe un cliente con ese email"}
+        if changed:
+            written(Client)
         return True, None
 
 
@@ -350,11 +232,20 @@ class Provider (models.Model):
         name (str): Nombre del proveedor.
         email (EmailField): Dirección de correo electrónico del proveedor.
         address (str): Dirección del proveedor.
+        updated_at (datetime): Fecha de la última modificación; versiona la fila en el cache de fragmentos.
     """
 
     name = models.CharField(max_length=100)
     email = models.EmailField()
     city = models.CharField(max_length=50, choices=City.choices(), default=City.LaPlata)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    listing_fields = ("id", "name", "email", "city", "updated_at")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["email"], name="app_provider_email_unique"),
+        ]
 
     def __str__(self):
         """
@@ -365,6 +256,57 @@ class Provider (models.Model):
         """
         return self.name
     
+    @classmethod
+    def build_provider(cls, provider_data):
+        """
+        Arma un proveedor a partir de sus datos, sin guardarlo en la base de datos.
+
+        Args:
+            provider_data (dict): Un diccionario con los datos del proveedor.
+
+        Returns:
+            Provider: La instancia sin guardar.
+        """
+        return cls(
+            name=provider_data.get("name"),
+            email=normalize_email(provider_data.get("email")),
+            city=provider_data.get("city", City.LaPlata),
+        )
+
+    @classmethod
+    def save_provider_bulk(cls, providers_data, batch_size=None):
+        """
+        Guarda muchos proveedores en la base de datos con `bulk_create`, en lotes y en una sola transacción.
+
+        Args:
+            providers_data (iterable): Diccionarios con los datos de cada proveedor, como en `save_provider`.
+            batch_size (int): Cantidad de proveedores por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de proveedores guardados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(
+            cls, providers_data, validate_provider, cls.build_provider, batch_size,
+            unique_errors={"email": "Ya existe un proveedor con ese email"},
+        )
+
+    @classmethod
+    def upsert_provider_bulk(cls, providers_data, batch_size=None):
+        """
+        Guarda muchos proveedores actualizando, en lugar de duplicar, los que ya existen con el mismo email.
+
+        Cada lote se escribe con un único `INSERT ... ON CONFLICT (email) DO UPDATE`, sin consultar antes
+        qué proveedores existen, por lo que una sincronización completa puede repetirse sin crear duplicados.
+
+        Args:
+            providers_data (iterable): Diccionarios con los datos de cada proveedor, como en `save_provider`.
+            batch_size (int): Cantidad de proveedores por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de proveedores creados o actualizados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(cls, providers_data, validate_provider, cls.build_provider, batch_size, unique_fields=("email",))
+
     @classmethod
     def save_provider(cls, provider_data):
         """
@@ -381,11 +323,12 @@ class Provider (models.Model):
         if len(errors.keys()) > 0:
             return False, errors
 
-        Provider.objects.create(
-            name=provider_data.get("name"),
-            email=provider_data.get("email"),
-            city=provider_data.get("city", City.LaPlata),
-        )
+        try:
+            with transaction.atomic():
+                cls.build_provider(provider_data).save(force_insert=True)
+        except IntegrityError:
+            return False, {"email": "Ya existe un proveedor con ese email"}
+        written(Provider)
 
         return True, None
 
@@ -404,11 +347,16 @@ class Provider (models.Model):
         if len(errors.keys()) > 0:
             return False, errors
         
-        self.name = provider_data.get("name", "") or self.name
-        self.email = provider_data.get("email", "") or self.email
-        self.city = provider_data.get("city", "") or self.city
-
-        self.save()
+        try:
+            changed = save_changes(self, {
+                "name": provider_data.get("name", "") or self.name,
+                "email": normalize_email(provider_data.get("email", "")) or self.email,
+                "city": provider_data.get("city", "") or self.city,
+            })
+        except IntegrityError:
+            return False, {"email": "Ya existe un proveedor con ese email"}
+        if changed:
+            written(Provider)
         return True, None
 
 class Medicine(models.Model):
@@ -419,11 +367,22 @@ class Medicine(models.Model):
         name (str): Nombre del medicamento.
         description (str): Descripción del medicamento.
         dose (int): Dosis del medicamento.
+        updated_at (datetime): Fecha de la última modificación; versiona la fila en el cache de fragmentos.
     """
 
     name = models.CharField(max_length=100)
     description = models.CharField(max_length=255)
     dose = models.IntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    listing_fields = ("id", "name", "description", "dose", "updated_at")
+    fulltext_fields = ("name", "description")
+    sort_fields = ("dose",)
+
+    class Meta:
+        indexes = [
+            sort_index("medicine", "dose"),
+        ]
 
     def __str__(self):
         """
@@ -431,6 +390,37 @@ class Medicine(models.Model):
         """
         return self.name
 
+    @classmethod
+    def build_medicine(cls, medicine_data):
+        """
+        Arma un medicamento a partir de sus datos, sin guardarlo en la base de datos.
+
+        Args:
+            medicine_data (dict): Un diccionario con los datos del medicamento.
+
+        Returns:
+            Medicine: La instancia sin guardar.
+        """
+        return cls(
+            name=medicine_data.get("name"),
+            description=medicine_data.get("description"),
+            dose=medicine_data.get("dose"),
+        )
+
+    @classmethod
+    def save_medicine_bulk(cls, medicines_data, batch_size=None):
+        """
+        Guarda muchos medicamentos en la base de datos con `bulk_create`, en lotes y en una sola transacción.
+
+        Args:
+            medicines_data (iterable): Diccionarios con los datos de cada medicamento, como en `save_medicine`.
+            batch_size (int): Cantidad de medicamentos por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de medicamentos guardados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(cls, medicines_data, validate_medicine, cls.build_medicine, batch_size)
+
     @classmethod
     def save_medicine(cls, medicine_data):
         """
@@ -447,11 +437,8 @@ class Medicine(models.Model):
         if len(errors.keys()) > 0:
             return False, errors
 
-        Medicine.objects.create(
-            name=medicine_data.get("name"),
-            description=medicine_data.get("description"),
-            dose=medicine_data.get("dose"),
-        )
+        cls.build_medicine(medicine_data).save(force_insert=True)
+        written(Medicine)
         return True, None
 
     def update_medicine(self, medicine_data):
@@ -469,11 +456,13 @@ class Medicine(models.Model):
         if len(errors.keys()) > 0:
             return False, errors
         
-        self.name = medicine_data.get("name", "") or self.name
-        self.description = medicine_data.get("description", "") or self.description
-        self.dose = medicine_data.get("dose", None) or self.dose
-
-        self.save()
+        changed = save_changes(self, {
+            "name": medicine_data.get("name", "") or self.name,
+            "description": medicine_data.get("description", "") or self.description,
+            "dose": medicine_data.get("dose", None) or self.dose,
+        })
+        if changed:
+            written(Medicine)
         return True, None
 
 class Product (models.Model):
@@ -484,11 +473,21 @@ class Product (models.Model):
         name(str): Nombre del producto.
         type(str): Tipo del producto.
         price(float): Precio del producto.
+        updated_at (datetime): Fecha de la última modificación; versiona la fila en el cache de fragmentos.
     """
 
     name = models.CharField(max_length=100)
     type = models.CharField(max_length=100)
     price = models.FloatField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    listing_fields = ("id", "name", "type", "price", "updated_at")
+    sort_fields = ("price",)
+
+    class Meta:
+        indexes = [
+            sort_index("product", "price"),
+        ]
 
     def __str__(self):
         """
@@ -496,6 +495,37 @@ class Product (models.Model):
         """
         return self.name
     
+    @classmethod
+    def build_product(cls, product_data):
+        """
+        Arma un producto a partir de sus datos, sin guardarlo en la base de datos.
+
+        Args:
+            product_data (dict): Un diccionario con los datos del producto.
+
+        Returns:
+            Product: La instancia sin guardar.
+        """
+        return cls(
+            name=product_data.get("name"),
+            type=product_data.get("type"),
+            price=product_data.get("price"),
+        )
+
+    @classmethod
+    def save_product_bulk(cls, products_data, batch_size=None):
+        """
+        Guarda muchos productos en la base de datos con `bulk_create`, en lotes y en una sola transacción.
+
+        Args:
+            products_data (iterable): Diccionarios con los datos de cada producto, como en `save_product`.
+            batch_size (int): Cantidad de productos por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de productos guardados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(cls, products_data, validate_product, cls.build_product, batch_size)
+
     @classmethod
     def save_product(cls, product_data):
         """
@@ -512,11 +542,8 @@ class Product (models.Model):
         if len(errors.keys()) > 0:
             return False, errors
         
-        Product.objects.create(
-            name=product_data.get("name"),
-            type=product_data.get("type"),
-            price=product_data.get("price"),
-        )
+        cls.build_product(product_data).save(force_insert=True)
+        written(Product)
 
         return True, None
     
@@ -535,11 +562,13 @@ class Product (models.Model):
         if len(errors.keys()) > 0:
             return False, errors
     
-        self.name=product_data.get("name", "") or self.name
-        self.type=product_data.get("type", "") or self.type
-        self.price=product_data.get("price","") or self.price
-
-        self.save()
+        changed = save_changes(self, {
+            "name": product_data.get("name", "") or self.name,
+            "type": product_data.get("type", "") or self.type,
+            "price": product_data.get("price","") or self.price,
+        })
+        if changed:
+            written(Product)
         return True, None
         
 class Pet (models.Model):
@@ -550,11 +579,25 @@ class Pet (models.Model):
         name (str): Nombre de la mascota.
         breed (str): Raza de la mascota.
         birthday (date): Fecha de nacimiento de la mascota.
+        updated_at (datetime): Fecha de la última modificación; versiona la fila en el cache de fragmentos.
     """
 
     name = models.CharField(max_length=100)
     breed = models.CharField(max_length=100)
     birthday = models.DateField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    listing_fields = ("id", "name", "breed", "birthday", "updated_at")
+    search_fields = ("name", "breed")
+    fulltext_fields = ("name", "breed")
+    sort_fields = ("birthday",)
+
+    class Meta:
+        indexes = [
+            search_index("pet", "name"),
+            search_index("pet", "breed"),
+            sort_index("pet", "birthday"),
+        ]
 
     def __str__(self):
         """
@@ -562,6 +605,37 @@ class Pet (models.Model):
         """
         return self.name
     
+    @classmethod
+    def build_pet(cls, pet_data):
+        """
+        Arma una mascota a partir de sus datos, sin guardarla en la base de datos.
+
+        Args:
+            pet_data (dict): Un diccionario con los datos de la mascota.
+
+        Returns:
+            Pet: La instancia sin guardar.
+        """
+        return cls(
+            name=pet_data.get("name"),
+            breed=pet_data.get("breed"),
+            birthday=pet_data.get("birthday"),
+        )
+
+    @classmethod
+    def save_pet_bulk(cls, pets_data, batch_size=None):
+        """
+        Guarda muchas mascotas en la base de datos con `bulk_create`, en lotes y en una sola transacción.
+
+        Args:
+            pets_data (iterable): Diccionarios con los datos de cada mascota, como en `save_pet`.
+            batch_size (int): Cantidad de mascotas por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de mascotas guardadas y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(cls, pets_data, validate_pet, cls.build_pet, batch_size)
+
     @classmethod
     def save_pet(cls, pet_data):
         """
@@ -578,11 +652,8 @@ class Pet (models.Model):
         if len(errors.keys()) > 0:
             return False, errors
         
-        Pet.objects.create(
-            name=pet_data.get("name"),
-            breed=pet_data.get("breed"),
-            birthday=pet_data.get("birthday"),
-        )
+        cls.build_pet(pet_data).save(force_insert=True)
+        written(Pet)
 
         return True, None
     
@@ -601,11 +672,13 @@ class Pet (models.Model):
         if len(errors.keys()) > 0:
             return False, errors
 
-        self.name=pet_data.get("name", "") or self.name
-        self.breed=pet_data.get("breed", "") or self.breed
-        self.birthday=pet_data.get("birthday","") or self.birthday
-
-        self.save()
+        changed = save_changes(self, {
+            "name": pet_data.get("name", "") or self.name,
+            "breed": pet_data.get("breed", "") or self.breed,
+            "birthday": pet_data.get("birthday","") or self.birthday,
+        })
+        if changed:
+            written(Pet)
         return True, None
 
 class Speciality(Enum):
@@ -640,12 +713,25 @@ class Vet(models.Model):
         email (EmailField): Dirección de correo electrónico del veterinario.
         phone (str): Número de teléfono del veterinario.
         speciality (str): Especialidad del veterinario.
+        updated_at (datetime): Fecha de la última modificación; versiona la fila en el cache de fragmentos.
     """
 
     name = models.CharField(max_length=100)
     email = models.EmailField()
     phone = models.CharField(max_length=15)
     speciality = models.CharField(max_length=100, choices=Speciality.choices(), default=Speciality.Urgencias)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    listing_fields = ("id", "name", "email", "phone", "speciality", "updated_at")
+    sort_fields = ("speciality",)
+
+    class Meta:
+        indexes = [
+            sort_index("vet", "speciality"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["email"], name="app_vet_email_unique"),
+        ]
 
     def __str__(self):
         """
@@ -653,6 +739,58 @@ class Vet(models.Model):
         """
         return self.name
 
+    @classmethod
+    def build_vet(cls, vet_data):
+        """
+        Arma un veterinario a partir de sus datos, sin guardarlo en la base de datos.
+
+        Args:
+            vet_data (dict): Un diccionario con los datos del veterinario.
+
+        Returns:
+            Vet: La instancia sin guardar.
+        """
+        return cls(
+            name=vet_data.get("name"),
+            email=normalize_email(vet_data.get("email")),
+            phone=vet_data.get("phone"),
+            speciality=vet_data.get("speciality", Speciality.Urgencias),
+        )
+
+    @classmethod
+    def save_vet_bulk(cls, vets_data, batch_size=None):
+        """
+        Guarda muchos veterinarios en la base de datos con `bulk_create`, en lotes y en una sola transacción.
+
+        Args:
+            vets_data (iterable): Diccionarios con los datos de cada veterinario, como en `save_vet`.
+            batch_size (int): Cantidad de veterinarios por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de veterinarios guardados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(
+            cls, vets_data, validate_vet, cls.build_vet, batch_size,
+            unique_errors={"email": "Ya existe un veterinario con ese email"},
+        )
+
+    @classmethod
+    def upsert_vet_bulk(cls, vets_data, batch_size=None):
+        """
+        Guarda muchos veterinarios actualizando, en lugar de duplicar, los que ya existen con el mismo email.
+
+        Cada lote se escribe con un único `INSERT ... ON CONFLICT (email) DO UPDATE`, sin consultar antes
+        qué veterinarios existen, por lo que una sincronización completa puede repetirse sin crear duplicados.
+
+        Args:
+            vets_data (iterable): Diccionarios con los datos de cada veterinario, como en `save_vet`.
+            batch_size (int): Cantidad de veterinarios por lote; por defecto `BULK_BATCH_SIZE`.
+
+        Returns:
+            tuple: La cantidad de veterinarios creados o actualizados y los errores de validación de cada fila rechazada, indexados por su posición.
+        """
+        return bulk_save(cls, vets_data, validate_vet, cls.build_vet, batch_size, unique_fields=("email",))
+
     @classmethod
     def save_vet(cls, vet_data):
         """
@@ -669,12 +807,12 @@ class Vet(models.Model):
         if len(errors.keys()) > 0:
             return False, errors
 
-        Vet.objects.create(
-            name=vet_data.get("name"),
-            email=vet_data.get("email"),
-            phone=vet_data.get("phone"),
-            speciality=vet_data.get("speciality", Speciality.Urgencias),
-        )
+        try:
+            with transaction.atomic():
+                cls.build_vet(vet_data).save(force_insert=True)
+        except IntegrityError:
+            return False, {"email": "Ya existe un veterinario con ese email"}
+        written(Vet)
 
         return True, None
 
@@ -693,10 +831,136 @@ class Vet(models.Model):
         if len(errors.keys()) > 0:
             return False, errors
         
-        self.name = vet_data.get("name", "") or self.name
-        self.email = vet_data.get("email", "") or self.email
-        self.phone = vet_data.get("phone", "") or self.phone
-        self.speciality = vet_data.get("speciality", "") or self.speciality
-        self.save()
+        try:
+            changed = save_changes(self, {
+                "name": vet_data.get("name", "") or self.name,
+                "email": normalize_email(vet_data.get("email", "")) or self.email,
+                "phone": vet_data.get("phone", "") or self.phone,
+                "speciality": vet_data.get("speciality", "") or self.speciality,
+            })
+        except IntegrityError:
+            return False, {"email": "Ya existe un veterinario con ese email"}
+        if changed:
+            written(Vet)
         return True, None
-    
\ No newline at end of file
+    
+
+class ImportModel(Enum):
+    """
+    Enumeración que representa los modelos que se pueden importar desde un CSV.
+    """
+
+    clients = "Clientes"
+    providers = "Proveedores"
+    medicines = "Medicamentos"
+    products = "Productos"
+    pets = "Mascotas"
+    vets = "Veterinarios"
+
+    @classmethod
+    def choices(cls):
+        """
+        Retorna una lista de tuplas con los modelos importables.
+
+        Returns:
+            list: Una lista de tuplas con los nombres y etiquetas de los modelos.
+        """
+        return [(key.name, key.value) for key in cls]
+
+
+class ImportStatus(Enum):
+    """
+    Enumeración que representa los estados de una importación en segundo plano.
+    """
+
+    pending = "Pendiente"
+    running = "En curso"
+    done = "Terminada"
+    failed = "Fallida"
+
+    @classmethod
+    def choices(cls):
+        """
+        Retorna una lista de tuplas con las opciones de estado.
+
+        Returns:
+            list: Una lista de tuplas con los nombres y valores de los estados.
+        """
+        return [(key.name, key.value) for key in cls]
+
+
+class ImportJob(models.Model):
+    """
+    Modelo que representa la importación de un CSV subido desde la web, que se ejecuta
+    en segundo plano (ver app/jobs.py).
+
+    El avance se guarda junto con cada lote confirmado, así una importación interrumpida
+    (por ejemplo al reiniciar el worker) continúa desde el último lote guardado.
+
+    Args:
+        model (str): Modelo a importar, por su nombre en `IMPORTERS` (por ejemplo "clients").
+        upsert (bool): Si las filas cuyo email ya existe actualizan el registro existente.
+        source (str): Ruta del CSV subido, guardado en `IMPORT_JOBS_DIR`.
+        rejected_path (str): Ruta del CSV con las filas rechazadas.
+        status (str): Estado de la importación (ver `ImportStatus`).
+        rows (int): Filas del CSV procesadas en lotes ya confirmados.
+        imported (int): Filas guardadas.
+        rejected (int): Filas rechazadas.
+        rejected_offset (int): Largo del CSV de rechazadas al confirmar el último lote.
+        seconds (float): Tiempo de importación acumulado.
+        error (str): El error que detuvo la importación, si falló.
+        created_at (datetime): Fecha de creación.
+        updated_at (datetime): Fecha del último avance; si una importación en curso no avanza
+            durante `IMPORT_JOB_STALE_SECONDS` se considera interrumpida.
+    """
+
+    model = models.CharField(max_length=20, choices=ImportModel.choices())
+    upsert = models.BooleanField(default=False)
+    source = models.CharField(max_length=255)
+    rejected_path = models.CharField(max_length=255)
+    status = models.CharField(
+        max_length=10, choices=ImportStatus.choices(), default=ImportStatus.pending.name,
+    )
+    rows = models.PositiveIntegerField(default=0)
+    imported = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    rejected_offset = models.PositiveBigIntegerField(default=0)
+    seconds = models.FloatField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Importaciones pendientes o interrumpidas (ver `resumable` en app/jobs.py)
+            models.Index(fields=["status", "updated_at"], name="app_importjob_status_idx"),
+        ]
+
+    def __str__(self):
+        """
+        Retorna una representación en string de la importación.
+
+        Returns:
+            str: El modelo importado y el estado.
+        """
+        return f"{self.model} ({self.get_status_display()})"
+
+    @property
+    def finished(self):
+        """
+        Indica si la importación ya terminó, bien o con error.
+
+        Returns:
+            bool: Si el estado es terminada o fallida.
+        """
+        return self.status in (ImportStatus.done.name, ImportStatus.failed.name)
+
+    @property
+    def rows_per_second(self):
+        """
+        Filas procesadas por segundo.
+
+        Returns:
+            float: La velocidad de importación.
+        """
+        return self.rows / self.seconds if self.seconds else 0.0
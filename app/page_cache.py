@@ -0,0 +1,70 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import router
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.template.loader import render_to_string
+
+from .versions import get_version
+
+# Los listados se renderizan con este valor en lugar del token CSRF real, así el HTML
+# (o los fragmentos) pueden compartirse entre usuarios. El token de cada request se
+# inserta al momento de responder.
+CSRF_PLACEHOLDER = "vetsoft-csrf-token-placeholder"
+
+
+def page_key(request, model):
+    """
+    Retorna la clave de cache de una página de listado.
+
+    La clave incluye la versión de cambios del modelo, por lo que cualquier escritura
+    (`save_*`, `update_*` o eliminación) deja de usar las páginas cacheadas anteriores.
+    También incluye la base de la que se lee: una página leída de la réplica puede estar
+    atrasada respecto de la versión, y no debe servirse a quien lee del primario (por
+    ejemplo, la sesión que acaba de escribir; ver `is_sticky`).
+
+    Args:
+        request (HttpRequest): La request actual; se usan la ruta y los parámetros.
+        model (type): El modelo del listado.
+
+    Returns:
+        str: La clave de cache.
+    """
+    path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+    alias = router.db_for_read(model)
+    return f"vetsoft:page:{model._meta.label_lower}:{alias}:{get_version(model):x}:{path}"
+
+
+def render_cached(request, model, template, build_context):
+    """
+    Renderiza un listado, reutilizando el HTML cacheado si el modelo no cambió.
+
+    Si `REPOSITORY_CACHE_TIMEOUT` es 0 el cache está desactivado y la página se renderiza
+    siempre.
+
+    Args:
+        request (HttpRequest): La request actual.
+        model (type): El modelo del listado.
+        template (str): El template a renderizar.
+        build_context (callable): Arma el contexto del template; solo se invoca (y solo
+            se consulta la base) cuando la página no está en cache.
+
+    Returns:
+        HttpResponse: La página con el token CSRF de la request.
+    """
+    timeout = settings.REPOSITORY_CACHE_TIMEOUT
+    # La clave se calcula antes de consultar la base: si una escritura ocurre durante
+    # el render, la página queda guardada bajo la versión anterior y nunca se sirve
+    # un contenido viejo con una versión nueva.
+    key = page_key(request, model) if timeout else None
+
+    content = cache.get(key) if key else None
+    if content is None:
+        context = {**build_context(), "csrf_token": CSRF_PLACEHOLDER}
+        content = render_to_string(template, context, request)
+        if key:
+            cache.set(key, content, timeout)
+
+    return HttpResponse(content.replace(CSRF_PLACEHOLDER, get_token(request)))
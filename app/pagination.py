@@ -0,0 +1,261 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Q
+
+CURSOR_AFTER = "after"
+CURSOR_BEFORE = "before"
+
+# Parámetros que no se conservan en los enlaces del listado (páginas, orden): el cursor
+# y el aviso de cuántos registros se eliminaron (`?deleted=`).
+TRANSIENT_PARAMS = (CURSOR_AFTER, CURSOR_BEFORE, "deleted")
+
+
+def encode_cursor(values):
+    """
+    Codifica los valores de ordenamiento de una fila en un cursor opaco para la URL.
+
+    Args:
+        values (list): Valores de los campos de ordenamiento de la fila límite.
+
+    Returns:
+        str: El cursor codificado en base64 (url-safe).
+    """
+    raw = json.dumps(values, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decodifica un cursor generado por `encode_cursor`.
+
+    Args:
+        cursor (str): El cursor recibido en la query string.
+
+    Returns:
+        list: Los valores de ordenamiento, o None si el cursor no es válido.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        return None
+
+    if not isinstance(values, list):
+        return None
+    return values
+
+
+def get_page_size(request):
+    """
+    Obtiene el tamaño de página pedido en `?page_size=`, acotado por la configuración.
+
+    Args:
+        request (HttpRequest): La request actual.
+
+    Returns:
+        int: El tamaño de página a utilizar.
+    """
+    page_size = settings.REPOSITORY_PAGE_SIZE
+    requested = request.GET.get("page_size", "")
+
+    if requested.isdigit() and int(requested) > 0:
+        page_size = int(requested)
+
+    return min(page_size, settings.REPOSITORY_MAX_PAGE_SIZE)
+
+
+class CursorPage:
+    """
+    Una página de resultados obtenida con paginación por cursor.
+
+    Args:
+        items (list): Las filas de la página, en el orden del listado.
+        next_cursor (str): Cursor para pedir la página siguiente, o None.
+        previous_cursor (str): Cursor para pedir la página anterior, o None.
+        params (QueryDict): Parámetros de la request que se conservan en los enlaces.
+    """
+
+    def __init__(self, items, next_cursor, previous_cursor, params):
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.params = params
+
+    def __iter__(self):
+        """
+        Itera sobre las filas de la página.
+        """
+        return iter(self.items)
+
+    def __len__(self):
+        """
+        Retorna la cantidad de filas de la página.
+        """
+        return len(self.items)
+
+    @property
+    def has_next(self):
+        """
+        Indica si existe una página siguiente.
+        """
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        """
+        Indica si existe una página anterior.
+        """
+        return self.previous_cursor is not None
+
+    def _query(self, name, cursor):
+        """
+        Arma la query string para el enlace a otra página conservando los demás parámetros.
+        """
+        params = self.params.copy()
+        for param in TRANSIENT_PARAMS:
+            params.pop(param, None)
+        params[name] = cursor
+        return params.urlencode()
+
+    @property
+    def next_query(self):
+        """
+        Query string del enlace a la página siguiente.
+        """
+        return self._query(CURSOR_AFTER, self.next_cursor)
+
+    @property
+    def previous_query(self):
+        """
+        Query string del enlace a la página anterior.
+        """
+        return self._query(CURSOR_BEFORE, self.previous_cursor)
+
+
+class CursorPaginator:
+    """
+    Paginador por cursor (keyset) sobre un queryset.
+
+    En lugar de OFFSET, cada página se pide a partir de los valores de ordenamiento de
+    la última (o primera) fila de la página vecina, por lo que el costo de la consulta no
+    depende de qué tan lejos se encuentre la página dentro de la tabla.
+
+    Args:
+        queryset (QuerySet): El queryset a paginar.
+        ordering (tuple): Campos de ordenamiento, con prefijo "-" para orden descendente.
+            El último campo debe ser único (por ejemplo "id") para que el orden sea estable.
+        page_size (int): Cantidad de filas por página.
+    """
+
+    def __init__(self, queryset, ordering=("id",), page_size=None):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.page_size = page_size or settings.REPOSITORY_PAGE_SIZE
+        self.fields = [
+            (name.lstrip("-"), name.startswith("-")) for name in self.ordering
+        ]
+
+    def _parse(self, cursor):
+        """
+        Convierte un cursor en los valores tipados de los campos de ordenamiento.
+        """
+        values = decode_cursor(cursor)
+        if values is None or len(values) != len(self.fields):
+            return None
+
+        opts = self.queryset.model._meta
+        try:
+            return [
+                opts.get_field(name).to_python(value)
+                for (name, _), value in zip(self.fields, values)
+            ]
+        except (ValidationError, ValueError, TypeError, FieldDoesNotExist):
+            return None
+
+    def _cursor_for(self, item):
+        """
+        Genera el cursor que apunta a una fila de la página.
+        """
+        return encode_cursor([getattr(item, name) for name, _ in self.fields])
+
+    def _seek(self, values, forward):
+        """
+        Construye el filtro que selecciona las filas posteriores (o anteriores) al cursor.
+        """
+        condition = Q()
+        for index, (name, descending) in enumerate(self.fields):
+            lookup = "gt" if forward != descending else "lt"
+            step = Q(**{f"{name}__{lookup}": values[index]})
+            for (previous, _), value in zip(self.fields[:index], values):
+                step &= Q(**{previous: value})
+            condition |= step
+        return condition
+
+    def _order(self, forward):
+        """
+        Retorna el ORDER BY a aplicar según la dirección de la paginación.
+        """
+        if forward:
+            return self.ordering
+        return tuple(
+            name if descending else f"-{name}" for name, descending in self.fields
+        )
+
+    def page(self, params):
+        """
+        Obtiene la página pedida en los parámetros `after` / `before`.
+
+        Args:
+            params (QueryDict): Los parámetros GET de la request.
+
+        Returns:
+            CursorPage: La página de resultados.
+        """
+        after = self._parse(params[CURSOR_AFTER]) if CURSOR_AFTER in params else None
+        before = self._parse(params[CURSOR_BEFORE]) if CURSOR_BEFORE in params else None
+        forward = before is None
+
+        queryset = self.queryset.order_by(*self._order(forward))
+        if after is not None and forward:
+            queryset = queryset.filter(self._seek(after, forward=True))
+        elif before is not None:
+            queryset = queryset.filter(self._seek(before, forward=False))
+
+        items = list(queryset[: self.page_size + 1])
+        has_more = len(items) > self.page_size
+        items = items[: self.page_size]
+
+        if not forward:
+            items.reverse()
+
+        if not items:
+            return CursorPage(items, None, None, params)
+
+        if forward:
+            next_cursor = self._cursor_for(items[-1]) if has_more else None
+            previous_cursor = self._cursor_for(items[0]) if after is not None else None
+        else:
+            next_cursor = self._cursor_for(items[-1])
+            previous_cursor = self._cursor_for(items[0]) if has_more else None
+
+        return CursorPage(items, next_cursor, previous_cursor, params)
+
+
+def paginate(request, queryset, ordering=("id",)):
+    """
+    Pagina un queryset por cursor a partir de los parámetros de la request.
+
+    Args:
+        request (HttpRequest): La request actual.
+        queryset (QuerySet): El queryset a paginar.
+        ordering (tuple): Campos de ordenamiento estable del listado.
+
+    Returns:
+        CursorPage: La página de resultados.
+    """
+    paginator = CursorPaginator(queryset, ordering, get_page_size(request))
+    return paginator.page(request.GET)
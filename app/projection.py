@@ -0,0 +1,15 @@
+def project(queryset):
+    """
+    Restringe un queryset a las columnas que usa el listado del modelo (`listing_fields`).
+
+    Las filas se obtienen con `values_list(named=True)`, es decir como tuplas con nombre
+    (sin `__dict__`), en lugar de instancias completas del modelo. Los templates de los
+    listados acceden a ellas igual que a una instancia (`client.name`, `client.id`).
+
+    Args:
+        queryset (QuerySet): El queryset del listado.
+
+    Returns:
+        QuerySet: Un queryset de tuplas con nombre con solo las columnas del listado.
+    """
+    return queryset.values_list(*queryset.model.listing_fields, named=True)
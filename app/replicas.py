@@ -0,0 +1,175 @@
+import functools
+import sqlite3
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+from .versions import bump_version
+
+# Si las lecturas del hilo actual van a la réplica (solo dentro de las vistas marcadas).
+_local = threading.local()
+
+
+def reading_from_replica():
+    """
+    Indica si las lecturas del hilo actual se envían a la réplica.
+
+    Returns:
+        bool: True dentro de una vista marcada con `replica_reads`, si hay réplica configurada.
+    """
+    return getattr(_local, "replica", False)
+
+
+def is_sticky(request):
+    """
+    Indica si la sesión del navegador escribió hace poco y debe leer del primario.
+
+    Después de cada request que modifica datos se envía la cookie `REPLICA_STICKY_COOKIE`,
+    que vence a los `REPLICA_STICKY_SECONDS` segundos (ver `ReadYourWritesMiddleware`):
+    mientras exista, esa sesión lee del primario y ve sus propias escrituras aunque la
+    réplica todavía no se haya sincronizado.
+
+    Args:
+        request (HttpRequest): La request.
+
+    Returns:
+        bool: Si la request debe leer del primario.
+    """
+    return settings.REPLICA_STICKY_COOKIE in request.COOKIES
+
+
+def on_replica(chunks):
+    """
+    Recorre el contenido de una respuesta en streaming leyendo de la réplica.
+
+    Las consultas de un listado en streaming se ejecutan mientras se envía la respuesta,
+    después de que la vista retornó, por lo que cada bloque se genera con las lecturas
+    dirigidas a la réplica.
+
+    Args:
+        chunks (iterable): El contenido original de la respuesta.
+
+    Yields:
+        bytes: Cada bloque del contenido.
+    """
+    iterator = iter(chunks)
+    while True:
+        _local.replica = True
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _local.replica = False
+        yield chunk
+
+
+def replica_reads(view):
+    """
+    Decorador para las vistas de solo lectura (listados, búsquedas y exportaciones) cuyas
+    consultas pueden ir a la réplica `REPLICA_DATABASE`.
+
+    Sin réplica configurada, o si la sesión escribió hace poco (ver `is_sticky`), la vista
+    lee del primario como siempre.
+
+    Args:
+        view (callable): La vista.
+
+    Returns:
+        callable: La vista decorada.
+    """
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if not settings.REPLICA_DATABASE or is_sticky(request):
+            return view(request, *args, **kwargs)
+
+        _local.replica = True
+        try:
+            response = view(request, *args, **kwargs)
+        finally:
+            _local.replica = False
+
+        if response.streaming:
+            response.streaming_content = on_replica(response.streaming_content)
+        return response
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """
+    Router de base de datos que separa lecturas y escrituras.
+
+    Las lecturas hechas dentro de una vista marcada con `replica_reads` van a la réplica
+    `REPLICA_DATABASE`; todas las demás lecturas y todas las escrituras (`save_*`,
+    `update_*`, eliminaciones e importaciones) van al primario. La réplica es una copia
+    del primario (ver `sync_replica`), por lo que las migraciones solo se aplican al
+    primario.
+    """
+
+    def db_for_read(self, model, **hints):
+        """Elige la réplica para las lecturas de las vistas marcadas."""
+        if reading_from_replica():
+            return settings.REPLICA_DATABASE
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        """Envía todas las escrituras al primario."""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Permite relaciones entre objetos leídos de cualquiera de las dos bases."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Aplica las migraciones solo al primario."""
+        return db == DEFAULT_DB_ALIAS
+
+
+def sync_replica(source, target):
+    """
+    Copia la base primaria sobre la réplica con la API de backup de SQLite.
+
+    La copia es consistente (una foto de la base en una transacción de lectura) y no
+    bloquea las escrituras del primario mientras se hace. Al terminar se actualiza la
+    versión de cada modelo (ver app/versions.py), así las páginas cacheadas con datos de
+    la réplica anterior dejan de usarse.
+
+    Args:
+        source (sqlite3.Connection): Conexión a la base primaria.
+        target (sqlite3.Connection): Conexión a la réplica.
+    """
+    source.backup(target)
+    for model in apps.get_app_config("app").get_models():
+        bump_version(model)
+
+
+def data_version(connection):
+    """
+    Retorna el contador de cambios de SQLite de una conexión.
+
+    El valor cambia cuando otra conexión confirma una escritura, así se sabe si el
+    primario cambió desde la última sincronización sin leer sus tablas.
+
+    Args:
+        connection (sqlite3.Connection): La conexión a la base primaria.
+
+    Returns:
+        int: El valor de `PRAGMA data_version`.
+    """
+    return connection.execute("PRAGMA data_version").fetchone()[0]
+
+
+def connect(name):
+    """
+    Abre una conexión `sqlite3` a una base de `DATABASES`.
+
+    Args:
+        name (str): El alias de la base.
+
+    Returns:
+        sqlite3.Connection: La conexión.
+    """
+    return sqlite3.connect(settings.DATABASES[name]["NAME"])
@@ -0,0 +1,66 @@
+from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Lower
+
+# Límite superior para las búsquedas por prefijo: cualquier texto que empiece con el
+# término queda dentro del rango [término, término + PREFIX_UPPER_BOUND).
+PREFIX_UPPER_BOUND = "\U0010ffff"
+
+
+def search_alias(field):
+    """
+    Retorna el nombre del alias normalizado que se usa para buscar sobre un campo.
+
+    Args:
+        field (str): Nombre del campo del modelo.
+
+    Returns:
+        str: Nombre del alias.
+    """
+    return f"{field}_search"
+
+
+def search_index(model_name, field):
+    """
+    Crea el índice funcional (`LOWER(campo)`) que respalda la búsqueda sobre un campo.
+
+    Args:
+        model_name (str): Nombre del modelo en minúsculas, usado para nombrar el índice.
+        field (str): Nombre del campo a indexar.
+
+    Returns:
+        Index: El índice a declarar en `Meta.indexes` del modelo.
+    """
+    return models.Index(Lower(field), name=f"app_{model_name}_{field}_lower_idx")
+
+
+def search(queryset, term):
+    """
+    Filtra un queryset por prefijo, sin distinguir mayúsculas, sobre los `search_fields`
+    del modelo.
+
+    La búsqueda se expresa como un rango sobre `LOWER(campo)` en lugar de un LIKE, de
+    modo que la base de datos puede resolverla con los índices funcionales del modelo.
+
+    Args:
+        queryset (QuerySet): El queryset a filtrar.
+        term (str): El texto ingresado en `?q=`.
+
+    Returns:
+        QuerySet: El queryset filtrado, o el original si el término está vacío.
+    """
+    term = term.strip().lower()
+    if term == "":
+        return queryset
+
+    condition = Q()
+    aliases = {}
+    for field in queryset.model.search_fields:
+        alias = search_alias(field)
+        aliases[alias] = Lower(field, output_field=models.CharField())
+        condition |= Q(**{
+            f"{alias}__gte": term,
+            f"{alias}__lt": term + PREFIX_UPPER_BOUND,
+        })
+
+    return queryset.alias(**aliases).filter(condition)
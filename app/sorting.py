@@ -0,0 +1,145 @@
+from typing import NamedTuple
+
+from django.db import models
+from django.db.models import F
+
+from .pagination import TRANSIENT_PARAMS
+
+SORT_PARAM = "sort"
+
+# Columna de desempate: es única, así que el orden es estable (y los cursores no
+# repiten ni saltean filas) aunque muchas filas compartan el valor de la columna.
+TIEBREAKER = "id"
+
+# Largo mínimo del término de búsqueda (`?q=`) para leer lo encontrado con los índices de
+# la búsqueda y ordenarlo aparte (ver `sort_queryset`). Un término más corto encuentra
+# una parte grande de la tabla: conviene recorrerla en el orden del id y enviar cada fila
+# apenas se lee, en lugar de ordenar todas las encontradas antes de enviar la primera.
+SELECTIVE_TERM_LENGTH = 3
+
+
+class SortLink(NamedTuple):
+    """
+    Enlace de la cabecera de una columna ordenable del listado.
+
+    Args:
+        query (str): Query string que ordena por la columna (o invierte el orden actual).
+        active (bool): Si el listado está ordenado por esta columna.
+        descending (bool): Si el orden actual de la columna es descendente.
+    """
+
+    query: str
+    active: bool
+    descending: bool
+
+
+def sort_index(model_name, field):
+    """
+    Crea el índice compuesto (`campo`, `id`) que respalda el orden por un campo.
+
+    El índice cubre el ORDER BY completo (campo más desempate), por lo que la base
+    recorre el índice en orden, hacia adelante o hacia atrás, sin ordenar en memoria.
+
+    Args:
+        model_name (str): Nombre del modelo en minúsculas, usado para nombrar el índice.
+        field (str): Nombre del campo a indexar.
+
+    Returns:
+        Index: El índice a declarar en `Meta.indexes` del modelo.
+    """
+    return models.Index(fields=[field, TIEBREAKER], name=f"app_{model_name}_{field}_id_idx")
+
+
+def get_sort(request, model):
+    """
+    Obtiene el orden pedido en `?sort=`, solo si es una columna ordenable del modelo.
+
+    Se aceptan `id` y los `sort_fields` del modelo (columnas con índice), con prefijo "-"
+    para orden descendente. Cualquier otro valor se ignora.
+
+    Args:
+        request (HttpRequest): La request actual.
+        model (type): El modelo del listado.
+
+    Returns:
+        str: El orden validado (por ejemplo "-city"), o "" para el orden por defecto.
+    """
+    sort = request.GET.get(SORT_PARAM, "")
+    field = sort.removeprefix("-")
+    if field == TIEBREAKER or field in getattr(model, "sort_fields", ()):
+        return sort
+    return ""
+
+
+def sort_ordering(sort):
+    """
+    Convierte un orden validado en los campos de ORDER BY, con desempate por `id`.
+
+    El desempate usa la misma dirección que la columna para que el índice compuesto se
+    pueda recorrer en un solo sentido.
+
+    Args:
+        sort (str): El orden retornado por `get_sort`.
+
+    Returns:
+        tuple: Los campos de ordenamiento (por ejemplo ("-city", "-id")).
+    """
+    field = sort.removeprefix("-")
+    if field in ("", TIEBREAKER):
+        return (sort or TIEBREAKER,)
+
+    prefix = "-" if sort.startswith("-") else ""
+    return (sort, f"{prefix}{TIEBREAKER}")
+
+
+def sort_links(request, model, sort):
+    """
+    Arma los enlaces de las cabeceras ordenables del listado.
+
+    Cada enlace conserva los demás parámetros (búsqueda, tamaño de página) y descarta el
+    cursor, ya que cambiar el orden vuelve a la primera página, y el aviso de eliminación.
+
+    Args:
+        request (HttpRequest): La request actual.
+        model (type): El modelo del listado.
+        sort (str): El orden actual, retornado por `get_sort`.
+
+    Returns:
+        dict: Un `SortLink` por cada campo ordenable del modelo.
+    """
+    links = {}
+    for field in getattr(model, "sort_fields", ()):
+        active = sort.removeprefix("-") == field
+        descending = active and sort.startswith("-")
+
+        params = request.GET.copy()
+        for param in TRANSIENT_PARAMS:
+            params.pop(param, None)
+        params[SORT_PARAM] = f"-{field}" if active and not descending else field
+        links[field] = SortLink(params.urlencode(), active, descending)
+    return links
+
+
+def sort_queryset(request, queryset):
+    """
+    Ordena un queryset según `?sort=`, con el mismo criterio que los listados, para
+    recorrerlo completo (exportaciones y listados en streaming).
+
+    Args:
+        request (HttpRequest): La request actual.
+        queryset (QuerySet): El queryset a ordenar.
+
+    Returns:
+        QuerySet: El queryset ordenado (por id si no se pidió un orden válido).
+    """
+    ordering = sort_ordering(get_sort(request, queryset.model))
+    selective = len(request.GET.get("q", "").strip()) >= SELECTIVE_TERM_LENGTH
+    if selective and queryset.query.has_filters() and ordering[0].removeprefix("-") == TIEBREAKER:
+        # Sin estadísticas (ANALYZE), SQLite prefiere recorrer la tabla completa en el orden
+        # del id antes que buscar con los índices del filtro y ordenar solo lo encontrado.
+        # `id + 0` no se puede leer en orden desde la tabla, así que se usan los índices.
+        # Con términos cortos se mantiene el recorrido en orden: ordenar aparte todas las
+        # filas encontradas demoraría la primera fila del streaming y de la exportación.
+        expression = F(TIEBREAKER) + 0
+        return queryset.order_by(expression.desc() if ordering[0].startswith("-") else expression.asc())
+    return queryset.order_by(*ordering)
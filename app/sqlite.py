@@ -0,0 +1,42 @@
+from django.conf import settings
+
+
+def pragma_statements(pragmas):
+    """
+    Arma las sentencias `PRAGMA` que configuran una conexión a SQLite.
+
+    Args:
+        pragmas (dict): Nombre y valor de cada pragma, como en `SQLITE_PRAGMAS`.
+
+    Returns:
+        list: Las sentencias, en el orden del diccionario.
+    """
+    return [f"PRAGMA {name} = {value}" for name, value in pragmas.items()]
+
+
+def configure_connection(sender, connection, **kwargs):
+    """
+    Aplica `SQLITE_PRAGMAS` a cada conexión nueva a SQLite (señal `connection_created`).
+
+    Con el perfil de producción la base usa WAL: los lectores leen la última versión
+    confirmada sin esperar al escritor y el escritor no espera a los lectores, en lugar de
+    serializarse todos detrás del journal de rollback. `synchronous=NORMAL` hace el fsync
+    en los checkpoints y no en cada COMMIT (en WAL no arriesga la integridad, solo las
+    últimas transacciones ante un corte de energía), `busy_timeout` hace que una escritura
+    concurrente espere en lugar de fallar con "database is locked", y `mmap_size`,
+    `cache_size` y `temp_store` mantienen las páginas y las tablas temporales en memoria.
+
+    Las conexiones a otros motores no se modifican, y tampoco las que el backend
+    `app.backends.sqlite_pool` reutiliza del pool: los PRAGMA quedan aplicados en la
+    conexión desde que se abrió.
+
+    Args:
+        sender (type): La clase de la conexión.
+        connection (BaseDatabaseWrapper): La conexión recién abierta.
+    """
+    if connection.vendor != "sqlite" or getattr(connection, "reused_connection", False):
+        return
+
+    with connection.cursor() as cursor:
+        for statement in pragma_statements(settings.SQLITE_PRAGMAS):
+            cursor.execute(statement)
@@ -0,0 +1,73 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.middleware.csrf import get_token
+from django.template.loader import get_template, render_to_string
+from django.utils.safestring import mark_safe
+
+from .page_cache import CSRF_PLACEHOLDER
+
+# Marca que el template del listado deja en el <tbody> cuando se renderiza en modo
+# streaming; el HTML se corta en ese punto para enviar las filas en el medio.
+STREAM_MARKER = "<!-- vetsoft:stream-rows -->"
+
+
+def stream_repository(request, template, rows_template, name, queryset, context=None):
+    """
+    Genera un listado como `StreamingHttpResponse`.
+
+    El encabezado de la página se envía de inmediato y las filas se renderizan en bloques
+    de `REPOSITORY_STREAM_CHUNK_SIZE` a partir de `queryset.iterator()`, por lo que la
+    memoria del worker no crece con el tamaño de la tabla.
+
+    Args:
+        request (HttpRequest): La request actual.
+        template (str): El template de la página completa (por ejemplo "clients/repository.html").
+        rows_template (str): El template que renderiza las filas (por ejemplo "clients/rows.html").
+        name (str): Nombre de la variable de contexto con las filas (por ejemplo "clients").
+        queryset (QuerySet): Las filas a enviar, ya ordenadas.
+        context (dict): Contexto adicional para la página.
+
+    Returns:
+        StreamingHttpResponse: La respuesta que se envía a medida que se genera.
+    """
+    chunk_size = settings.REPOSITORY_STREAM_CHUNK_SIZE
+    page = render_to_string(
+        template,
+        {**(context or {}), name: [], "stream_marker": mark_safe(STREAM_MARKER)},
+        request,
+    )
+    head, tail = page.split(STREAM_MARKER, 1)
+
+    rows = get_template(rows_template)
+    # Las filas se renderizan sin la request para no ejecutar los context processors
+    # en cada bloque; el único dato de la request que usan es el token CSRF, que se
+    # inserta después de renderizar para no guardarlo en el cache de fragmentos.
+    token = get_token(request)
+    rows_context = {
+        "csrf_token": CSRF_PLACEHOLDER,
+        "row_cache_timeout": settings.REPOSITORY_ROW_CACHE_TIMEOUT,
+    }
+
+    def render_rows(chunk):
+        """Renderiza un bloque de filas con el token CSRF de la request."""
+        return rows.render({**rows_context, name: chunk}).replace(CSRF_PLACEHOLDER, token)
+
+    def generate():
+        """Emite el encabezado, las filas en bloques y el cierre de la página."""
+        yield head
+
+        chunk = []
+        sent = False
+        for row in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(row)
+            if len(chunk) == chunk_size:
+                yield render_rows(chunk)
+                sent = True
+                chunk = []
+
+        if chunk or not sent:
+            yield render_rows(chunk)
+
+        yield tail
+
+    return StreamingHttpResponse(generate(), content_type="text/html; charset=utf-8")
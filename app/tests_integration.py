@@ -1,9 +1,32 @@
+import csv
 import datetime
-
+import json
+import re
+import tempfile
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.shortcuts import reverse
-from django.test import TestCase
-
-from app.models import City, Client, Medicine, Pet, Product, Provider, Speciality, Vet
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from app.models import (
+    City,
+    Client,
+    ImportJob,
+    ImportStatus,
+    Medicine,
+    Pet,
+    Product,
+    Provider,
+    Speciality,
+    Vet,
+)
+from app.page_cache import CSRF_PLACEHOLDER
+from app.pagination import encode_cursor
+from app.sorting import sort_ordering
 
 
 class HomePageTest(TestCase):
@@ -1460,4 +1483,981 @@ class MedicinesTest(TestCase):
             },
         )
 
-        self.assertContains(response, "El nombre debe contener solo letras y espacios")
\ No newline at end of file
+        self.assertContains(response, "El nombre debe contener solo letras y espacios")
+
+@override_settings(REPOSITORY_PAGE_SIZE=2)
+class RepositoryPaginationTest(TestCase):
+    """
+    Pruebas para la paginación por cursor de los listados.
+    """
+
+    def setUp(self):
+        """Crea cinco clientes para recorrer el listado en varias páginas."""
+        for name in ["Ana", "Bruno", "Carla", "Dario", "Elena"]:
+            Client.objects.create(
+                name=name,
+                phone="54221555232",
+                email=f"{name.lower()}@vetsoft.com",
+                city="La Plata",
+            )
+
+    def names(self, response):
+        """Retorna los nombres de los clientes de la página renderizada."""
+        return [client.name for client in response.context["clients"]]
+
+    def test_first_page_is_limited_by_page_size(self):
+        """Prueba que la primera página muestre solo la cantidad de filas configurada."""
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertEqual(self.names(response), ["Ana", "Bruno"])
+        self.assertFalse(response.context["page"].has_previous)
+        self.assertTrue(response.context["page"].has_next)
+        self.assertContains(response, "Siguiente")
+
+    def test_can_walk_forward_and_back(self):
+        """Prueba que los cursores permitan avanzar y volver entre páginas."""
+        first = self.client.get(reverse("clients_repo"))
+        second = self.client.get(
+            f"{reverse('clients_repo')}?{first.context['page'].next_query}",
+        )
+        third = self.client.get(
+            f"{reverse('clients_repo')}?{second.context['page'].next_query}",
+        )
+
+        self.assertEqual(self.names(second), ["Carla", "Dario"])
+        self.assertEqual(self.names(third), ["Elena"])
+        self.assertFalse(third.context["page"].has_next)
+
+        back = self.client.get(
+            f"{reverse('clients_repo')}?{third.context['page'].previous_query}",
+        )
+        self.assertEqual(self.names(back), ["Carla", "Dario"])
+        self.assertTrue(back.context["page"].has_previous)
+
+    def test_page_size_parameter(self):
+        """Prueba que `page_size` permita elegir el tamaño de página."""
+        response = self.client.get(reverse("clients_repo"), {"page_size": "4"})
+
+        self.assertEqual(self.names(response), ["Ana", "Bruno", "Carla", "Dario"])
+
+    @override_settings(REPOSITORY_MAX_PAGE_SIZE=3)
+    def test_page_size_is_capped(self):
+        """Prueba que `page_size` no supere el máximo configurado."""
+        response = self.client.get(reverse("clients_repo"), {"page_size": "1000"})
+
+        self.assertEqual(len(self.names(response)), 3)
+
+    def test_invalid_cursor_returns_first_page(self):
+        """Prueba que un cursor inválido muestre la primera página."""
+        response = self.client.get(reverse("clients_repo"), {"after": "no-es-un-cursor"})
+
+        self.assertEqual(self.names(response), ["Ana", "Bruno"])
+
+    def test_cursor_with_invalid_value_returns_first_page(self):
+        """Prueba que un cursor bien formado con un valor del tipo equivocado muestre la primera página."""
+        response = self.client.get(reverse("clients_repo"), {"after": encode_cursor(["abc"])})
+
+        self.assertEqual(self.names(response), ["Ana", "Bruno"])
+
+    def test_every_repository_is_paginated(self):
+        """Prueba que todos los listados expongan la página en el contexto."""
+        for name in [
+            "clients_repo",
+            "providers_repo",
+            "medicine_repo",
+            "products_repo",
+            "pets_repo",
+            "vets_repo",
+        ]:
+            response = self.client.get(reverse(name))
+            self.assertIn("page", response.context)
+
+
+@override_settings(REPOSITORY_PAGE_SIZE=2)
+class RepositorySortTest(TestCase):
+    """
+    Pruebas para el orden `?sort=` de los listados.
+    """
+
+    def setUp(self):
+        """Crea clientes con ciudades repetidas para ejercitar el desempate por id."""
+        for name, city in [
+            ("Ana", "La Plata"),
+            ("Bruno", "Berisso"),
+            ("Carla", "Ensenada"),
+            ("Dario", "Berisso"),
+            ("Elena", "La Plata"),
+        ]:
+            Client.objects.create(
+                name=name,
+                phone="54221555232",
+                email=f"{name.lower()}@vetsoft.com",
+                city=city,
+            )
+
+    def names(self, response):
+        """Retorna los nombres de los clientes de la página renderizada."""
+        return [client.name for client in response.context["clients"]]
+
+    def walk(self, params):
+        """Recorre todas las páginas del listado de clientes y retorna los nombres."""
+        response = self.client.get(reverse("clients_repo"), params)
+        names = self.names(response)
+        while response.context["page"].has_next:
+            response = self.client.get(
+                f"{reverse('clients_repo')}?{response.context['page'].next_query}",
+            )
+            names += self.names(response)
+        return names
+
+    def test_sort_by_city_breaks_ties_by_id(self):
+        """Prueba que el orden por ciudad desempate por id a lo largo de las páginas."""
+        self.assertEqual(
+            self.walk({"sort": "city"}), ["Bruno", "Dario", "Carla", "Ana", "Elena"],
+        )
+
+    def test_sort_by_city_descending(self):
+        """Prueba que el prefijo "-" invierta el orden, incluido el desempate."""
+        self.assertEqual(
+            self.walk({"sort": "-city"}), ["Elena", "Ana", "Carla", "Dario", "Bruno"],
+        )
+
+    def test_unindexed_column_is_ignored(self):
+        """Prueba que una columna sin índice se ignore y se use el orden por id."""
+        response = self.client.get(reverse("clients_repo"), {"sort": "name"})
+
+        self.assertEqual(self.names(response), ["Ana", "Bruno"])
+        self.assertEqual(response.context["sort"], "")
+
+    def test_sort_is_kept_in_pagination_and_search(self):
+        """Prueba que los enlaces de paginación y la búsqueda conserven el orden."""
+        response = self.client.get(reverse("clients_repo"), {"sort": "-city"})
+
+        self.assertIn("sort=-city", response.context["page"].next_query)
+        self.assertContains(response, 'name="sort" value="-city"')
+
+    def test_header_link_toggles_direction(self):
+        """Prueba que la cabecera de la columna activa invierta la dirección."""
+        response = self.client.get(reverse("clients_repo"), {"sort": "city"})
+
+        self.assertEqual(response.context["sorting"]["city"].query, "sort=-city")
+        self.assertTrue(response.context["sorting"]["city"].active)
+
+    def test_every_model_sorts_by_its_indexed_column(self):
+        """Prueba que cada listado ordene por su columna indexada."""
+        Vet.objects.create(
+            name="Zoe", email="zoe@vetsoft.com", phone="54221", speciality="Urgencias",
+        )
+        Vet.objects.create(
+            name="Ariel", email="ariel@vetsoft.com", phone="54221", speciality="Oftalmologia",
+        )
+        Product.objects.create(name="Caro", type="Alimento", price=30)
+        Product.objects.create(name="Barato", type="Alimento", price=10)
+        Pet.objects.create(name="Joven", breed="Labrador", birthday="2022-01-01")
+        Pet.objects.create(name="Viejo", breed="Labrador", birthday="2015-01-01")
+        Medicine.objects.create(name="Fuerte", description="Oral", dose=9)
+        Medicine.objects.create(name="Suave", description="Oral", dose=1)
+
+        for url, sort, name, expected in [
+            ("vets_repo", "speciality", "vets", ["Ariel", "Zoe"]),
+            ("products_repo", "price", "products", ["Barato", "Caro"]),
+            ("pets_repo", "birthday", "pets", ["Viejo", "Joven"]),
+            ("medicine_repo", "dose", "medicines", ["Suave", "Fuerte"]),
+        ]:
+            response = self.client.get(reverse(url), {"sort": sort})
+            self.assertEqual([row.name for row in response.context[name]], expected)
+
+    def test_sort_uses_composite_index(self):
+        """Prueba que el orden por columna + id se resuelva con el índice, sin ordenar aparte."""
+        for sort in ["city", "-city"]:
+            plan = Client.objects.order_by(*sort_ordering(sort))[:3].explain()
+
+            self.assertIn("app_client_city_id_idx", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_sorted_stream(self):
+        """Prueba que el streaming respete el orden pedido."""
+        response = self.client.get(reverse("clients_repo"), {"sort": "-city", "stream": "1"})
+        content = b"".join(response.streaming_content).decode()
+
+        positions = [content.index(name) for name in ["Elena", "Ana", "Carla", "Dario", "Bruno"]]
+        self.assertEqual(positions, sorted(positions))
+
+
+class RepositoryExportTest(TestCase):
+    """
+    Pruebas para la exportación CSV / JSON Lines de los listados.
+    """
+
+    def setUp(self):
+        """Crea clientes de ejemplo."""
+        Client.objects.create(
+            name="Juan Sebastian Veron",
+            phone="54221555232",
+            email="brujita75@vetsoft.com",
+            city="La Plata",
+        )
+        Client.objects.create(
+            name="Guido Carrillo",
+            phone="54221232555",
+            email="goleador@vetsoft.com",
+            city="Berisso",
+        )
+
+    def content(self, response):
+        """Consume la respuesta en streaming y retorna el texto completo."""
+        return b"".join(response.streaming_content).decode()
+
+    def test_export_csv(self):
+        """Prueba que el CSV incluya un encabezado y todas las filas."""
+        response = self.client.get(reverse("clients_export", args=["csv"]))
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn('filename="clientes.csv"', response["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(self.content(response))))
+        self.assertEqual([row["name"] for row in rows], ["Juan Sebastian Veron", "Guido Carrillo"])
+        self.assertEqual(rows[1]["city"], "Berisso")
+
+    def test_export_jsonl(self):
+        """Prueba que cada línea del JSON Lines sea un objeto con las columnas del modelo."""
+        response = self.client.get(reverse("clients_export", args=["jsonl"]))
+
+        lines = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0]["email"], "brujita75@vetsoft.com")
+        self.assertIn("updated_at", lines[0])
+
+    def test_export_respects_search_and_sort(self):
+        """Prueba que la exportación aplique `?q=` y `?sort=` como el listado."""
+        Client.objects.create(
+            name="Juan Roman Riquelme", phone="54221000000", email="jr@vetsoft.com", city="Ensenada",
+        )
+
+        response = self.client.get(
+            reverse("clients_export", args=["jsonl"]), {"q": "juan", "sort": "-city"},
+        )
+
+        names = [json.loads(line)["name"] for line in self.content(response).splitlines()]
+        self.assertEqual(names, ["Juan Sebastian Veron", "Juan Roman Riquelme"])
+
+    def test_export_in_several_chunks(self):
+        """Prueba que la exportación envíe las filas en bloques sin perder ninguna."""
+        with override_settings(REPOSITORY_STREAM_CHUNK_SIZE=1):
+            response = self.client.get(reverse("clients_export", args=["csv"]))
+            chunks = list(response.streaming_content)
+
+        self.assertGreater(len(chunks), 2)
+        self.assertEqual(b"".join(chunks).decode().count("@vetsoft.com"), 2)
+
+    def test_unknown_format(self):
+        """Prueba que un formato desconocido responda 404."""
+        response = self.client.get(reverse("clients_export", args=["xml"]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_every_model_can_be_exported(self):
+        """Prueba que todos los listados tengan su exportación y un enlace a ella."""
+        for name in [
+            "clients",
+            "providers",
+            "medicine",
+            "products",
+            "pets",
+            "vets",
+        ]:
+            export = self.client.get(reverse(f"{name}_export", args=["csv"]))
+            self.assertEqual(export.status_code, 200)
+            self.assertIn(b"id,name", b"".join(export.streaming_content))
+
+            repository = self.client.get(reverse(f"{name}_repo"))
+            self.assertContains(repository, reverse(f"{name}_export", args=["jsonl"]))
+
+
+class RepositoryBulkDeleteTest(TestCase):
+    """
+    Pruebas para la eliminación de los registros seleccionados en los listados.
+    """
+
+    def setUp(self):
+        """Crea cinco mascotas de ejemplo."""
+        self.pets = [
+            Pet.objects.create(name=name, breed="Labrador", birthday="2020-01-01")
+            for name in ["Ana", "Bruno", "Carla", "Dario", "Elena"]
+        ]
+
+    def test_deletes_selected_ids_and_reports_the_count(self):
+        """Prueba que se eliminen solo los seleccionados y se informe la cantidad."""
+        response = self.client.post(
+            reverse("pets_bulk_delete"), {"ids": [self.pets[0].id, self.pets[2].id]},
+        )
+
+        self.assertRedirects(response, f"{reverse('pets_repo')}?deleted=2")
+        self.assertEqual(
+            list(Pet.objects.values_list("name", flat=True)), ["Bruno", "Dario", "Elena"],
+        )
+
+        listing = self.client.get(response.url)
+        self.assertContains(listing, "Se eliminaron 2 registros.")
+
+    def test_ignores_invalid_and_missing_ids(self):
+        """Prueba que los ids inválidos o inexistentes no cuenten como eliminados."""
+        response = self.client.post(
+            reverse("pets_bulk_delete"), {"ids": [self.pets[1].id, "abc", "999999"]},
+        )
+
+        self.assertRedirects(response, f"{reverse('pets_repo')}?deleted=1")
+        self.assertEqual(Pet.objects.count(), 4)
+
+    def test_uses_a_single_delete_query(self):
+        """Prueba que la eliminación no cargue las instancias (un solo DELETE)."""
+        ids = [pet.id for pet in self.pets]
+
+        with self.assertNumQueries(3):
+            # SAVEPOINT, DELETE ... WHERE id IN (...) y RELEASE SAVEPOINT
+            self.client.post(reverse("pets_bulk_delete"), {"ids": ids})
+
+        self.assertEqual(Pet.objects.count(), 0)
+
+    def test_requires_post(self):
+        """Prueba que la eliminación múltiple no se pueda hacer con GET."""
+        response = self.client.get(reverse("pets_bulk_delete"), {"ids": self.pets[0].id})
+
+        self.assertEqual(response.status_code, 405)
+        self.assertEqual(Pet.objects.count(), 5)
+
+    def test_changes_the_etag(self):
+        """Prueba que la eliminación múltiple invalide las respuestas condicionales."""
+        etag = self.client.get(reverse("pets_repo"))["ETag"]
+
+        self.client.post(reverse("pets_bulk_delete"), {"ids": [self.pets[0].id]})
+
+        self.assertNotEqual(self.client.get(reverse("pets_repo"))["ETag"], etag)
+
+    def test_deleted_notice_is_not_kept_in_links(self):
+        """Prueba que el aviso de eliminación no se arrastre a la paginación ni al orden."""
+        with override_settings(REPOSITORY_PAGE_SIZE=2):
+            response = self.client.get(reverse("pets_repo"), {"deleted": "1"})
+
+        self.assertNotIn("deleted", response.context["page"].next_query)
+        self.assertNotIn("deleted", response.context["sorting"]["birthday"].query)
+
+    def test_every_repository_has_checkboxes(self):
+        """Prueba que todos los listados tengan la selección y el formulario de eliminación."""
+        Client.objects.create(name="Ana", phone="54221", email="ana@vetsoft.com", city="La Plata")
+        Provider.objects.create(name="Pedro", email="p@vetsoft.com", city="Berisso")
+        Medicine.objects.create(name="Ibuprofeno", description="Oral", dose=5)
+        Product.objects.create(name="Alimento", type="Comida", price=10)
+        Vet.objects.create(name="Vera", email="v@vetsoft.com", phone="54221", speciality="Urgencias")
+
+        for name in ["clients", "providers", "medicine", "products", "pets", "vets"]:
+            response = self.client.get(reverse(f"{name}_repo"))
+            self.assertContains(response, f'action="{reverse(f"{name}_bulk_delete")}"')
+            self.assertContains(response, 'name="ids"')
+
+
+class ImportJobViewsTest(TestCase):
+    """
+    Pruebas para la subida de CSV y el avance de las importaciones en segundo plano.
+    """
+
+    def setUp(self):
+        """Usa un directorio temporal para los archivos y ejecuta las importaciones en el momento."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(override_settings(IMPORT_JOBS_DIR=directory.name, IMPORT_JOB_WORKERS=0))
+
+    def upload(self, content, model="pets", **data):
+        """Sube un CSV desde el formulario de importaciones."""
+        upload = SimpleUploadedFile("mascotas.csv", content.encode("utf-8"), "text/csv")
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(reverse("imports_repo"), {"model": model, "file": upload, **data})
+
+    def test_job_starts_after_the_commit(self):
+        """Prueba que la importación se encole recién cuando se confirma la transacción."""
+        upload = SimpleUploadedFile("mascotas.csv", b"name,breed,birthday\n", "text/csv")
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(reverse("imports_repo"), {"model": "pets", "file": upload})
+
+        self.assertEqual(ImportJob.objects.get().status, ImportStatus.pending.name)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_upload_creates_the_job_and_redirects_to_its_progress(self):
+        """Prueba que la subida cree la importación y redirija a la página de avance."""
+        response = self.upload(
+            "name,breed,birthday\n"
+            "Roma,Labrador,2020-01-01\n"
+            "Luna,,2020-01-01\n",
+        )
+
+        job = ImportJob.objects.get()
+        self.assertRedirects(response, reverse("imports_detail", args=[job.id]))
+        self.assertEqual(Pet.objects.get().name, "Roma")
+
+        detail = self.client.get(response.url)
+        self.assertContains(detail, "Importación de mascotas")
+        self.assertContains(detail, reverse("imports_progress", args=[job.id]))
+
+    def test_progress_endpoint(self):
+        """Prueba que el avance se informe en JSON."""
+        self.upload("name,breed,birthday\nRoma,Labrador,2020-01-01\nLuna,,2020-01-01\n")
+        job = ImportJob.objects.get()
+
+        response = self.client.get(reverse("imports_progress", args=[job.id]))
+
+        progress = response.json()
+        self.assertEqual(progress["status"], ImportStatus.done.name)
+        self.assertTrue(progress["finished"])
+        self.assertEqual((progress["rows"], progress["imported"], progress["rejected"]), (2, 1, 1))
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_rejected_rows_download(self):
+        """Prueba que se descarguen las filas rechazadas con el motivo."""
+        self.upload("name,breed,birthday\nLuna,,2020-01-01\n")
+        job = ImportJob.objects.get()
+
+        response = self.client.get(reverse("imports_rejected", args=[job.id]))
+
+        content = b"".join(response.streaming_content).decode("utf-8")
+        self.assertIn("attachment", response["Content-Disposition"])
+        self.assertIn("breed: Por favor ingrese una raza", content)
+
+    def test_upload_errors(self):
+        """Prueba que se informe si falta el archivo o el modelo no admite upsert."""
+        response = self.client.post(reverse("imports_repo"), {"model": "otro"})
+        self.assertContains(response, "Por favor seleccione qué importar")
+        self.assertContains(response, "Por favor seleccione un archivo CSV")
+
+        response = self.upload("name,breed,birthday\n", upsert="on")
+        self.assertContains(response, "La actualización por email solo está disponible")
+        self.assertFalse(ImportJob.objects.exists())
+
+    def test_repository_lists_recent_jobs(self):
+        """Prueba que el listado muestre las importaciones recientes."""
+        self.upload("name,breed,birthday\nRoma,Labrador,2020-01-01\n")
+
+        response = self.client.get(reverse("imports_repo"))
+
+        self.assertContains(response, "Mascotas")
+        self.assertContains(response, "Terminada")
+
+
+class RepositorySearchTest(TestCase):
+    """
+    Pruebas para la búsqueda `?q=` de los listados de clientes y mascotas.
+    """
+
+    def setUp(self):
+        """Crea clientes y mascotas de ejemplo."""
+        Client.objects.create(
+            name="Juan Sebastian Veron",
+            phone="54221555232",
+            email="brujita75@vetsoft.com",
+            city="La Plata",
+        )
+        Client.objects.create(
+            name="Guido Carrillo",
+            phone="54221232555",
+            email="goleador@vetsoft.com",
+            city="Berisso",
+        )
+        Pet.objects.create(name="Roma", breed="Labrador", birthday="2020-01-01")
+        Pet.objects.create(name="Luna", breed="Caniche", birthday="2021-01-01")
+
+    def test_search_clients_by_name_prefix_ignoring_case(self):
+        """Prueba que se pueda buscar clientes por el comienzo del nombre."""
+        response = self.client.get(reverse("clients_repo"), {"q": "juan seb"})
+
+        self.assertContains(response, "Juan Sebastian Veron")
+        self.assertNotContains(response, "Guido Carrillo")
+
+    def test_search_clients_by_email(self):
+        """Prueba que se pueda buscar clientes por email."""
+        response = self.client.get(reverse("clients_repo"), {"q": "goleador"})
+
+        self.assertContains(response, "Guido Carrillo")
+        self.assertNotContains(response, "Juan Sebastian Veron")
+
+    def test_search_clients_by_phone(self):
+        """Prueba que se pueda buscar clientes por el comienzo del teléfono."""
+        response = self.client.get(reverse("clients_repo"), {"q": "5422123"})
+
+        self.assertContains(response, "Guido Carrillo")
+        self.assertNotContains(response, "Juan Sebastian Veron")
+
+    def test_search_without_results(self):
+        """Prueba que una búsqueda sin resultados muestre el mensaje de listado vacío."""
+        response = self.client.get(reverse("clients_repo"), {"q": "zzz"})
+
+        self.assertContains(response, "No existen clientes")
+
+    def test_search_pets_by_name_or_breed(self):
+        """Prueba que se pueda buscar mascotas por nombre o raza."""
+        by_name = self.client.get(reverse("pets_repo"), {"q": "lu"})
+        by_breed = self.client.get(reverse("pets_repo"), {"q": "LABRA"})
+
+        self.assertContains(by_name, "Luna")
+        self.assertNotContains(by_name, "Roma")
+        self.assertContains(by_breed, "Roma")
+        self.assertNotContains(by_breed, "Luna")
+
+    @override_settings(REPOSITORY_PAGE_SIZE=1)
+    def test_pagination_keeps_the_search(self):
+        """Prueba que los enlaces de paginación conserven el término buscado."""
+        Client.objects.create(
+            name="Juan Roman Riquelme",
+            phone="54221000000",
+            email="torero@vetsoft.com",
+            city="La Plata",
+        )
+        response = self.client.get(reverse("clients_repo"), {"q": "juan"})
+
+        self.assertIn("q=juan", response.context["page"].next_query)
+
+
+@override_settings(REPOSITORY_STREAM_CHUNK_SIZE=2)
+class RepositoryStreamingTest(TestCase):
+    """
+    Pruebas para el modo streaming (`?stream=1`) de los listados.
+    """
+
+    def content(self, response):
+        """Consume la respuesta en streaming y retorna el HTML completo."""
+        return b"".join(response.streaming_content).decode()
+
+    def test_stream_sends_every_row_in_order(self):
+        """Prueba que el streaming envíe todas las filas, sin paginar y en orden."""
+        for name in ["Ana", "Bruno", "Carla", "Dario", "Elena"]:
+            Pet.objects.create(name=name, breed="Labrador", birthday="2020-01-01")
+
+        response = self.client.get(reverse("pets_repo"), {"stream": "1"})
+
+        self.assertTrue(response.streaming)
+        html = self.content(response)
+        positions = [html.index(name) for name in ["Ana", "Bruno", "Carla", "Dario", "Elena"]]
+        self.assertEqual(positions, sorted(positions))
+        self.assertIn("<h1 class=\"mb-4\">Mascotas</h1>", html)
+        self.assertIn("</html>", html)
+        self.assertNotIn("Siguiente", html)
+
+    def test_stream_empty_repository(self):
+        """Prueba que el streaming de un listado vacío muestre el mensaje correspondiente."""
+        response = self.client.get(reverse("vets_repo"), {"stream": "1"})
+
+        self.assertIn("No existen veterinarios", self.content(response))
+
+    def test_stream_keeps_the_search(self):
+        """Prueba que el streaming respete el filtro `?q=`."""
+        Client.objects.create(
+            name="Juan Sebastian Veron",
+            phone="54221555232",
+            email="brujita75@vetsoft.com",
+            city="La Plata",
+        )
+        Client.objects.create(
+            name="Guido Carrillo",
+            phone="54221232555",
+            email="goleador@vetsoft.com",
+            city="Berisso",
+        )
+
+        response = self.client.get(reverse("clients_repo"), {"stream": "1", "q": "guido"})
+        html = self.content(response)
+
+        self.assertIn("Guido Carrillo", html)
+        self.assertNotIn("Juan Sebastian Veron", html)
+
+    def test_stream_rows_include_csrf_token(self):
+        """Prueba que los formularios de eliminación enviados en streaming incluyan el token CSRF."""
+        Product.objects.create(name="Alimento", type="Comida", price=10)
+
+        response = self.client.get(reverse("products_repo"), {"stream": "1"})
+
+        self.assertIn("csrfmiddlewaretoken", self.content(response))
+
+
+class RepositoryProjectionTest(TestCase):
+    """
+    Pruebas para la proyección de columnas de los listados.
+    """
+
+    def test_listing_rows_are_lightweight_tuples(self):
+        """Prueba que el listado reciba tuplas con las columnas del template y no instancias."""
+        Vet.objects.create(
+            name="Mariano Serrano",
+            email="mariano@vetsoft.com",
+            phone="54221555232",
+            speciality="Urgencias",
+        )
+
+        response = self.client.get(reverse("vets_repo"))
+        vet = list(response.context["vets"])[0]
+
+        self.assertNotIsInstance(vet, Vet)
+        self.assertEqual(vet._fields, Vet.listing_fields)
+        self.assertEqual(vet.name, "Mariano Serrano")
+        self.assertContains(response, "Mariano Serrano")
+        self.assertContains(response, reverse("vets_edit", kwargs={"id": vet.id}))
+
+
+class RepositoryConditionalGetTest(TestCase):
+    """
+    Pruebas para las respuestas condicionales (ETag / Last-Modified) de los listados.
+    """
+
+    def setUp(self):
+        """Limpia el cache para que cada prueba parta de versiones nuevas."""
+        cache.clear()
+
+    def test_repository_sends_validators(self):
+        """Prueba que el listado envíe ETag, Last-Modified y Cache-Control."""
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertTrue(response.has_header("ETag"))
+        self.assertTrue(response.has_header("Last-Modified"))
+        self.assertIn("no-cache", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+
+    def test_unchanged_repository_answers_304_without_queries(self):
+        """Prueba que un listado sin cambios responda 304 sin consultar la base."""
+        etag = self.client.get(reverse("pets_repo"))["ETag"]
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("pets_repo"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_if_modified_since(self):
+        """Prueba que `If-Modified-Since` con la fecha entregada responda 304."""
+        last_modified = self.client.get(reverse("vets_repo"))["Last-Modified"]
+
+        response = self.client.get(
+            reverse("vets_repo"), HTTP_IF_MODIFIED_SINCE=last_modified,
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_save_changes_the_etag(self):
+        """Prueba que crear un cliente invalide el ETag del listado."""
+        etag = self.client.get(reverse("clients_repo"))["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Client.save_client(
+                {
+                    "name": "Juan Sebastian Veron",
+                    "phone": "54221555232",
+                    "city": "La Plata",
+                    "email": "brujita75@vetsoft.com",
+                },
+            )
+        response = self.client.get(reverse("clients_repo"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertContains(response, "Juan Sebastian Veron")
+
+    def test_update_changes_the_etag(self):
+        """Prueba que editar un producto invalide el ETag del listado."""
+        product = Product.objects.create(name="Alimento", type="Comida", price=10)
+        etag = self.client.get(reverse("products_repo"))["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            product.update_product({"name": "Juguete", "type": "Comida", "price": "20"})
+        response = self.client.get(reverse("products_repo"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_delete_changes_the_etag(self):
+        """Prueba que eliminar un proveedor invalide el ETag del listado."""
+        provider = Provider.objects.create(
+            name="Pedro", email="pedro@vetsoft.com", city="La Plata",
+        )
+        etag = self.client.get(reverse("providers_repo"))["ETag"]
+
+        self.client.post(reverse("providers_delete"), {"provider_id": provider.id})
+        response = self.client.get(reverse("providers_repo"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, "pedro@vetsoft.com")
+
+    def test_versions_are_per_model(self):
+        """Prueba que escribir un modelo no invalide el listado de otro."""
+        etag = self.client.get(reverse("medicine_repo"))["ETag"]
+
+        Pet.save_pet({"name": "Roma", "breed": "Labrador", "birthday": "2020-01-01"})
+        response = self.client.get(reverse("medicine_repo"), HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(REPOSITORY_CACHE_TIMEOUT=60)
+class RepositoryPageCacheTest(TestCase):
+    """
+    Pruebas para el cache del HTML de los listados.
+    """
+
+    def setUp(self):
+        """Limpia el cache y crea un cliente de ejemplo."""
+        cache.clear()
+        Client.save_client(
+            {
+                "name": "Juan Sebastian Veron",
+                "phone": "54221555232",
+                "city": "La Plata",
+                "email": "brujita75@vetsoft.com",
+            },
+        )
+
+    def test_second_request_is_served_from_cache(self):
+        """Prueba que una página ya renderizada se sirva sin consultar la base."""
+        self.client.get(reverse("clients_repo"))
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse("clients_repo"))
+
+        self.assertContains(response, "Juan Sebastian Veron")
+
+    def test_query_parameters_are_part_of_the_key(self):
+        """Prueba que cada búsqueda tenga su propia entrada en el cache."""
+        self.client.get(reverse("clients_repo"))
+
+        response = self.client.get(reverse("clients_repo"), {"q": "zzz"})
+
+        self.assertContains(response, "No existen clientes")
+
+    def test_write_invalidates_the_cached_page(self):
+        """Prueba que guardar un cliente invalide la página cacheada."""
+        self.client.get(reverse("clients_repo"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Client.save_client(
+                {
+                    "name": "Guido Carrillo",
+                    "phone": "54221232555",
+                    "city": "Berisso",
+                    "email": "goleador@vetsoft.com",
+                },
+            )
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertContains(response, "Guido Carrillo")
+
+    def test_delete_invalidates_the_cached_page(self):
+        """Prueba que eliminar un cliente invalide la página cacheada."""
+        self.client.get(reverse("clients_repo"))
+
+        client = Client.objects.get(name="Juan Sebastian Veron")
+        self.client.post(reverse("clients_delete"), {"client_id": client.id})
+        response = self.client.get(reverse("clients_repo"))
+
+        self.assertContains(response, "No existen clientes")
+
+    def test_cached_page_carries_the_csrf_token_of_each_user(self):
+        """Prueba que la página cacheada funcione con el token CSRF de otro usuario."""
+        self.client.get(reverse("clients_repo"))
+
+        browser = self.client_class(enforce_csrf_checks=True)
+        response = browser.get(reverse("clients_repo"))
+        html = response.content.decode()
+        marker = 'name="csrfmiddlewaretoken" value="'
+        token = html[html.index(marker) + len(marker):].split('"', 1)[0]
+
+        client = Client.objects.get(name="Juan Sebastian Veron")
+        response = browser.post(
+            reverse("clients_delete"),
+            {"client_id": client.id, "csrfmiddlewaretoken": token},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Client.objects.filter(pk=client.id).exists())
+
+
+class RepositoryRowCacheTest(TestCase):
+    """
+    Pruebas para el cache de fragmentos por fila de los listados.
+    """
+
+    def setUp(self):
+        """Limpia el cache y crea un producto de ejemplo."""
+        cache.clear()
+        self.product = Product.objects.create(name="Alimento", type="Comida", price=10)
+
+    def test_rows_are_reused_until_updated_at_changes(self):
+        """Prueba que una fila cacheada se reutilice hasta que cambie su `updated_at`."""
+        self.client.get(reverse("products_repo"))
+
+        # Un UPDATE directo no modifica `updated_at`, así que la fila cacheada sigue vigente
+        Product.objects.filter(pk=self.product.pk).update(name="Modificado")
+        response = self.client.get(reverse("products_repo"))
+        self.assertContains(response, "Alimento")
+
+        self.product.refresh_from_db()
+        self.product.update_product({"name": "Juguete", "type": "Comida", "price": "10"})
+        response = self.client.get(reverse("products_repo"))
+        self.assertContains(response, "Juguete")
+        self.assertNotContains(response, "Alimento")
+
+    @override_settings(REPOSITORY_ROW_CACHE_TIMEOUT=0)
+    def test_row_cache_can_be_disabled(self):
+        """Prueba que con timeout 0 las filas se rendericen siempre desde la base."""
+        self.client.get(reverse("products_repo"))
+
+        Product.objects.filter(pk=self.product.pk).update(name="Modificado")
+        response = self.client.get(reverse("products_repo"))
+
+        self.assertContains(response, "Modificado")
+
+    def test_cached_rows_use_the_csrf_token_of_each_request(self):
+        """Prueba que las filas cacheadas no guarden el token CSRF de quien las renderizó."""
+        first = self.client.get(reverse("products_repo")).content.decode()
+        second = self.client_class().get(reverse("products_repo")).content.decode()
+
+        marker = 'name="csrfmiddlewaretoken" value="'
+        self.assertNotIn(CSRF_PLACEHOLDER, second)
+        self.assertNotEqual(
+            first[first.index(marker):].split('"', 4)[3],
+            second[second.index(marker):].split('"', 4)[3],
+        )
+
+
+class FulltextSearchViewsTest(TestCase):
+    """
+    Pruebas para la página y el JSON de la búsqueda por palabras.
+    """
+
+    def setUp(self):
+        """Crea un cliente, una mascota y una medicina."""
+        Client.objects.create(name="Juan Sebastian Veron", phone=5422149, email="brujita75@vetsoft.com")
+        self.pet = Pet.objects.create(name="Veronica", breed="Labrador", birthday="2020-01-01")
+        Medicine.objects.create(name="Ibuprofeno", description="Antiinflamatorio oral", dose=5)
+
+    def test_search_page_lists_each_section(self):
+        """Prueba que la página muestre los resultados de cada sección con su link de edición."""
+        response = self.client.get(reverse("fulltext_repo"), {"q": "veron"})
+
+        self.assertTemplateUsed(response, "search/results.html")
+        self.assertContains(response, "Juan Sebastian Veron")
+        self.assertContains(response, reverse("pets_edit", args=[self.pet.id]))
+        self.assertContains(response, "Sin resultados")
+
+    def test_search_json(self):
+        """Prueba que el JSON agrupe los resultados por sección, con su relevancia."""
+        response = self.client.get(reverse("fulltext_json"), {"q": "antiinflamatorio"})
+
+        results = response.json()["results"]
+        self.assertEqual(results["clients"], [])
+        self.assertEqual(results["medicines"][0]["name"], "Ibuprofeno")
+        self.assertIsInstance(results["medicines"][0]["rank"], float)
+
+
+@override_settings(REPOSITORY_CACHE_TIMEOUT=0, REPOSITORY_ROW_CACHE_TIMEOUT=0)
+class QueryPlanTest(TestCase):
+    """
+    Pruebas que ejecutan `EXPLAIN QUERY PLAN` sobre cada consulta de los listados, búsquedas,
+    exportaciones e importaciones y fallan si alguna deja de usar los índices.
+
+    Una consulta con WHERE no puede recorrer la tabla completa (`SCAN app_...` sin índice),
+    y ninguna puede ordenar en memoria (`USE TEMP B-TREE`) salvo las búsquedas por varias
+    columnas, que combinan varios índices (`MULTI-INDEX OR`) y solo ordenan lo encontrado.
+    Los términos de búsqueda de las pruebas son selectivos (`SELECTIVE_TERM_LENGTH`); con
+    uno corto el streaming recorre la tabla en el orden del id (ver
+    `test_broad_search_streams_in_id_order`).
+    Sin WHERE, recorrer la tabla en el orden del id o de un índice es lo esperado: la
+    primera página lee las primeras filas y la exportación las lee todas.
+    """
+
+    # Listado, exportación, modelo y término de búsqueda (None si el listado no busca).
+    REPOSITORIES = (
+        ("clients_repo", "clients_export", Client, "juan"),
+        ("providers_repo", "providers_export", Provider, None),
+        ("medicine_repo", "medicine_export", Medicine, None),
+        ("products_repo", "products_export", Product, None),
+        ("pets_repo", "pets_export", Pet, "firu"),
+        ("vets_repo", "vets_export", Vet, None),
+    )
+
+    FULL_SCAN_RE = re.compile(r"SCAN (app_\w+)$")
+
+    def setUp(self):
+        """Crea un registro de cada modelo, usado para armar los cursores de paginación."""
+        cache.clear()
+        self.records = {
+            Client: Client.objects.create(name="Juan Sebastian Veron", phone=5422149, email="juan@vetsoft.com"),
+            Provider: Provider.objects.create(name="Distribuidora Sur", email="sur@vetsoft.com", city="La Plata"),
+            Medicine: Medicine.objects.create(name="Ibuprofeno", description="Antiinflamatorio", dose=5),
+            Product: Product.objects.create(name="Alimento", type="Alimento", price=10),
+            Pet: Pet.objects.create(name="Firulais", breed="Caniche", birthday="2020-01-01"),
+            Vet: Vet.objects.create(name="Ana Garcia", email="ana@vetsoft.com", phone=5422155, speciality="Urgencias"),
+        }
+
+    def urls(self):
+        """Arma las URLs de cada listado y exportación con sus combinaciones de orden, cursor y búsqueda."""
+        for repository, export, model, term in self.REPOSITORIES:
+            record = self.records[model]
+            params = [{}, {"after": encode_cursor([record.id])}, {"before": encode_cursor([record.id])}]
+            for field in getattr(model, "sort_fields", ()):
+                cursor = encode_cursor([getattr(record, field), record.id])
+                for sort in (field, f"-{field}"):
+                    params += [{"sort": sort}, {"sort": sort, "after": cursor}, {"sort": sort, "before": cursor}]
+            if term:
+                params += [{"q": term}, *({"q": term, "sort": sort} for sort in model.sort_fields), {"q": term, "sort": "-id"}]
+
+            for query in params:
+                yield reverse(repository), query
+                if "after" not in query and "before" not in query:
+                    yield reverse(repository), {**query, "stream": "1"}
+                    yield reverse(export, args=["csv"]), query
+
+        yield reverse("fulltext_repo"), {"q": "juan veron"}
+        yield reverse("imports_repo"), {}
+
+    def plans(self, url, query):
+        """Ejecuta la request y retorna el SQL y el plan de cada SELECT sobre las tablas de la aplicación."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, query)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200, (url, query))
+
+        for captured in queries.captured_queries:
+            sql = captured["sql"]
+            if not sql.startswith("SELECT") or "app_" not in sql:
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+                yield sql, [row[3] for row in cursor.fetchall()]
+
+    def test_queries_use_indexes(self):
+        """Prueba que ninguna consulta filtrada recorra la tabla completa ni ordene en memoria sin necesidad."""
+        checked = 0
+        for url, query in self.urls():
+            for sql, plan in self.plans(url, query):
+                checked += 1
+                with self.subTest(url=url, query=query, plan=plan):
+                    if " WHERE " in sql:
+                        self.assertFalse(
+                            [step for step in plan if self.FULL_SCAN_RE.match(step)],
+                            f"Recorre la tabla completa: {sql}",
+                        )
+                    if "MULTI-INDEX OR" not in plan:
+                        self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan, f"Ordena en memoria: {sql}")
+
+        self.assertGreater(checked, 100)
+
+    def test_broad_search_streams_in_id_order(self):
+        """Prueba que con un término corto el streaming y la exportación lean en orden, sin ordenar en memoria."""
+        for query in ({"q": "j", "stream": "1"}, {"q": "j", "sort": "-id", "stream": "1"}):
+            for sql, plan in self.plans(reverse("clients_repo"), query):
+                self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan, sql)
+        for sql, plan in self.plans(reverse("clients_export", args=["csv"]), {"q": "j"}):
+            self.assertNotIn("USE TEMP B-TREE FOR ORDER BY", plan, sql)
+            self.assertNotIn("+ 0", sql)
+
+    def test_detects_full_scan(self):
+        """Prueba que la verificación detecte una búsqueda sin índice."""
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN QUERY PLAN SELECT id FROM app_product WHERE type = 'Alimento'")
+            plan = [row[3] for row in cursor.fetchall()]
+
+        self.assertTrue([step for step in plan if self.FULL_SCAN_RE.match(step)])
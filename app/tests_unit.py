@@ -1,11 +1,48 @@
+import csv
 import datetime
-
-from django.core.exceptions import ValidationError
-from django.test import TestCase
-
+import itertools
+import sqlite3
+import tempfile
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.checks import run_checks
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection, connections, router, transaction
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import engines
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from app import jobs, validation
+from app.backends.sqlite_pool.base import (
+    ConnectionPool,
+    DatabaseWrapper,
+    get_pool,
+    pool_stats,
+)
+from app.bulk import bulk_delete
+from app.changes import changed_fields
+from app.checks import check_shared_cache
+from app.context_processors import navbar
+from app.fulltext import fulltext_search, match_expression, restore_triggers
+from app.imports import import_csv
+from app.jobs import run_job, spool_upload, start_job, unfinished_jobs
+from app.middleware import ReadYourWritesMiddleware, UnitOfWorkMiddleware
 from app.models import (
     City,
     Client,
+    ImportJob,
+    ImportStatus,
     Medicine,
     Pet,
     Product,
@@ -19,6 +56,12 @@ from app.models import (
     validate_provider,
     validate_vet,
 )
+from app.page_cache import render_cached
+from app.replicas import ReplicaRouter, data_version, replica_reads, sync_replica
+from app.sqlite import configure_connection, pragma_statements
+from app.unit_of_work import UnitOfWork, current_unit
+from app.versions import get_version
+from app.warmup import template_names, warm_up
 
 
 class ClientModelTest(TestCase):
@@ -1179,3 +1222,1304 @@ class MedicineModelTest(TestCase):
         medicine_updated = Medicine.objects.get(pk=1)
         
         self.assertEqual(medicine_updated.name, "Meloxicam")
+
+
+class BulkSaveTest(TestCase):
+    """
+    Pruebas para las cargas masivas `save_*_bulk` de los modelos.
+    """
+
+    def client_row(self, index):
+        """Retorna los datos válidos de un cliente para la fila `index`."""
+        return {
+            "name": "Cliente",
+            "phone": f"5422155{index:04d}",
+            "email": f"cliente{index}@vetsoft.com",
+            "city": "La Plata",
+        }
+
+    def test_saves_valid_rows_in_batches(self):
+        """Prueba que se guarden todas las filas válidas aunque ocupen varios lotes."""
+        rows = (self.client_row(index) for index in range(7))
+
+        created, errors = Client.save_client_bulk(rows, batch_size=3)
+
+        self.assertEqual(created, 7)
+        self.assertEqual(errors, {})
+        self.assertEqual(Client.objects.count(), 7)
+        self.assertEqual(Client.objects.filter(updated_at__isnull=True).count(), 0)
+
+    def test_reports_errors_by_row_and_skips_invalid_rows(self):
+        """Prueba que las filas inválidas se omitan y sus errores se informen por posición."""
+        rows = [
+            self.client_row(0),
+            {**self.client_row(1), "email": "sin-arroba"},
+            self.client_row(2),
+            {**self.client_row(3), "phone": "", "name": ""},
+        ]
+
+        created, errors = Client.save_client_bulk(rows)
+
+        self.assertEqual(created, 2)
+        self.assertEqual(list(errors), [1, 3])
+        self.assertEqual(errors[1], validate_client(rows[1]))
+        self.assertIn("phone", errors[3])
+        self.assertIn("name", errors[3])
+
+    def test_failed_batch_rolls_back_the_whole_load(self):
+        """Prueba que un error de la base en un lote no deje guardados los lotes anteriores."""
+        rows = [{"name": "Roma", "breed": "Labrador", "birthday": "2020-01-01"}] * 4
+        rows.append({"name": "Luna", "breed": "Caniche", "birthday": "2020-02-30"})
+
+        with self.assertRaises(ValidationError):
+            Pet.save_pet_bulk(rows, batch_size=2)
+
+        self.assertEqual(Pet.objects.count(), 0)
+
+    def test_bulk_rejects_repeated_and_existing_emails(self):
+        """Prueba que los emails repetidos o ya guardados se informen como errores de fila."""
+        Client.save_client(self.client_row(0))
+        rows = [self.client_row(0), self.client_row(1), self.client_row(2), self.client_row(1)]
+        rows[3]["email"] = "CLIENTE1@vetsoft.com"
+
+        created, errors = Client.save_client_bulk(rows, batch_size=2)
+
+        self.assertEqual(created, 2)
+        self.assertEqual(errors, {
+            0: {"email": "Ya existe un cliente con ese email"},
+            3: {"email": "Ya existe un cliente con ese email"},
+        })
+        self.assertEqual(Client.objects.count(), 3)
+
+    def test_bulk_delete_in_batches(self):
+        """Prueba que la eliminación por lotes borre todos los ids una sola vez."""
+        Client.save_client_bulk(self.client_row(index) for index in range(5))
+        ids = list(Client.objects.values_list("id", flat=True))
+
+        with self.assertNumQueries(4):
+            # Dos DELETE (lotes de 3 y 1 ids, sin repetir) más SAVEPOINT y RELEASE
+            deleted = bulk_delete(Client, [*ids[:4], ids[0]], batch_size=3)
+
+        self.assertEqual(deleted, 4)
+        self.assertEqual(Client.objects.count(), 1)
+
+    def test_every_model_has_a_bulk_save(self):
+        """Prueba la carga masiva de cada modelo."""
+        loads = [
+            (Provider.save_provider_bulk, {"name": "Pedro", "email": "p@vetsoft.com", "city": "Berisso"}),
+            (Medicine.save_medicine_bulk, {"name": "Ibuprofeno", "description": "Oral", "dose": "5"}),
+            (Product.save_product_bulk, {"name": "Alimento", "type": "Comida", "price": "10.5"}),
+            (Pet.save_pet_bulk, {"name": "Roma", "breed": "Labrador", "birthday": "2020-01-01"}),
+            (Vet.save_vet_bulk, {
+                "name": "Vera", "email": "v@vetsoft.com", "phone": "54221", "speciality": "Urgencias",
+            }),
+        ]
+
+        for save_bulk, row in loads:
+            if "email" in row:
+                # La segunda fila repite el email de la primera y se rechaza
+                created, errors = save_bulk([row, row])
+                self.assertEqual(created, 1)
+                self.assertEqual(list(errors), [1])
+                self.assertIn("Ya existe", errors[1]["email"])
+            else:
+                self.assertEqual(save_bulk([row, row]), (2, {}))
+
+        self.assertEqual(Medicine.objects.first().dose, 5)
+
+
+class ImportCsvTest(TestCase):
+    """
+    Pruebas para la importación de CSV en lotes (`import_csv`).
+    """
+
+    def setUp(self):
+        """Crea un directorio temporal para los archivos de la prueba."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write_csv(self, name, content):
+        """Escribe un CSV en el directorio temporal y retorna su ruta."""
+        path = self.directory / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_import_writes_valid_rows_and_rejects_invalid_ones(self):
+        """Prueba que se guarden las filas válidas y las inválidas vayan al archivo de rechazos."""
+        source = StringIO(
+            "name,phone,email,city\n"
+            "Ana,54221555232,ana@vetsoft.com,La Plata\n"
+            "Bruno,no,bruno@vetsoft.com,Berisso\n"
+            "Carla,54221555233,carla@vetsoft.com,Ensenada\n",
+        )
+        rejected = StringIO()
+        progress = []
+
+        result = import_csv("clients", source, rejected, batch_size=2, on_batch=progress.append)
+
+        self.assertEqual((result.imported, result.rejected), (2, 1))
+        self.assertEqual(len(progress), 2)
+        self.assertEqual(Client.objects.count(), 2)
+        rows = list(csv.DictReader(StringIO(rejected.getvalue())))
+        self.assertEqual(rows[0]["name"], "Bruno")
+        self.assertEqual(rows[0]["errors"], "phone: El teléfono debe ser un número")
+
+    def test_rows_the_database_rejects_do_not_drop_the_batch(self):
+        """Prueba que una fila que pasa la validación pero falla en la base no descarte su lote."""
+        source = StringIO(
+            "name,breed,birthday\n"
+            "Roma,Labrador,2020-01-01\n"
+            "Luna,Caniche,2020-02-30\n"
+            "Kira,Beagle,2021-05-05\n",
+        )
+        rejected = StringIO()
+
+        result = import_csv("pets", source, rejected, batch_size=10)
+
+        self.assertEqual((result.imported, result.rejected), (2, 1))
+        self.assertEqual(list(Pet.objects.values_list("name", flat=True)), ["Roma", "Kira"])
+        self.assertIn("Luna", rejected.getvalue())
+
+    def test_import_csv_command(self):
+        """Prueba que el comando importe el archivo y deje las filas rechazadas al lado."""
+        path = self.write_csv(
+            "medicines.csv",
+            "name,description,dose\n"
+            "Ibuprofeno,Oral,5\n"
+            "Paracetamol,Oral,50\n",
+        )
+        out = StringIO()
+
+        call_command("import_csv", "medicines", str(path), stdout=out)
+
+        self.assertIn("1 filas importadas y 1 rechazadas", out.getvalue())
+        self.assertEqual(Medicine.objects.get().name, "Ibuprofeno")
+        rejected = (self.directory / "medicines.csv.rejected.csv").read_text(encoding="utf-8")
+        self.assertIn("La dosis debe estar entre 1 y 10", rejected)
+
+    def test_import_csv_command_with_missing_file(self):
+        """Prueba que el comando informe un error si el archivo no existe."""
+        with self.assertRaises(CommandError):
+            call_command("import_csv", "clients", str(self.directory / "no-existe.csv"))
+
+
+class ImportCsvVersionTest(TransactionTestCase):
+    """
+    Pruebas de que `import_csv` actualiza la versión del modelo recién al confirmar cada lote.
+    """
+
+    def setUp(self):
+        """Parte de un cache vacío para que las versiones no dependan de otras pruebas."""
+        cache.clear()
+
+    def test_version_changes_only_after_each_batch_commits(self):
+        """Prueba que, dentro de la transacción de un lote, la versión aún sea la anterior."""
+        source = StringIO(
+            "name,phone,email,city\n"
+            "Ana,54221555232,ana@vetsoft.com,La Plata\n"
+            "Bruno,54221555233,bruno@vetsoft.com,Berisso\n"
+            "Carla,54221555234,carla@vetsoft.com,Ensenada\n",
+        )
+        before = get_version(Client)
+        during = []
+
+        import_csv(
+            "clients", source, StringIO(), batch_size=2,
+            on_batch=lambda result: during.append(get_version(Client)),
+        )
+
+        first, second = during
+        self.assertEqual(first, before)
+        self.assertGreater(second, first)
+        self.assertGreater(get_version(Client), second)
+
+
+class ImportJobTest(TestCase):
+    """
+    Pruebas para las importaciones en segundo plano (`app.jobs`).
+    """
+
+    CSV = (
+        "name,phone,email,city\n"
+        "Ana,54221555232,ana@vetsoft.com,La Plata\n"
+        "Bruno,no,bruno@vetsoft.com,Berisso\n"
+        "Carla,54221555233,carla@vetsoft.com,Ensenada\n"
+        "Dario,54221555234,dario@vetsoft.com,Berisso\n"
+        "Eva,54221555235,eva@vetsoft.com,La Plata\n"
+    )
+
+    def setUp(self):
+        """Usa un directorio temporal para los archivos y ejecuta las importaciones en el momento."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(override_settings(
+            IMPORT_JOBS_DIR=directory.name, IMPORT_JOB_WORKERS=0, BULK_BATCH_SIZE=2,
+        ))
+
+    def spool(self, content=CSV, model="clients"):
+        """Sube un CSV y retorna la importación pendiente."""
+        return spool_upload(SimpleUploadedFile("datos.csv", content.encode("utf-8")), model)
+
+    def test_job_imports_the_spooled_file(self):
+        """Prueba que la importación guarde las filas y registre el avance y los rechazos."""
+        job = self.spool()
+
+        start_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportStatus.done.name)
+        self.assertEqual((job.rows, job.imported, job.rejected), (5, 4, 1))
+        self.assertEqual(Client.objects.count(), 4)
+        rows = list(csv.DictReader(StringIO(Path(job.rejected_path).read_text(encoding="utf-8"))))
+        self.assertEqual([row["name"] for row in rows], ["Bruno"])
+
+    def test_interrupted_job_resumes_after_the_last_committed_batch(self):
+        """Prueba que una importación interrumpida continúe sin repetir los lotes guardados."""
+        job = self.spool()
+        header = "name,phone,email,city,errors\r\n"
+        bruno = "Bruno,no,bruno@vetsoft.com,Berisso,phone: El teléfono debe ser un número\r\n"
+        # Primer lote (Ana y Bruno) confirmado; el segundo se interrumpió a medio escribir.
+        Client.save_client({"name": "Ana", "phone": "54221555232", "email": "ana@vetsoft.com", "city": "La Plata"})
+        Path(job.rejected_path).write_text(header + bruno + "Carla,54", encoding="utf-8", newline="")
+        ImportJob.objects.filter(pk=job.pk).update(
+            status=ImportStatus.running.name,
+            rows=2,
+            imported=1,
+            rejected=1,
+            rejected_offset=len((header + bruno).encode("utf-8")),
+            updated_at=timezone.now() - datetime.timedelta(hours=1),
+        )
+
+        resumed = run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertTrue(resumed)
+        self.assertEqual(job.status, ImportStatus.done.name)
+        self.assertEqual((job.rows, job.imported, job.rejected), (5, 4, 1))
+        self.assertEqual(Client.objects.count(), 4)
+        self.assertEqual(Path(job.rejected_path).read_bytes().decode("utf-8"), header + bruno)
+
+    def test_resume_scans_again_after_the_stale_interval(self):
+        """Prueba que las importaciones interrumpidas se busquen de nuevo pasado el intervalo."""
+        self.addCleanup(setattr, jobs, "_last_resume", None)
+        jobs._last_resume = time.monotonic()
+        job = self.spool()
+
+        jobs.resume_jobs()
+        self.assertEqual(ImportJob.objects.get(pk=job.pk).status, ImportStatus.pending.name)
+
+        jobs._last_resume -= settings.IMPORT_JOB_STALE_SECONDS
+        jobs.resume_jobs()
+        self.assertEqual(ImportJob.objects.get(pk=job.pk).status, ImportStatus.done.name)
+
+    def test_running_job_is_not_claimed_twice(self):
+        """Prueba que una importación en curso (con avance reciente) no se ejecute dos veces."""
+        job = self.spool()
+        ImportJob.objects.filter(pk=job.pk).update(status=ImportStatus.running.name)
+
+        self.assertFalse(run_job(job.pk))
+        self.assertEqual(Client.objects.count(), 0)
+
+    def test_progress_is_committed_with_each_batch(self):
+        """Prueba que si un lote falla, su avance tampoco quede guardado."""
+        def fail_on_second_batch(result):
+            if result.rows > 2:
+                raise DatabaseError("disco lleno")
+
+        with self.assertRaises(DatabaseError):
+            import_csv("clients", StringIO(self.CSV), StringIO(), 2, fail_on_second_batch)
+
+        self.assertEqual(list(Client.objects.values_list("name", flat=True)), ["Ana"])
+
+    def test_missing_file_fails_the_job(self):
+        """Prueba que una importación sin archivo quede fallida con el error."""
+        job = self.spool()
+        Path(job.source).unlink()
+
+        run_job(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportStatus.failed.name)
+        self.assertIn(job.source, job.error)
+        self.assertTrue(job.finished)
+
+    def test_run_import_jobs_command(self):
+        """Prueba que el comando ejecute las importaciones pendientes."""
+        self.spool()
+        out = StringIO()
+
+        call_command("run_import_jobs", stdout=out)
+
+        self.assertIn("4 filas importadas y 1 rechazadas", out.getvalue())
+        self.assertFalse(unfinished_jobs().exists())
+
+
+class UpdateChangedFieldsTest(TestCase):
+    """
+    Pruebas para que los `update_*` escriban solo los campos que cambiaron.
+    """
+
+    def setUp(self):
+        """Crea un cliente y una mascota de ejemplo."""
+        self.client_data = {
+            "name": "Juan Sebastian Veron",
+            "phone": "54221555232",
+            "email": "brujita75@vetsoft.com",
+            "city": "La Plata",
+        }
+        Client.save_client(self.client_data)
+        self.pet = Pet.objects.create(name="Roma", breed="Labrador", birthday="2020-01-01")
+
+    def test_update_without_changes_does_not_write(self):
+        """Prueba que una edición sin cambios no ejecute ninguna consulta ni cambie la versión."""
+        client = Client.objects.get()
+        version = get_version(Client)
+
+        with self.assertNumQueries(0):
+            saved, errors = client.update_client(self.client_data)
+
+        self.assertTrue(saved)
+        self.assertIsNone(errors)
+        self.assertEqual(get_version(Client), version)
+
+    def test_update_writes_only_changed_columns(self):
+        """Prueba que el UPDATE incluya solo los campos modificados y `updated_at`."""
+        client = Client.objects.get()
+        updated_at = client.updated_at
+
+        with CaptureQueriesContext(connection) as queries:
+            client.update_client({**self.client_data, "city": "Berisso"})
+
+        updates = [query["sql"] for query in queries if query["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"city"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+        self.assertNotIn('"name"', updates[0])
+        self.assertNotIn('"email"', updates[0])
+        client.refresh_from_db()
+        self.assertEqual(client.city, "Berisso")
+        self.assertGreater(client.updated_at, updated_at)
+
+    def test_values_are_compared_by_type(self):
+        """Prueba que un valor del formulario igual al guardado (texto vs fecha) no cuente como cambio."""
+        pet = Pet.objects.get()
+
+        with self.assertNumQueries(0):
+            pet.update_pet({"name": "Roma", "breed": "Labrador", "birthday": "2020-01-01"})
+
+        medicine = Medicine.objects.create(name="Ibuprofeno", description="Oral", dose=5)
+        with self.assertNumQueries(0):
+            medicine.update_medicine({"name": "Ibuprofeno", "description": "Oral", "dose": "5"})
+
+    def test_changed_fields(self):
+        """Prueba que `changed_fields` asigne y liste solo los campos distintos."""
+        pet = Pet.objects.get()
+
+        changed = changed_fields(pet, {"name": "Roma", "breed": "Caniche", "birthday": "2020-01-01"})
+
+        self.assertEqual(changed, ["breed"])
+        self.assertEqual(pet.breed, "Caniche")
+
+
+class NaturalKeyUpsertTest(TestCase):
+    """
+    Pruebas para la clave natural (email único) y el upsert de clientes, proveedores y veterinarios.
+    """
+
+    def client_row(self, name="Ana", email="ana@vetsoft.com", city="La Plata"):
+        """Retorna los datos válidos de un cliente."""
+        return {"name": name, "phone": "54221555232", "email": email, "city": city}
+
+    def test_upsert_updates_existing_rows_instead_of_duplicating(self):
+        """Prueba que repetir una sincronización actualice los registros existentes."""
+        Client.save_client(self.client_row())
+        client = Client.objects.get()
+
+        created, errors = Client.upsert_client_bulk([
+            self.client_row(city="Berisso"),
+            self.client_row(name="Bruno", email="bruno@vetsoft.com"),
+        ])
+
+        self.assertEqual((created, errors), (2, {}))
+        self.assertEqual(Client.objects.count(), 2)
+        client.refresh_from_db()
+        self.assertEqual(client.city, "Berisso")
+
+    def test_upsert_is_one_statement_per_batch(self):
+        """Prueba que cada lote se escriba con un único INSERT ... ON CONFLICT."""
+        rows = [self.client_row(email=f"cliente{index}@vetsoft.com") for index in range(6)]
+
+        with CaptureQueriesContext(connection) as queries:
+            Client.upsert_client_bulk(rows, batch_size=3)
+
+        inserts = [query["sql"] for query in queries if query["sql"].startswith("INSERT")]
+        self.assertEqual(len(inserts), 2)
+        self.assertIn("ON CONFLICT", inserts[0])
+
+    def test_upsert_repeated_key_in_the_same_batch(self):
+        """Prueba que una clave repetida en el lote se escriba una vez, con la última fila."""
+        created, _ = Provider.upsert_provider_bulk([
+            {"name": "Pedro", "email": "pedro@vetsoft.com", "city": "La Plata"},
+            {"name": "Pedro", "email": "PEDRO@vetsoft.com ", "city": "Berisso"},
+        ])
+
+        self.assertEqual(created, 1)
+        self.assertEqual(Provider.objects.get().city, "Berisso")
+
+    def test_emails_are_normalized(self):
+        """Prueba que el email se guarde sin espacios y en minúsculas."""
+        Vet.save_vet({
+            "name": "Vera", "email": "Vera@Vetsoft.com", "phone": "54221", "speciality": "Urgencias",
+        })
+
+        self.assertEqual(Vet.objects.get().email, "vera@vetsoft.com")
+
+    def test_save_with_existing_email_returns_an_error(self):
+        """Prueba que crear un cliente con un email existente informe el error sin duplicarlo."""
+        Client.save_client(self.client_row())
+
+        saved, errors = Client.save_client(self.client_row(name="Otra"))
+
+        self.assertFalse(saved)
+        self.assertEqual(errors, {"email": "Ya existe un cliente con ese email"})
+        self.assertEqual(Client.objects.count(), 1)
+
+    def test_update_to_existing_email_returns_an_error(self):
+        """Prueba que editar un proveedor con el email de otro informe el error."""
+        Provider.save_provider({"name": "Pedro", "email": "pedro@vetsoft.com", "city": "La Plata"})
+        Provider.save_provider({"name": "Pablo", "email": "pablo@vetsoft.com", "city": "La Plata"})
+        pablo = Provider.objects.get(email="pablo@vetsoft.com")
+
+        saved, errors = pablo.update_provider(
+            {"name": "Pablo", "email": "pedro@vetsoft.com", "city": "La Plata"},
+        )
+
+        self.assertFalse(saved)
+        self.assertEqual(errors, {"email": "Ya existe un proveedor con ese email"})
+        self.assertEqual(
+            Provider.objects.filter(email="pedro@vetsoft.com").count(), 1,
+        )
+
+    def test_import_csv_with_upsert(self):
+        """Prueba que `import_csv` con upsert no rechace las filas ya existentes."""
+        Client.save_client(self.client_row())
+        source = "name,phone,email,city\nAna,54221555232,ana@vetsoft.com,Ensenada\n"
+
+        plain = import_csv("clients", StringIO(source), StringIO())
+        upserted = import_csv("clients", StringIO(source), StringIO(), upsert=True)
+
+        self.assertEqual((plain.imported, plain.rejected), (0, 1))
+        self.assertEqual((upserted.imported, upserted.rejected), (1, 0))
+        self.assertEqual(Client.objects.get().city, "Ensenada")
+
+
+class ValidationSchemaTest(TestCase):
+    """
+    Pruebas para los validadores armados a partir de los esquemas de `app.validation`.
+    """
+
+    VALUES = {
+        "name": ["", "Juan Perez", "Juan2", "Juan\n", " ", "Ñandú"],
+        "phone": ["", "5422149", "22149", "54a", "54"],
+        "email": [
+            "", "ana@vetsoft.com", "@vetsoft.com", "a na@vetsoft.com", "ana@@vetsoft.com",
+            "ana", "ana@gmail.com",
+        ],
+        "city": ["", "La Plata"],
+        "description": ["", "Antiinflamatorio"],
+        "dose": [None, "", "0", "1", "10", "11", "-1", "cinco", 5],
+        "type": ["", "Alimento"],
+        "price": ["", "0", "-1", "10.5", "abc", "1e3", "nan"],
+        "breed": ["", "Caniche"],
+        "birthday": ["", "2020-01-01", "9999-12-31", "fecha"],
+        "speciality": ["", "Cardiologia"],
+    }
+
+    # Error esperado (None si es válido) para cada valor de `VALUES`, por modelo y campo,
+    # tal como lo informaban los validadores escritos a mano antes de los esquemas.
+    NAME = {
+        "": "Por favor ingrese un nombre", "Juan Perez": None, "Juan\n": None, " ": None,
+        "Juan2": "El nombre debe contener solo letras y espacios",
+        "Ñandú": "El nombre debe contener solo letras y espacios",
+    }
+    CITY = {"": "Por favor seleccione una ciudad", "La Plata": None}
+    PARTNER_EMAIL = {
+        **dict.fromkeys(VALUES["email"]),
+        "": "Por favor ingrese un email", "ana": "Por favor ingrese un email valido",
+    }
+    EXPECTED = {
+        "client": {
+            "name": NAME,
+            "phone": {
+                "": "Por favor ingrese un teléfono", "5422149": None, "54": None,
+                "22149": "El teléfono debe empezar con el prefijo 54",
+                "54a": "El teléfono debe ser un número",
+            },
+            "email": {
+                "": "Por favor ingrese un email",
+                "ana@vetsoft.com": None,
+                "@vetsoft.com": "Por favor ingrese un email válido, no solo '@vetsoft.com'",
+                "a na@vetsoft.com": "Por favor ingrese un email sin espacios en blanco",
+                "ana@@vetsoft.com": "Por favor ingrese un email valido",
+                "ana": "Por favor ingrese un email valido",
+                "ana@gmail.com": "Por favor ingrese un email que incluya '@vetsoft.com'",
+            },
+            "city": CITY,
+        },
+        "provider": {"name": NAME, "email": PARTNER_EMAIL, "city": CITY},
+        "medicine": {
+            "name": {**NAME, "": "Por favor, ingrese un nombre de la medicina"},
+            "description": {
+                "": "Por favor, ingrese una descripcion de la medicina", "Antiinflamatorio": None,
+            },
+            "dose": {
+                None: "Por favor, ingrese una cantidad de la dosis de la medicina",
+                "": "Por favor, ingrese una cantidad de la dosis de la medicina",
+                "0": "La dosis debe estar entre 1 y 10", "1": None, "10": None,
+                "11": "La dosis debe estar entre 1 y 10",
+                "-1": "La dosis debe ser un numero entero",
+                "cinco": "La dosis debe ser un numero entero",
+                5: "La dosis debe ser un numero entero",
+            },
+        },
+        "product": {
+            "name": NAME,
+            "type": {"": "Por favor ingrese un tipo", "Alimento": None},
+            "price": {
+                "": "Por favor ingrese un precio",
+                "0": "Por favor ingrese un precio mayor a cero",
+                "-1": "Por favor ingrese un precio mayor a cero",
+                "abc": "Por favor ingrese un precio válido",
+                "10.5": None, "1e3": None, "nan": None,
+            },
+        },
+        "pet": {
+            "name": NAME,
+            "breed": {"": "Por favor ingrese una raza", "Caniche": None},
+            "birthday": {
+                **dict.fromkeys(
+                    ("", "9999-12-31", "fecha"),
+                    "Por favor ingrese una fecha de nacimiento valida y anterior a la de hoy",
+                ),
+                "2020-01-01": None,
+            },
+        },
+        "vet": {
+            "name": NAME,
+            "email": PARTNER_EMAIL,
+            "phone": {
+                "": "Por favor ingrese un teléfono", "5422149": None, "54a": None, "54": None,
+                "22149": "El teléfono debe empezar con el prefijo 54",
+            },
+            "speciality": {"": "Por favor seleccione una especialidad", "Cardiologia": None},
+        },
+    }
+
+    def assertExpectedErrors(self, model):
+        """Compara el validador con los errores esperados para todas las combinaciones."""
+        expected = self.EXPECTED[model]
+        validate = getattr(validation, f"validate_{model}")
+        for values in itertools.product(*(self.VALUES[field] for field in expected)):
+            data = dict(zip(expected, values))
+            errors = {
+                field: expected[field][value] for field, value in data.items()
+                if expected[field][value] is not None
+            }
+            self.assertEqual(validate(data), errors, data)
+
+    def test_client_errors(self):
+        """Prueba los errores de `validate_client` para cada combinación de valores."""
+        self.assertExpectedErrors("client")
+
+    def test_provider_errors(self):
+        """Prueba los errores de `validate_provider` para cada combinación de valores."""
+        self.assertExpectedErrors("provider")
+
+    def test_medicine_errors(self):
+        """Prueba los errores de `validate_medicine` para cada combinación de valores."""
+        self.assertExpectedErrors("medicine")
+
+    def test_product_errors(self):
+        """Prueba los errores de `validate_product` para cada combinación de valores."""
+        self.assertExpectedErrors("product")
+
+    def test_pet_errors(self):
+        """Prueba los errores de `validate_pet` para cada combinación de valores."""
+        self.assertExpectedErrors("pet")
+
+    def test_vet_errors(self):
+        """Prueba los errores de `validate_vet` para cada combinación de valores."""
+        self.assertExpectedErrors("vet")
+
+    def test_missing_fields_are_validated_as_missing(self):
+        """Prueba que los campos ausentes se validen con su valor por defecto."""
+        for model, expected in self.EXPECTED.items():
+            validate = getattr(validation, f"validate_{model}")
+            errors = {
+                field: messages[None if field == "dose" else ""]
+                for field, messages in expected.items()
+            }
+            self.assertEqual(validate({}), errors, model)
+
+    def test_each_field_has_a_single_check(self):
+        """Prueba que cada campo se valide con una sola función que retorna su primer error."""
+        phone = next(field for field in validate_client.fields if field.name == "phone")
+
+        self.assertIsNone(phone.check("5422149"))
+        self.assertEqual(phone.check("54a"), "El teléfono debe ser un número")
+
+    def test_today_is_formatted_once_per_day(self):
+        """Prueba que la fecha de hoy se reutilice hasta la medianoche."""
+        self.addCleanup(setattr, validation, "_today", ("", 0.0))
+        self.assertEqual(validation.today_iso(), datetime.date.today().isoformat())
+
+        validation._today = ("2000-01-01", time.time() + 60)
+        self.assertEqual(validation.today_iso(), "2000-01-01")
+
+        validation._today = ("2000-01-01", time.time() - 1)
+        self.assertEqual(validation.today_iso(), datetime.date.today().isoformat())
+
+
+class ColumnValidationTest(TestCase):
+    """
+    Pruebas para la validación por columnas (`validate_*.columns` y `validate_rows`).
+    """
+
+    def rows(self, fields):
+        """Retorna una fila por cada combinación de los valores de prueba de los campos."""
+        values = (ValidationSchemaTest.VALUES[field] for field in fields)
+        return [dict(zip(fields, combination)) for combination in itertools.product(*values)]
+
+    def assertSameErrors(self, validate, rows):
+        """Compara la validación por columnas con la validación fila por fila."""
+        expected = [validate(row) for row in rows]
+        columns = {field: [row[field] for row in rows] for field in rows[0]}
+
+        self.assertEqual(validate.columns(columns), expected)
+        self.assertEqual(validation.validate_rows(validate, rows), expected)
+
+    def test_client_columns_match_row_validation(self):
+        """Prueba que los errores por columnas de clientes sean los de cada fila."""
+        self.assertSameErrors(validate_client, self.rows(("name", "phone", "email", "city")))
+
+    def test_pet_columns_match_row_validation(self):
+        """Prueba que los errores por columnas de mascotas sean los de cada fila."""
+        self.assertSameErrors(validate_pet, self.rows(("name", "breed", "birthday")))
+
+    def test_product_columns_match_row_validation(self):
+        """Prueba que los errores por columnas de productos sean los de cada fila."""
+        self.assertSameErrors(validate_product, self.rows(("name", "type", "price")))
+
+    def test_every_schema_matches_its_row_validator(self):
+        """Prueba que `validate_*` y su versión por columnas validen los mismos campos igual."""
+        for model, expected in ValidationSchemaTest.EXPECTED.items():
+            validate = getattr(validation, f"validate_{model}")
+            self.assertEqual([field.name for field in validate.fields], list(expected), model)
+            self.assertSameErrors(validate, self.rows(tuple(expected)))
+
+    def test_single_invalid_value_in_a_long_column(self):
+        """Prueba que un valor inválido entre muchos válidos se informe en su fila."""
+        rows = [
+            {"name": "Juan", "phone": "54221", "email": f"c{index}@vetsoft.com", "city": "Berisso"}
+            for index in range(3000)
+        ]
+        rows[2500]["email"] = "c2500@gmail.com"
+
+        errors = validation.validate_rows(validate_client, rows)
+
+        self.assertEqual(
+            {index: row_errors for index, row_errors in enumerate(errors) if row_errors},
+            {2500: {"email": "Por favor ingrese un email que incluya '@vetsoft.com'"}},
+        )
+
+    def test_valid_rows_share_a_read_only_empty_result(self):
+        """Prueba que las filas válidas compartan un resultado vacío de solo lectura."""
+        errors = validate_product.columns({
+            "name": ["Alimento", "Collar"], "type": ["Comida", "Accesorio"], "price": ["10", "0"],
+        })
+
+        self.assertIs(errors[0], validation.NO_ERRORS)
+        self.assertEqual(errors[1], {"price": "Por favor ingrese un precio mayor a cero"})
+        with self.assertRaises(TypeError):
+            errors[0]["name"] = "error"
+
+    def test_missing_column_is_validated_as_missing(self):
+        """Prueba que una columna ausente se valide como un campo ausente en cada fila."""
+        errors = validate_pet.columns({"name": ["Roma"], "breed": ["Labrador"]})
+
+        self.assertEqual(errors, [validate_pet({"name": "Roma", "breed": "Labrador"})])
+
+    def test_columns_must_have_the_same_length(self):
+        """Prueba que las columnas de distinto largo se rechacen."""
+        with self.assertRaises(ValueError):
+            validate_pet.columns({"name": ["Roma", "Luna"], "breed": ["Labrador"]})
+
+
+class UnitOfWorkTest(TestCase):
+    """
+    Pruebas para las unidades de trabajo que agrupan escrituras en transacciones.
+    """
+
+    def client_data(self, index):
+        """Retorna los datos de un cliente válido."""
+        return {
+            "name": "Cliente Agrupado",
+            "phone": str(5422100000 + index),
+            "email": f"agrupado{index}@vetsoft.com",
+            "city": "La Plata",
+        }
+
+    def test_commits_once_per_batch(self):
+        """Prueba que las escrituras se confirmen de a `batch_size`."""
+        with UnitOfWork(batch_size=3) as unit:
+            for index in range(7):
+                Client.save_client(self.client_data(index))
+
+        self.assertEqual(unit.writes, 7)
+        self.assertEqual(unit.commits, 3)
+        self.assertEqual(Client.objects.count(), 7)
+
+    def test_default_batch_size_comes_from_settings(self):
+        """Prueba que el tamaño de lote por defecto sea `UNIT_OF_WORK_BATCH_SIZE`."""
+        with override_settings(UNIT_OF_WORK_BATCH_SIZE=2):
+            self.assertEqual(UnitOfWork().batch_size, 2)
+
+    def test_version_is_bumped_after_commit(self):
+        """Prueba que la versión del modelo cambie al confirmar, no en cada escritura."""
+        version = get_version(Client)
+
+        with UnitOfWork():
+            Client.save_client(self.client_data(0))
+            self.assertEqual(get_version(Client), version)
+
+        self.assertGreater(get_version(Client), version)
+
+    def test_exception_rolls_back_pending_writes(self):
+        """Prueba que una excepción revierta las escrituras del lote y no cambie la versión."""
+        version = get_version(Client)
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            with UnitOfWork():
+                Client.save_client(self.client_data(0))
+                raise RuntimeError
+
+        self.assertFalse(Client.objects.exists())
+        self.assertEqual(get_version(Client), version)
+        self.assertIsNone(current_unit())
+
+    def test_nested_units_report_to_the_innermost(self):
+        """Prueba que las unidades anidadas se apilen y se desapilen en orden."""
+        with UnitOfWork() as outer:
+            with UnitOfWork() as inner:
+                self.assertIs(current_unit(), inner)
+                Client.save_client(self.client_data(0))
+            self.assertIs(current_unit(), outer)
+
+        self.assertEqual((outer.writes, inner.writes), (0, 1))
+        self.assertIsNone(current_unit())
+
+    def test_does_not_commit_inside_foreign_atomic_block(self):
+        """Prueba que la unidad no cierre su lote dentro de un `atomic` abierto por otro código."""
+        with UnitOfWork(batch_size=1) as unit:
+            with transaction.atomic():
+                Client.save_client(self.client_data(0))
+                Client.save_client(self.client_data(1))
+
+        self.assertEqual(unit.commits, 1)
+        self.assertEqual(Client.objects.count(), 2)
+
+    def test_middleware_wraps_only_unsafe_methods(self):
+        """Prueba que el middleware ejecute dentro de una unidad solo las vistas que escriben."""
+        middleware = UnitOfWorkMiddleware(lambda request: None)
+
+        def view(request):
+            return current_unit()
+
+        factory = RequestFactory()
+        self.assertIsNone(middleware.process_view(factory.get("/"), view, (), {}))
+        self.assertIsInstance(middleware.process_view(factory.post("/"), view, (), {}), UnitOfWork)
+        with override_settings(UNIT_OF_WORK_REQUESTS=False):
+            self.assertIsNone(middleware.process_view(factory.post("/"), view, (), {}))
+
+
+class SqliteProductionTest(TestCase):
+    """
+    Pruebas para el perfil de producción de SQLite.
+    """
+
+    def open_database(self, path):
+        """Abre una conexión nueva a otra base SQLite, con los ajustes de la conexión actual."""
+        wrapper = type(connections["default"])({**connection.settings_dict, "NAME": str(path)})
+        wrapper.ensure_connection()
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def pragma(self, wrapper, name):
+        """Retorna el valor de un pragma en una conexión."""
+        with wrapper.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def test_pragma_statements(self):
+        """Prueba que se arme una sentencia por pragma, en orden."""
+        self.assertEqual(
+            pragma_statements({"journal_mode": "WAL", "busy_timeout": 5000}),
+            ["PRAGMA journal_mode = WAL", "PRAGMA busy_timeout = 5000"],
+        )
+
+    @override_settings(
+        SQLITE_PRAGMAS={
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 7000,
+            "mmap_size": 1048576,
+            "cache_size": -2048,
+            "temp_store": "MEMORY",
+        },
+    )
+    def test_new_connections_get_the_production_pragmas(self):
+        """Prueba que cada conexión nueva quede en WAL y con los demás pragmas aplicados."""
+        directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        connection_created.connect(configure_connection, dispatch_uid="test.sqlite")
+        self.addCleanup(connection_created.disconnect, dispatch_uid="test.sqlite")
+
+        wrapper = self.open_database(directory / "produccion.sqlite3")
+
+        self.assertEqual(self.pragma(wrapper, "journal_mode"), "wal")
+        self.assertEqual(self.pragma(wrapper, "synchronous"), 1)
+        self.assertEqual(self.pragma(wrapper, "busy_timeout"), 7000)
+        self.assertEqual(self.pragma(wrapper, "cache_size"), -2048)
+        self.assertEqual(self.pragma(wrapper, "temp_store"), 2)
+
+    def test_default_profile_keeps_rollback_journal(self):
+        """Prueba que sin el perfil de producción la base siga con el journal de rollback."""
+        directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+        wrapper = self.open_database(directory / "default.sqlite3")
+
+        self.assertEqual(self.pragma(wrapper, "journal_mode"), "delete")
+
+
+class ConnectionPoolTest(TestCase):
+    """
+    Pruebas para el pool de conexiones del backend `app.backends.sqlite_pool`.
+    """
+
+    def setUp(self):
+        """Crea un directorio temporal para las bases de las pruebas."""
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+
+    def connect(self):
+        """Abre una conexión nueva a una base temporal."""
+        return sqlite3.connect(self.directory / "pool.sqlite3", check_same_thread=False)
+
+    def test_released_connections_are_reused(self):
+        """Prueba que una conexión devuelta se reutilice en lugar de abrir otra."""
+        pool = ConnectionPool(max_size=2, timeout=1)
+
+        first = pool.acquire(self.connect)
+        pool.release(first)
+        second = pool.acquire(self.connect)
+
+        self.assertIs(first, second)
+        stats = pool.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+        self.assertGreater(stats["setup_seconds"], 0)
+
+    def test_release_rolls_back_open_transaction(self):
+        """Prueba que se revierta la transacción que haya quedado abierta al devolver la conexión."""
+        pool = ConnectionPool(max_size=1, timeout=1)
+        connection = pool.acquire(self.connect)
+        connection.execute("CREATE TABLE t (x)")
+        connection.commit()
+        connection.execute("INSERT INTO t VALUES (1)")
+
+        pool.release(connection)
+
+        self.assertFalse(connection.in_transaction)
+        self.assertEqual(connection.execute("SELECT count(*) FROM t").fetchone()[0], 0)
+
+    def test_waits_for_a_free_connection(self):
+        """Prueba que con el pool lleno se espere a que otro hilo libere una conexión."""
+        pool = ConnectionPool(max_size=1, timeout=5)
+        connection = pool.acquire(self.connect)
+        timer = threading.Timer(0.05, pool.release, (connection,))
+        timer.start()
+
+        self.assertIs(pool.acquire(self.connect), connection)
+        timer.join()
+        self.assertEqual(pool.stats()["waits"], 1)
+        self.assertGreater(pool.stats()["wait_seconds"], 0)
+
+    def test_times_out_when_full(self):
+        """Prueba que se informe un error si ninguna conexión se libera a tiempo."""
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+        pool.acquire(self.connect)
+
+        with self.assertRaises(sqlite3.OperationalError):
+            pool.acquire(self.connect)
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_health_check_discards_closed_connections(self):
+        """Prueba que una conexión que ya no responde se descarte y se abra otra."""
+        pool = ConnectionPool(max_size=1, timeout=1)
+        broken = pool.acquire(self.connect)
+        pool.release(broken)
+        broken.close()
+
+        connection = pool.acquire(self.connect, health_check=True)
+
+        self.assertIsNot(connection, broken)
+        self.assertEqual(pool.stats()["discarded"], 1)
+
+    def test_database_wrapper_returns_connections_to_the_pool(self):
+        """Prueba que el backend devuelva la conexión al pool al cerrarse y la reutilice."""
+        name = str(self.directory / "backend.sqlite3")
+        wrapper = DatabaseWrapper({**connection.settings_dict, "NAME": name})
+        self.addCleanup(get_pool(name).close_all)
+
+        wrapper.ensure_connection()
+        raw = wrapper.connection
+        wrapper.close()
+        wrapper.ensure_connection()
+        self.addCleanup(wrapper.close)
+
+        self.assertIs(wrapper.connection, raw)
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        self.assertEqual(pool_stats()[name]["hits"], 1)
+
+    @override_settings(SQLITE_PRAGMAS={"busy_timeout": 7000})
+    def test_pragmas_run_once_per_pooled_connection(self):
+        """Prueba que los PRAGMA no se repitan al reutilizar una conexión del pool."""
+        connection_created.connect(configure_connection, dispatch_uid="test.sqlite")
+        self.addCleanup(connection_created.disconnect, dispatch_uid="test.sqlite")
+        name = str(self.directory / "pragmas.sqlite3")
+        wrapper = DatabaseWrapper({**connection.settings_dict, "NAME": name})
+        self.addCleanup(get_pool(name).close_all)
+
+        wrapper.ensure_connection()
+        self.assertFalse(wrapper.reused_connection)
+        wrapper.connection.execute("PRAGMA busy_timeout = 1")
+        wrapper.close()
+        wrapper.ensure_connection()
+        self.addCleanup(wrapper.close)
+
+        self.assertTrue(wrapper.reused_connection)
+        self.assertEqual(wrapper.connection.execute("PRAGMA busy_timeout").fetchone()[0], 1)
+
+
+@override_settings(REPLICA_DATABASE="replica")
+class ReplicaRouterTest(TestCase):
+    """
+    Pruebas para la separación de lecturas (réplica) y escrituras (primario).
+    """
+
+    def view(self, request):
+        """Vista de prueba que informa a qué base iría una lectura."""
+        return HttpResponse(router.db_for_read(Client))
+
+    def test_marked_views_read_from_replica(self):
+        """Prueba que las lecturas de una vista marcada vayan a la réplica, y solo dentro de ella."""
+        response = replica_reads(self.view)(RequestFactory().get("/clientes/"))
+
+        self.assertEqual(response.content, b"replica")
+        self.assertEqual(router.db_for_read(Client), "default")
+
+    def test_refuses_to_start_with_a_per_process_cache(self):
+        """Prueba que con réplica y LocMemCache la aplicación no inicie."""
+        locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        shared = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache"}}
+
+        with override_settings(CACHES=locmem), self.assertRaises(ImproperlyConfigured):
+            apps.get_app_config("app").ready()
+        with override_settings(CACHES=shared):
+            apps.get_app_config("app").ready()
+
+    def test_writes_always_go_to_primary(self):
+        """Prueba que las escrituras vayan al primario, aun dentro de una vista marcada."""
+        response = replica_reads(lambda request: HttpResponse(router.db_for_write(Client)))(
+            RequestFactory().get("/clientes/"),
+        )
+
+        self.assertEqual(response.content, b"default")
+
+    def test_streaming_content_reads_from_replica(self):
+        """Prueba que las consultas hechas al enviar una respuesta en streaming vayan a la réplica."""
+        def view(request):
+            return StreamingHttpResponse(router.db_for_read(Client) for _ in range(2))
+
+        response = replica_reads(view)(RequestFactory().get("/clientes/export.csv"))
+
+        self.assertEqual(b"".join(response.streaming_content), b"replicareplica")
+        self.assertEqual(router.db_for_read(Client), "default")
+
+    def test_session_that_wrote_reads_from_primary(self):
+        """Prueba que con la cookie de escritura reciente se lea del primario."""
+        request = RequestFactory().get("/clientes/")
+        request.COOKIES["vetsoft_primary"] = "1"
+
+        self.assertEqual(replica_reads(self.view)(request).content, b"default")
+
+    def test_without_replica_reads_from_primary(self):
+        """Prueba que sin réplica configurada todo se lea del primario."""
+        with override_settings(REPLICA_DATABASE=None):
+            response = replica_reads(self.view)(RequestFactory().get("/clientes/"))
+
+        self.assertEqual(response.content, b"default")
+
+    @override_settings(REPOSITORY_CACHE_TIMEOUT=60)
+    def test_page_cache_keeps_replica_and_primary_pages_apart(self):
+        """Prueba que quien lee del primario no reciba una página cacheada leída de la réplica."""
+        cache.clear()
+        view = replica_reads(
+            lambda request: render_cached(
+                request, Client, "partials/sort_header.html",
+                lambda: {"label": router.db_for_read(Client)},
+            ),
+        )
+        view(RequestFactory().get("/clientes/"))
+        request = RequestFactory().get("/clientes/")
+        request.COOKIES["vetsoft_primary"] = "1"
+
+        response = view(request)
+
+        self.assertIn(b"default", response.content)
+        self.assertNotIn(b"replica", response.content)
+
+    def test_migrations_only_on_primary(self):
+        """Prueba que las migraciones se apliquen solo al primario."""
+        self.assertTrue(ReplicaRouter().allow_migrate("default", "app"))
+        self.assertFalse(ReplicaRouter().allow_migrate("replica", "app"))
+
+    def test_writes_set_sticky_cookie(self):
+        """Prueba que una request que modifica datos deje la cookie de escritura reciente."""
+        middleware = ReadYourWritesMiddleware(lambda request: HttpResponse())
+
+        written = middleware(RequestFactory().post("/clientes/nuevo/"))
+        read = middleware(RequestFactory().get("/clientes/"))
+
+        self.assertEqual(written.cookies["vetsoft_primary"]["max-age"], 10)
+        self.assertNotIn("vetsoft_primary", read.cookies)
+
+    def test_sync_replica_copies_primary(self):
+        """Prueba que la sincronización copie el primario y actualice las versiones."""
+        directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        source = sqlite3.connect(directory / "primario.sqlite3")
+        target = sqlite3.connect(directory / "replica.sqlite3")
+        self.addCleanup(source.close)
+        self.addCleanup(target.close)
+        source.execute("CREATE TABLE t (x)")
+        source.execute("INSERT INTO t VALUES (1)")
+        source.commit()
+        version = get_version(Client)
+
+        sync_replica(source, target)
+
+        self.assertEqual(target.execute("SELECT x FROM t").fetchall(), [(1,)])
+        self.assertGreater(get_version(Client), version)
+
+    def test_data_version_changes_after_other_connection_writes(self):
+        """Prueba que `data_version` detecte escrituras de otras conexiones."""
+        directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        reader = sqlite3.connect(directory / "primario.sqlite3")
+        writer = sqlite3.connect(directory / "primario.sqlite3")
+        self.addCleanup(reader.close)
+        self.addCleanup(writer.close)
+        before = data_version(reader)
+
+        writer.execute("CREATE TABLE t (x)")
+        writer.commit()
+
+        self.assertNotEqual(data_version(reader), before)
+
+
+class FulltextSearchTest(TestCase):
+    """
+    Pruebas para la búsqueda por palabras con FTS5.
+    """
+
+    def setUp(self):
+        """Crea medicinas con descripciones de varias palabras."""
+        self.ibuprofeno = Medicine.objects.create(
+            name="Ibuprofeno", description="Antiinflamatorio oral para caninos", dose=5,
+        )
+        self.vacuna = Medicine.objects.create(
+            name="Vacuna Triple", description="Vacuna inyectable para felinos", dose=1,
+        )
+
+    def names(self, model, term):
+        """Retorna los nombres encontrados, en orden de relevancia."""
+        return [record.name for record in fulltext_search(model, term, 10)]
+
+    def test_match_expression_quotes_each_word_as_prefix(self):
+        """Prueba que cada palabra se busque como prefijo y los operadores de FTS5 como texto."""
+        self.assertEqual(match_expression("Pérez  OR juan"), '"pérez"* "or"* "juan"*')
+        self.assertEqual(match_expression('"-: *'), "")
+
+    def test_finds_words_in_any_order_and_column(self):
+        """Prueba que se encuentren palabras de cualquier columna, en cualquier orden y por prefijo."""
+        self.assertEqual(self.names(Medicine, "caninos ibupro"), ["Ibuprofeno"])
+        self.assertEqual(self.names(Medicine, "inyectable"), ["Vacuna Triple"])
+        self.assertEqual(self.names(Medicine, "para"), ["Ibuprofeno", "Vacuna Triple"])
+        self.assertEqual(self.names(Medicine, "jarabe"), [])
+        self.assertEqual(self.names(Medicine, "   "), [])
+
+    def test_ignores_case_and_accents(self):
+        """Prueba que la búsqueda no distinga mayúsculas ni acentos."""
+        Client.objects.create(name="Ramón Pérez", phone=5422149, email="ramon@vetsoft.com")
+
+        self.assertEqual(self.names(Client, "RAMON perez"), ["Ramón Pérez"])
+
+    def test_results_are_ranked(self):
+        """Prueba que los resultados vengan ordenados por relevancia, con su `rank`."""
+        Medicine.objects.create(name="Vacuna Rabia", description="Vacuna antirrábica vacuna anual", dose=1)
+
+        results = fulltext_search(Medicine, "vacuna", 10)
+
+        self.assertEqual([record.name for record in results], ["Vacuna Rabia", "Vacuna Triple"])
+        self.assertLess(results[0].rank, results[1].rank)
+        self.assertEqual(len(fulltext_search(Medicine, "vacuna", 1)), 1)
+
+    def test_index_follows_updates_and_deletes(self):
+        """Prueba que los triggers mantengan el índice con `save`, `update()`, `bulk_create` y `delete`."""
+        self.ibuprofeno.update_medicine({"name": "Ibuprofeno", "description": "Analgesico oral", "dose": "5"})
+        Medicine.objects.filter(pk=self.vacuna.pk).update(description="Vacuna antiparasitaria")
+        Pet.objects.bulk_create([Pet(name="Firulais", breed="Caniche", birthday="2020-01-01")])
+
+        self.assertEqual(self.names(Medicine, "caninos"), [])
+        self.assertEqual(self.names(Medicine, "analgesico"), ["Ibuprofeno"])
+        self.assertEqual(self.names(Medicine, "antiparasitaria"), ["Vacuna Triple"])
+        self.assertEqual(self.names(Pet, "caniche"), ["Firulais"])
+
+        Medicine.objects.filter(pk=self.vacuna.pk).delete()
+        self.assertEqual(self.names(Medicine, "vacuna"), [])
+
+    def test_missing_triggers_are_restored_after_migrate(self):
+        """Prueba que `post_migrate` vuelva a crear los triggers que eliminó un rebuild de la tabla."""
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER app_medicine_fts_insert")
+            cursor.execute("DROP TRIGGER app_medicine_fts_update")
+        Medicine.objects.create(name="Amoxicilina", description="Antibiotico", dose=2)
+        self.assertEqual(self.names(Medicine, "amoxicilina"), [])
+
+        restore_triggers(apps.get_app_config("app"), using="default")
+
+        self.assertEqual(self.names(Medicine, "amoxicilina"), ["Amoxicilina"])
+        Medicine.objects.filter(name="Amoxicilina").update(description="Antibiotico oral")
+        self.assertEqual(self.names(Medicine, "oral amoxicilina"), ["Amoxicilina"])
+
+    def test_rebuild_fts_command(self):
+        """Prueba que `rebuild_fts` reconstruya el índice e informe las filas indexadas."""
+        out = StringIO()
+        with connection.cursor() as cursor:
+            cursor.execute("INSERT INTO app_medicine_fts (app_medicine_fts) VALUES ('delete-all')")
+        self.assertEqual(self.names(Medicine, "ibuprofeno"), [])
+
+        call_command("rebuild_fts", "medicines", "--optimize", stdout=out)
+
+        self.assertEqual(self.names(Medicine, "ibuprofeno"), ["Ibuprofeno"])
+        self.assertIn("app_medicine_fts: 2 filas indexadas", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("rebuild_fts", "products")
+
+
+class SystemChecksTest(TestCase):
+    """
+    Pruebas para los system checks de la aplicación.
+    """
+
+    def test_warns_about_per_process_cache(self):
+        """Prueba que se advierta si las versiones de los modelos viven en LocMemCache."""
+        locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        shared = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": "/tmp"}}
+
+        with override_settings(CACHES=locmem):
+            self.assertEqual([message.id for message in check_shared_cache(None)], ["app.W001"])
+        with override_settings(CACHES=shared):
+            self.assertEqual(check_shared_cache(None), [])
+
+    def test_warning_is_a_deploy_check(self):
+        """Prueba que la advertencia se informe con `check --deploy`."""
+        messages = run_checks(include_deployment_checks=True, tags=["caches"])
+
+        self.assertIn("app.W001", [message.id for message in messages])
+
+
+class NavbarContextProcessorTest(TestCase):
+    """
+    Pruebas para el context processor de la barra de navegación.
+    """
+
+    def active(self, path):
+        """Retorna las etiquetas de los links activos para una ruta."""
+        request = RequestFactory().get(path)
+        return [link.label for link in navbar(request)["links"]() if link.active]
+
+    def test_home_is_only_active_on_root(self):
+        """Prueba que Home solo quede activo en la raíz."""
+        self.assertEqual(self.active("/"), ["Home"])
+        self.assertNotIn("Home", self.active("/clientes/"))
+
+    def test_section_is_active_on_nested_paths(self):
+        """Prueba que la sección quede activa en sus subrutas."""
+        self.assertEqual(self.active("/clientes/"), ["Clientes"])
+        self.assertEqual(self.active("/clientes/editar/3/"), ["Clientes"])
+        self.assertEqual(self.active("/medicine/new/"), ["Medicinas"])
+
+    def test_unknown_path_has_no_active_link(self):
+        """Prueba que una ruta fuera de las secciones no active ningún link."""
+        self.assertEqual(self.active("/admin/"), [])
+        self.assertEqual(self.active("/vet/editar/1/"), [])
+
+    def test_links_are_lazy_and_precomputed(self):
+        """Prueba que los links se evalúen bajo demanda y se reutilicen entre requests."""
+        first = navbar(RequestFactory().get("/mascotas/"))["links"]
+        second = navbar(RequestFactory().get("/mascotas/nuevo/"))["links"]
+
+        self.assertTrue(callable(first))
+        self.assertIs(first(), second())
+
+
+class WarmupTest(TestCase):
+    """
+    Pruebas para el precalentamiento de templates y URLs.
+    """
+
+    def test_template_names_include_every_app_template(self):
+        """Prueba que se listen los templates de la aplicación."""
+        names = template_names()
+
+        self.assertIn("base.html", names)
+        self.assertIn("clients/repository.html", names)
+        self.assertIn("partials/navbar.html", names)
+
+    def test_warm_up_fills_the_cached_loader(self):
+        """Prueba que el warm-up deje compilados los templates en el loader cacheado."""
+        loader = engines["django"].engine.template_loaders[0]
+        loader.reset()
+
+        result = warm_up()
+
+        self.assertEqual(result["templates"], len(template_names()))
+        self.assertIn("vets/form.html", loader.get_template_cache)
+        self.assertGreater(result["urls"], 0)
+
+    @override_settings(WARMUP_ON_BOOT=True)
+    def test_app_ready_does_not_warm_up(self):
+        """Prueba que `ready()` no compile templates: importaría el URLconf antes que el admin."""
+        loader = engines["django"].engine.template_loaders[0]
+        loader.reset()
+
+        apps.get_app_config("app").ready()
+
+        self.assertEqual(loader.get_template_cache, {})
+
+    def test_warmup_command(self):
+        """Prueba que el comando `warmup` informe lo precalentado."""
+        out = StringIO()
+
+        call_command("warmup", stdout=out)
+
+        self.assertIn("templates compilados", out.getvalue())
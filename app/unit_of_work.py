@@ -0,0 +1,125 @@
+import threading
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+
+from .versions import bump_version
+
+# Unidades de trabajo activas en cada hilo, de la más externa a la más interna.
+_local = threading.local()
+
+
+def current_unit():
+    """
+    Retorna la unidad de trabajo activa en el hilo actual.
+
+    Returns:
+        UnitOfWork: La unidad más interna, o None si no hay ninguna.
+    """
+    units = getattr(_local, "units", None)
+    return units[-1] if units else None
+
+
+class UnitOfWork:
+    """
+    Agrupa las escrituras en transacciones de hasta `batch_size` escrituras.
+
+    En autocommit (el modo de Django) cada `save()` o `delete()` es su propia transacción
+    y en SQLite cada una espera su propio fsync. Dentro de una unidad de trabajo las
+    escrituras que informan los modelos (ver `written`) se acumulan en una transacción que
+    se confirma cada `batch_size` escrituras y al salir del bloque. Las versiones de los
+    modelos escritos (ver app/versions.py) se actualizan una vez por lote, después del
+    COMMIT, en lugar de una vez por fila.
+
+    La transacción se abre con `savepoint=False`: dentro de otra transacción la unidad se
+    suma a ella sin consultas extra, y solo se confirma cuando es el bloque `atomic` más
+    interno (una unidad nunca confirma en medio de un bloque abierto por otro código).
+
+    Uso:
+        with UnitOfWork(batch_size=500) as unit:
+            for data in rows:
+                Client.save_client(data)
+        unit.commits  # transacciones confirmadas
+
+    Args:
+        batch_size (int): Escrituras por transacción; por defecto `UNIT_OF_WORK_BATCH_SIZE`.
+        using (str): El alias de la base de datos.
+    """
+
+    def __init__(self, batch_size=None, using=None):
+        """Configura la unidad; la transacción se abre al entrar al bloque `with`."""
+        self.batch_size = batch_size or settings.UNIT_OF_WORK_BATCH_SIZE
+        self.using = using or DEFAULT_DB_ALIAS
+        self.writes = 0
+        self.commits = 0
+        self._pending = 0
+        self._models = set()
+        self._atomic = None
+        self._depth = 0
+
+    def __enter__(self):
+        """Abre la primera transacción y registra la unidad como activa en el hilo."""
+        self._begin()
+        _local.__dict__.setdefault("units", []).append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Confirma las escrituras pendientes, o las revierte si hubo una excepción."""
+        _local.units.remove(self)
+        self._end(exc_type, exc_value, traceback)
+        return False
+
+    def record(self, model, count=1):
+        """
+        Registra escrituras de un modelo y confirma la transacción si se completó el lote.
+
+        Args:
+            model (type): El modelo escrito.
+            count (int): Cantidad de filas escritas.
+        """
+        self.writes += count
+        self._pending += count
+        self._models.add(model)
+        connection = connections[self.using]
+        if self._pending >= self.batch_size and len(connection.atomic_blocks) == self._depth:
+            self._end(None, None, None)
+            self._begin()
+
+    def _begin(self):
+        """Abre la transacción de un lote."""
+        self._atomic = transaction.atomic(using=self.using, savepoint=False)
+        self._atomic.__enter__()
+        self._depth = len(connections[self.using].atomic_blocks)
+
+    def _end(self, exc_type, exc_value, traceback):
+        """Cierra la transacción del lote y actualiza las versiones de lo confirmado."""
+        models, pending = self._models, self._pending
+        self._models, self._pending = set(), 0
+        self._atomic.__exit__(exc_type, exc_value, traceback)
+
+        if exc_type is None and pending:
+            self.commits += 1
+            for model in models:
+                bump_version(model)
+
+
+def written(model, count=1):
+    """
+    Informa que se escribieron filas de un modelo (alta, modificación o eliminación).
+
+    Fuera de una unidad de trabajo actualiza la versión del modelo, como `bump_version`,
+    cuando se confirma la transacción en curso (enseguida en autocommit). Si la versión
+    cambiara antes del COMMIT, un listado concurrente podría leer las filas anteriores y
+    guardarlas en el cache bajo la nueva versión. Dentro de una unidad de trabajo la
+    escritura cuenta para el lote de la unidad y la versión se actualiza cuando la
+    transacción del lote se confirma.
+
+    Args:
+        model (type): El modelo escrito.
+        count (int): Cantidad de filas escritas.
+    """
+    unit = current_unit()
+    if unit is None:
+        transaction.on_commit(lambda: bump_version(model), using=router.db_for_write(model))
+    else:
+        unit.record(model, count)
@@ -5,27 +5,45 @@ from . import views
 urlpatterns = [
     path("", view=views.home, name="home"),
     path("clientes/", view=views.clients_repository, name="clients_repo"),
+    path("clientes/export.<str:export_format>", view=views.clients_export, name="clients_export"),
     path("clientes/nuevo/", view=views.clients_form, name="clients_form"),
     path("clientes/editar/<int:id>/", view=views.clients_form, name="clients_edit"),
     path("clientes/eliminar/", view=views.clients_delete, name="clients_delete"),
+    path("clientes/eliminar-seleccionados/", view=views.clients_bulk_delete, name="clients_bulk_delete"),
     path("proveedores/", view=views.providers_repository, name="providers_repo"),
+    path("proveedores/export.<str:export_format>", view=views.providers_export, name="providers_export"),
     path("proveedores/nuevo/", view=views.providers_form, name="providers_form"),
     path("proveedores/editar/<int:id>/", view=views.providers_form, name="providers_edit"),
     path("proveedores/eliminar/", view=views.providers_delete, name="providers_delete"),
+    path("proveedores/eliminar-seleccionados/", view=views.providers_bulk_delete, name="providers_bulk_delete"),
     path("medicine/new/", view=views.medicine_form, name="medicine_form"),
     path("medicine/", view=views.medicine_repository, name="medicine_repo"),
+    path("medicine/export.<str:export_format>", view=views.medicine_export, name="medicine_export"),
     path("medicine/editar/<int:id>/", view=views.medicine_form, name="medicine_edit"),
     path("medicine/delete/", view=views.medicine_delete, name="medicine_delete"),
+    path("medicine/delete-selected/", view=views.medicine_bulk_delete, name="medicine_bulk_delete"),
     path("productos/", view=views.products_repository, name="products_repo"),
+    path("productos/export.<str:export_format>", view=views.products_export, name="products_export"),
     path("productos/nuevo", view=views.products_form, name="products_form"),
     path("productos/editar/<int:id>/", view=views.products_form, name="products_edit"),
     path("productos/eliminar/", view=views.products_delete, name="products_delete"),
+    path("productos/eliminar-seleccionados/", view=views.products_bulk_delete, name="products_bulk_delete"),
     path("mascotas/", view=views.pets_repository, name="pets_repo"),
+    path("mascotas/export.<str:export_format>", view=views.pets_export, name="pets_export"),
     path("mascotas/nuevo/", view=views.pets_form, name="pets_form"),
     path("mascotas/editar/<int:id>/", view=views.pets_form, name="pets_edit"),
     path("mascotas/eliminar/", view=views.pets_delete, name="pets_delete"),
+    path("mascotas/eliminar-seleccionados/", view=views.pets_bulk_delete, name="pets_bulk_delete"),
     path("vets/", view=views.vets_repository, name="vets_repo"),
+    path("vets/export.<str:export_format>", view=views.vets_export, name="vets_export"),
     path("vets/nuevo/", view=views.vets_form, name="vets_form"),
     path("vet/editar/<int:id>/", view=views.vets_form, name="vets_edit"),
     path("vets/eliminar/", view=views.vets_delete, name="vets_delete"),
+    path("vets/eliminar-seleccionados/", view=views.vets_bulk_delete, name="vets_bulk_delete"),
+    path("buscar/", view=views.fulltext_repository, name="fulltext_repo"),
+    path("buscar.json", view=views.fulltext_json, name="fulltext_json"),
+    path("importaciones/", view=views.imports_repository, name="imports_repo"),
+    path("importaciones/<int:id>/", view=views.imports_detail, name="imports_detail"),
+    path("importaciones/<int:id>/progreso/", view=views.imports_progress, name="imports_progress"),
+    path("importaciones/<int:id>/rechazadas.csv", view=views.imports_rejected, name="imports_rejected"),
 ]
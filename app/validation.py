@@ -0,0 +1,642 @@
+import datetime
+import re
+import time
+from types import MappingProxyType
+from typing import NamedTuple
+
+# Nombres válidos: solo letras y espacios. Se compila una vez (y se guarda su `match`) en
+# lugar de buscar el patrón en el cache de `re` en cada validación.
+NAME_RE = re.compile(r"^[A-Za-z\s]+$")
+NAME_MATCH = NAME_RE.match
+
+# Dominio obligatorio en los emails de los clientes.
+CLIENT_EMAIL_DOMAIN = "@vetsoft.com"
+
+# Fecha de hoy en formato ISO y el instante (timestamp) hasta el que es válida.
+_today = ("", 0.0)
+
+
+def today_iso():
+    """
+    Retorna la fecha de hoy como "YYYY-MM-DD", formateándola solo cuando cambia el día.
+
+    Returns:
+        str: La fecha de hoy en formato ISO.
+    """
+    global _today
+    value, valid_until = _today
+    if time.time() >= valid_until:
+        date = datetime.date.today()
+        midnight = datetime.datetime.combine(date + datetime.timedelta(days=1), datetime.time())
+        value = date.strftime("%Y-%m-%d")
+        _today = (value, midnight.timestamp())
+    return value
+
+
+def all_filled(values):
+    """
+    Indica si ningún valor de una columna está vacío.
+
+    Args:
+        values (list): Los valores de la columna.
+
+    Returns:
+        bool: Si ningún valor es "".
+    """
+    return "" not in values
+
+
+def all_names(values):
+    """
+    Indica si todos los valores de una columna son nombres válidos (`NAME_RE`).
+
+    Args:
+        values (list): Los nombres.
+
+    Returns:
+        bool: Si ninguno está vacío y todos son solo letras y espacios.
+    """
+    return "" not in values and all(map(NAME_RE.match, values))
+
+
+def all_client_phones(values):
+    """
+    Indica si todos los valores de una columna son teléfonos de cliente válidos.
+
+    Args:
+        values (list): Los teléfonos.
+
+    Returns:
+        bool: Si todos son números que empiezan con 54.
+    """
+    return all(value.isdigit() and value.startswith("54") for value in values)
+
+
+def all_client_emails(values):
+    """
+    Indica si todos los valores de una columna son emails de cliente válidos.
+
+    Args:
+        values (list): Los emails.
+
+    Returns:
+        bool: Si todos tienen una sola "@", no tienen espacios y terminan con el dominio
+            (sin ser solo el dominio).
+    """
+    return all(
+        " " not in value
+        and value.count("@") == 1
+        and value.endswith(CLIENT_EMAIL_DOMAIN)
+        and value != CLIENT_EMAIL_DOMAIN
+        for value in values
+    )
+
+
+def all_past_dates(values):
+    """
+    Indica si todas las fechas de una columna son anteriores a hoy.
+
+    Args:
+        values (list): Las fechas en formato "YYYY-MM-DD".
+
+    Returns:
+        bool: Si ninguna está vacía y la mayor es anterior a hoy.
+    """
+    return "" not in values and max(values) < today_iso()
+
+
+def all_positive_prices(values):
+    """
+    Indica si todos los valores de una columna son precios mayores a cero.
+
+    Args:
+        values (list): Los precios.
+
+    Returns:
+        bool: Si todos se convierten a `float` y el menor es mayor a cero.
+    """
+    return min(map(float, values)) > 0.0
+
+
+# Errores de una fila válida en la validación por columnas: un único diccionario vacío de
+# solo lectura compartido por todas las filas válidas, en lugar de uno por fila.
+NO_ERRORS = MappingProxyType({})
+
+# Valores que se revisan juntos con el `screen` de un campo. Si un tramo tiene algún valor
+# inválido, solo ese tramo se valida valor por valor.
+SCREEN_CHUNK = 1024
+
+# Errores que indican que la revisión rápida de una columna no aplica (por ejemplo
+# valores que no son texto); en ese caso la columna se valida valor por valor.
+SCREEN_ERRORS = (TypeError, ValueError, AttributeError, UnicodeError)
+
+
+class Field(NamedTuple):
+    """
+    Un campo a validar y la función que lo valida.
+
+    Args:
+        name (str): La clave del campo en los datos.
+        check (callable): Recibe el valor y retorna el mensaje de la primera regla que no
+            cumple, o None si es válido. Revisa todas las reglas en una sola función, sin
+            recorrer una lista de reglas por cada valor.
+        default (object): El valor que se valida si el campo no está en los datos.
+        screen (callable): Opcional; recibe una columna completa de valores y retorna
+            True solo si todos pasan todas las reglas, para validar columnas enteras sin
+            buscar el error de cada valor (ver `compile_columns`).
+    """
+
+    name: str
+    check: object
+    default: object = ""
+    screen: object = None
+
+
+def schema(description, fields):
+    """
+    Asocia a una función `validate_*` los campos que valida y su versión por columnas.
+
+    La función valida cada campo con una sola llamada a su `check`, escrita campo por
+    campo (sin recorrer una lista de campos ni de reglas por cada fila). El decorador le
+    agrega `fields` y `columns`, la versión por columnas de `compile_columns`, que usan
+    las mismas funciones `check`.
+
+    Args:
+        description (str): Qué valida la función; se usa en el docstring de `columns`.
+        fields (tuple): Los campos (`Field`) en el orden en que se validan.
+
+    Returns:
+        callable: El decorador.
+    """
+    def decorate(validate):
+        validate.fields = fields
+        validate.columns = compile_columns(f"{validate.__name__}_columns", description, fields)
+        return validate
+
+    return decorate
+
+
+def column_messages(check, values):
+    """
+    Valida una columna valor por valor, validando una sola vez cada valor repetido.
+
+    Args:
+        check (callable): El `check` del campo.
+        values (list): Los valores de la columna.
+
+    Returns:
+        iterable: El mensaje de error (o None) de cada valor, en el orden de `values`.
+    """
+    try:
+        messages = dict.fromkeys(values)
+    except TypeError:
+        return map(check, values)
+
+    for value in messages:
+        messages[value] = check(value)
+    return map(messages.__getitem__, values)
+
+
+def screened(screen, values):
+    """
+    Indica si el `screen` de un campo da por válidos todos los valores de un tramo.
+
+    Args:
+        screen (callable): El `screen` del campo, o None si no tiene.
+        values (list): Un tramo de la columna.
+
+    Returns:
+        bool: Si el tramo no necesita validarse valor por valor.
+    """
+    if screen is None:
+        return False
+    try:
+        return screen(values)
+    except SCREEN_ERRORS:
+        return False
+
+
+def compile_columns(function_name, description, fields):
+    """
+    Arma la versión por columnas de un esquema, para validar muchas filas a la vez.
+
+    Cada campo se valida sobre su columna, de a tramos de `SCREEN_CHUNK` valores: primero
+    con su `screen`, que revisa el tramo completo en una sola pasada y, solo en los tramos
+    con algún valor inválido o si el campo no tiene `screen`, valor por valor con las
+    mismas reglas que la validación por fila. El resultado es el mismo que validar cada fila con `validate_*`.
+
+    Args:
+        function_name (str): El nombre de la función generada.
+        description (str): Qué valida la función; se usa en su docstring.
+        fields (tuple): Los campos (`Field`) en el orden en que se validan.
+
+    Returns:
+        callable: Una función que recibe un diccionario con una lista de valores por
+            campo y retorna la lista con los errores de cada fila.
+    """
+    checks = [(field.name, field.default, field.screen, field.check) for field in fields]
+
+    def validate_columns(columns):
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("Todas las columnas deben tener la misma cantidad de valores")
+        size = sizes.pop() if sizes else 0
+        errors = [NO_ERRORS] * size
+
+        for name, default, screen, check in checks:
+            values = columns.get(name)
+            if values is None:
+                values = [default] * size
+
+            for offset in range(0, size, SCREEN_CHUNK):
+                chunk = values[offset:offset + SCREEN_CHUNK]
+                if screened(screen, chunk):
+                    continue
+                for index, message in enumerate(column_messages(check, chunk), offset):
+                    if message is not None:
+                        if errors[index] is NO_ERRORS:
+                            errors[index] = {}
+                        errors[index][name] = message
+        return errors
+
+    validate_columns.__name__ = validate_columns.__qualname__ = function_name
+    validate_columns.__doc__ = f"""
+    Valida los datos de muchas filas de {description}, organizados por columnas.
+
+    Args:
+        columns (dict): Una lista de valores por campo (todas del mismo largo). Un campo
+            ausente se valida como si faltara en todas las filas.
+
+    Returns:
+        list: Los errores de cada fila, iguales a los de `validate_*`; las filas válidas
+            comparten `NO_ERRORS`, un diccionario vacío de solo lectura.
+    """
+    return validate_columns
+
+
+def validate_rows(validate, rows):
+    """
+    Valida muchas filas a la vez, por columnas si el validador lo permite.
+
+    Args:
+        validate (callable): La función `validate_*` del modelo.
+        rows (list): Los diccionarios con los datos de cada fila.
+
+    Returns:
+        list: Los errores de cada fila, en el mismo orden.
+    """
+    validate_columns = getattr(validate, "columns", None)
+    if validate_columns is None:
+        return [validate(row) for row in rows]
+
+    return validate_columns({
+        field.name: [row.get(field.name, field.default) for row in rows]
+        for field in validate.fields
+    })
+
+
+def name_check(empty_message="Por favor ingrese un nombre"):
+    """
+    Arma la validación del nombre, igual en todos los modelos salvo el mensaje de vacío.
+
+    Args:
+        empty_message (str): El error si el nombre está vacío.
+
+    Returns:
+        callable: Recibe el nombre y retorna el error, o None si es válido.
+    """
+    def check(value):
+        # Los nombres con solo letras ASCII y espacios se aceptan sin pasar por la regex.
+        if value.isascii() and value.replace(" ", "").isalpha() or NAME_MATCH(value) is not None:
+            return None
+        return empty_message if value == "" else "El nombre debe contener solo letras y espacios"
+
+    return check
+
+
+def required_check(message):
+    """
+    Arma la validación de un campo que solo tiene que estar completo.
+
+    Args:
+        message (str): El error si el campo está vacío.
+
+    Returns:
+        callable: Recibe el valor y retorna el error, o None si no está vacío.
+    """
+    def check(value):
+        return message if value == "" else None
+
+    return check
+
+
+check_name = name_check()
+check_medicine_name = name_check("Por favor, ingrese un nombre de la medicina")
+check_city = required_check("Por favor seleccione una ciudad")
+check_description = required_check("Por favor, ingrese una descripcion de la medicina")
+check_type = required_check("Por favor ingrese un tipo")
+check_breed = required_check("Por favor ingrese una raza")
+check_speciality = required_check("Por favor seleccione una especialidad")
+
+
+def check_client_phone(value):
+    """
+    Valida el teléfono de un cliente: un número que empieza con 54.
+
+    Args:
+        value (str): El teléfono ingresado.
+
+    Returns:
+        str: El error, o None si es válido.
+    """
+    if value.isdigit() and value.startswith("54"):
+        return None
+    if value == "":
+        return "Por favor ingrese un teléfono"
+    if not value.isdigit():
+        return "El teléfono debe ser un número"
+    return "El teléfono debe empezar con el prefijo 54"
+
+
+def check_client_email(value):
+    """
+    Valida el email de un cliente: sin espacios, con una sola "@" y del dominio de la
+    veterinaria.
+
+    Args:
+        value (str): El email ingresado.
+
+    Returns:
+        str: El error, o None si es válido.
+    """
+    if value == "":
+        return "Por favor ingrese un email"
+    if " " in value:
+        return "Por favor ingrese un email sin espacios en blanco"
+    if value.count("@") != 1:
+        return "Por favor ingrese un email valido"
+    if not value.endswith(CLIENT_EMAIL_DOMAIN):
+        return "Por favor ingrese un email que incluya '@vetsoft.com'"
+    if value == CLIENT_EMAIL_DOMAIN:
+        return "Por favor ingrese un email válido, no solo '@vetsoft.com'"
+    return None
+
+
+def check_email(value):
+    """
+    Valida el email de un proveedor o veterinario: alcanza con que tenga una "@".
+
+    Args:
+        value (str): El email ingresado.
+
+    Returns:
+        str: El error, o None si es válido.
+    """
+    if "@" in value:
+        return None
+    return "Por favor ingrese un email" if value == "" else "Por favor ingrese un email valido"
+
+
+def check_vet_phone(value):
+    """
+    Valida el teléfono de un veterinario: tiene que empezar con 54.
+
+    Args:
+        value (str): El teléfono ingresado.
+
+    Returns:
+        str: El error, o None si es válido.
+    """
+    if value.startswith("54"):
+        return None
+    if value == "":
+        return "Por favor ingrese un teléfono"
+    return "El teléfono debe empezar con el prefijo 54"
+
+
+def check_dose(value):
+    """
+    Valida la dosis de un medicamento: un número entero entre 1 y 10.
+
+    Args:
+        value (str): La dosis ingresada (None si falta).
+
+    Returns:
+        str: El error, o None si es válida.
+    """
+    if value is None or value == "":
+        return "Por favor, ingrese una cantidad de la dosis de la medicina"
+    if not isinstance(value, str) or not value.isdigit():
+        return "La dosis debe ser un numero entero"
+    if not 0 < int(value) < 11:
+        return "La dosis debe estar entre 1 y 10"
+    return None
+
+
+def check_price(value):
+    """
+    Valida el precio de un producto: un número mayor a cero.
+
+    Args:
+        value (str): El precio ingresado.
+
+    Returns:
+        str: El error, o None si es válido.
+    """
+    if value == "":
+        return "Por favor ingrese un precio"
+    try:
+        price = float(value)
+    except ValueError:
+        return "Por favor ingrese un precio válido"
+    return "Por favor ingrese un precio mayor a cero" if price <= 0.0 else None
+
+
+def check_birthday(value):
+    """
+    Valida la fecha de nacimiento de una mascota: anterior a hoy (`today_iso`).
+
+    Args:
+        value (str): La fecha ingresada, en formato "YYYY-MM-DD".
+
+    Returns:
+        str: El error, o None si es válida.
+    """
+    if value != "" and value < today_iso():
+        return None
+    return "Por favor ingrese una fecha de nacimiento valida y anterior a la de hoy"
+
+
+CLIENT_FIELDS = (
+    Field("name", check_name, screen=all_names),
+    Field("phone", check_client_phone, screen=all_client_phones),
+    Field("email", check_client_email, screen=all_client_emails),
+    Field("city", check_city, screen=all_filled),
+)
+
+PROVIDER_FIELDS = (
+    Field("name", check_name, screen=all_names),
+    Field("email", check_email),
+    Field("city", check_city, screen=all_filled),
+)
+
+MEDICINE_FIELDS = (
+    Field("name", check_medicine_name, screen=all_names),
+    Field("description", check_description, screen=all_filled),
+    Field("dose", check_dose, default=None),
+)
+
+PRODUCT_FIELDS = (
+    Field("name", check_name, screen=all_names),
+    Field("type", check_type, screen=all_filled),
+    Field("price", check_price, screen=all_positive_prices),
+)
+
+PET_FIELDS = (
+    Field("name", check_name, screen=all_names),
+    Field("breed", check_breed, screen=all_filled),
+    Field("birthday", check_birthday, screen=all_past_dates),
+)
+
+VET_FIELDS = (
+    Field("name", check_name, screen=all_names),
+    Field("email", check_email),
+    Field("phone", check_vet_phone),
+    Field("speciality", check_speciality, screen=all_filled),
+)
+
+
+@schema("un cliente", CLIENT_FIELDS)
+def validate_client(data):
+    """
+    Valida los datos de un cliente.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos de un cliente.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+    get = data.get
+    if (message := check_name(get("name", ""))) is not None:
+        errors["name"] = message
+    if (message := check_client_phone(get("phone", ""))) is not None:
+        errors["phone"] = message
+    if (message := check_client_email(get("email", ""))) is not None:
+        errors["email"] = message
+    if (message := check_city(get("city", ""))) is not None:
+        errors["city"] = message
+    return errors
+
+
+@schema("un proveedor", PROVIDER_FIELDS)
+def validate_provider(data):
+    """
+    Valida los datos de un proveedor.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos de un proveedor.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+    get = data.get
+    if (message := check_name(get("name", ""))) is not None:
+        errors["name"] = message
+    if (message := check_email(get("email", ""))) is not None:
+        errors["email"] = message
+    if (message := check_city(get("city", ""))) is not None:
+        errors["city"] = message
+    return errors
+
+
+@schema("un medicamento", MEDICINE_FIELDS)
+def validate_medicine(data):
+    """
+    Valida los datos de un medicamento.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos de un medicamento.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+    get = data.get
+    if (message := check_medicine_name(get("name", ""))) is not None:
+        errors["name"] = message
+    if (message := check_description(get("description", ""))) is not None:
+        errors["description"] = message
+    if (message := check_dose(get("dose"))) is not None:
+        errors["dose"] = message
+    return errors
+
+
+@schema("un producto", PRODUCT_FIELDS)
+def validate_product(data):
+    """
+    Valida los datos de un producto.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos de un producto.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+    get = data.get
+    if (message := check_name(get("name", ""))) is not None:
+        errors["name"] = message
+    if (message := check_type(get("type", ""))) is not None:
+        errors["type"] = message
+    if (message := check_price(get("price", ""))) is not None:
+        errors["price"] = message
+    return errors
+
+
+@schema("una mascota", PET_FIELDS)
+def validate_pet(data):
+    """
+    Valida los datos de una mascota.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos de una mascota.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+    get = data.get
+    if (message := check_name(get("name", ""))) is not None:
+        errors["name"] = message
+    if (message := check_breed(get("breed", ""))) is not None:
+        errors["breed"] = message
+    if (message := check_birthday(get("birthday", ""))) is not None:
+        errors["birthday"] = message
+    return errors
+
+
+@schema("un veterinario", VET_FIELDS)
+def validate_vet(data):
+    """
+    Valida los datos de un veterinario.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos de un veterinario.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+    get = data.get
+    if (message := check_name(get("name", ""))) is not None:
+        errors["name"] = message
+    if (message := check_email(get("email", ""))) is not None:
+        errors["email"] = message
+    if (message := check_vet_phone(get("phone", ""))) is not None:
+        errors["phone"] = message
+    if (message := check_speciality(get("speciality", ""))) is not None:
+        errors["speciality"] = message
+    return errors
@@ -0,0 +1,81 @@
+import datetime
+import time
+
+from django.core.cache import cache
+from django.views.decorators.http import condition
+
+
+def version_key(model):
+    """
+    Retorna la clave de cache donde se guarda la versión de cambios de un modelo.
+
+    Args:
+        model (type): La clase del modelo.
+
+    Returns:
+        str: La clave de cache.
+    """
+    return f"vetsoft:version:{model._meta.label_lower}"
+
+
+def get_version(model):
+    """
+    Retorna la versión de cambios actual de un modelo.
+
+    La versión es la marca de tiempo (en nanosegundos) de la última escritura conocida.
+    Si todavía no existe (o fue desalojada del cache) se inicializa con el momento
+    actual, de modo que nunca se repite una versión ya entregada a un cliente.
+
+    Args:
+        model (type): La clase del modelo.
+
+    Returns:
+        int: La versión de cambios del modelo.
+    """
+    key = version_key(model)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key) or time.time_ns()
+    return version
+
+
+def bump_version(model):
+    """
+    Registra que el modelo cambió, invalidando las respuestas condicionales y los
+    caches que dependen de su versión.
+
+    Args:
+        model (type): La clase del modelo que se escribió.
+
+    Returns:
+        int: La nueva versión del modelo.
+    """
+    key = version_key(model)
+    version = max(time.time_ns(), (cache.get(key) or 0) + 1)
+    cache.set(key, version, None)
+    return version
+
+
+def conditional_listing(model):
+    """
+    Decorador para los listados que responde `If-None-Match` / `If-Modified-Since` con un
+    304 a partir de la versión del modelo, sin ejecutar la vista (ni consultas ni template).
+
+    Args:
+        model (type): El modelo cuyo listado renderiza la vista.
+
+    Returns:
+        callable: El decorador a aplicar sobre la vista.
+    """
+    def etag(request, *args, **kwargs):
+        """ETag débil derivado de la versión del modelo."""
+        return f'W/"{get_version(model):x}"'
+
+    def last_modified(request, *args, **kwargs):
+        """Fecha de la última escritura del modelo."""
+        return datetime.datetime.fromtimestamp(
+            get_version(model) / 1e9, tz=datetime.timezone.utc,
+        )
+
+    return condition(etag_func=etag, last_modified_func=last_modified)
@@ -1,7 +1,95 @@
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db import transaction
+from django.http import FileResponse, Http404, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render, reverse
+from django.views.decorators.cache import cache_control, never_cache
+from django.views.decorators.http import require_POST
+
+from .bulk import bulk_delete
+from .exports import export_repository
+from .fulltext import fulltext_search
+from .imports import UPSERTERS
+from .jobs import resume_jobs, spool_upload, start_job
+from .models import (
+    Client,
+    ImportJob,
+    ImportModel,
+    Medicine,
+    Pet,
+    Product,
+    Provider,
+    Vet,
+)
+from .page_cache import render_cached
+from .pagination import paginate
+from .projection import project
+from .replicas import replica_reads
+from .search import search
+from .sorting import get_sort, sort_links, sort_ordering, sort_queryset
+from .streaming import stream_repository
+from .unit_of_work import written
+from .versions import conditional_listing
+
+# Secciones de la búsqueda por palabras: clave, título, modelo, URL de edición y columna
+# que se muestra debajo del nombre.
+FULLTEXT_SECTIONS = (
+    ("clients", "Clientes", Client, "clients_edit", "email"),
+    ("pets", "Mascotas", Pet, "pets_edit", "breed"),
+    ("medicines", "Medicinas", Medicine, "medicine_edit", "description"),
+)
+
+
+def render_repository(request, queryset, directory, name, context=None):
+    
+    """
+    Renderiza el listado `<directory>/repository.html` con las filas de `queryset` bajo la variable `name`.
+    Por defecto la página se pagina por cursor; con `?stream=1` se envía el listado completo en streaming.
+    El orden se toma de `?sort=` (solo columnas con índice, ver `sort_fields` del modelo) con desempate por id.
+    Después de una eliminación múltiple, `?deleted=` indica cuántos registros se eliminaron.
+    Solo se leen las columnas `listing_fields` del modelo y, si `REPOSITORY_CACHE_TIMEOUT` lo habilita, el HTML se
+    reutiliza hasta la próxima escritura del modelo. Cada fila se cachea además como fragmento (ver rows.html)
+    """
+    
+    sort = get_sort(request, queryset.model)
+    ordering = sort_ordering(sort)
+    deleted = request.GET.get("deleted", "")
+    queryset = project(queryset)
+    template = f"{directory}/repository.html"
+    context = {
+        **(context or {}),
+        "row_cache_timeout": settings.REPOSITORY_ROW_CACHE_TIMEOUT,
+        "sort": sort,
+        "sorting": sort_links(request, queryset.model, sort),
+        "deleted": int(deleted) if deleted.isdigit() else None,
+        "export_query": urlencode({
+            key: request.GET[key] for key in ("q", "sort") if request.GET.get(key)
+        }),
+    }
+    if request.GET.get("stream"):
+        return stream_repository(
+            request, template, f"{directory}/rows.html", name, sort_queryset(request, queryset), context,
+        )
+
+    def build_context():
+        """Pagina el listado; solo se ejecuta si la página no está en cache."""
+        page = paginate(request, queryset, ordering)
+        return {**context, name: page, "page": page}
+
+    return render_cached(request, queryset.model, template, build_context)
 
-from .models import Client, Medicine, Pet, Product, Provider, Vet
+def delete_selected(request, model, repository):
+    
+    """
+    Elimina los registros seleccionados con los checkboxes del listado (`ids`) en lotes de `DELETE ... WHERE id IN (...)`
+    y vuelve al listado `repository` informando cuántos se eliminaron con `?deleted=`
+    """
+    
+    ids = [int(value) for value in request.POST.getlist("ids") if value.isdigit()]
+    deleted = bulk_delete(model, ids)
 
+    return redirect(f"{reverse(repository)}?{urlencode({'deleted': deleted})}")
 
 def home(request):
     
@@ -11,14 +99,28 @@ def home(request):
     
     return render(request, "home.html")
 
+@cache_control(private=True, no_cache=True)
+@conditional_listing(Client)
+@replica_reads
 def clients_repository(request):
     
     """
-    Renderiza el template clients/repository.html. Este es el listado de clientes
+    Renderiza el template clients/repository.html. Este es el listado de clientes, paginado por cursor (`?after=` / `?before=`) o en streaming con `?stream=1`,
+    ordenable con `?sort=` y filtrado por prefijo con `?q=`
     """
     
-    clients = Client.objects.all()
-    return render(request, "clients/repository.html", {"clients": clients})
+    q = request.GET.get("q", "")
+    return render_repository(request, search(Client.objects.all(), q), "clients", "clients", {"q": q})
+
+@replica_reads
+def clients_export(request, export_format):
+    
+    """
+    Descarga el listado completo de clientes como CSV (`export.csv`) o JSON Lines (`export.jsonl`), en streaming. Respeta la búsqueda `?q=` y el orden `?sort=` del listado
+    """
+    
+    queryset = sort_queryset(request, search(Client.objects.all(), request.GET.get("q", "")))
+    return export_repository(queryset, "clientes", export_format)
 
 def clients_form(request, id=None):
     
@@ -58,17 +160,40 @@ def clients_delete(request):
     client_id = request.POST.get("client_id")
     client = get_object_or_404(Client, pk=int(client_id))
     client.delete()
+    written(Client)
 
     return redirect(reverse("clients_repo"))
 
+@require_POST
+def clients_bulk_delete(request):
+    
+    """
+    Elimina los clientes seleccionados en el listado
+    """
+    
+    return delete_selected(request, Client, "clients_repo")
+
+@cache_control(private=True, no_cache=True)
+@conditional_listing(Provider)
+@replica_reads
 def providers_repository(request):
     
     """
-    Renderiza el template providers/repository.html. Este es el listado de proveedores
+    Renderiza el template providers/repository.html. Este es el listado de proveedores, paginado por cursor (`?after=` / `?before=`) o en streaming con `?stream=1`
+    y ordenable con `?sort=`
+    """
+    
+    return render_repository(request, Provider.objects.all(), "providers", "providers")
+
+@replica_reads
+def providers_export(request, export_format):
+    
+    """
+    Descarga el listado completo de proveedores como CSV (`export.csv`) o JSON Lines (`export.jsonl`), en streaming. Respeta el orden `?sort=` del listado
     """
     
-    providers = Provider.objects.all()
-    return render(request, "providers/repository.html", {"providers": providers})
+    queryset = sort_queryset(request, Provider.objects.all())
+    return export_repository(queryset, "proveedores", export_format)
 
 def providers_form(request, id=None):
     
@@ -110,17 +235,40 @@ def providers_delete(request):
     provider_id = request.POST.get("provider_id")
     provider = get_object_or_404(Provider, pk=int(provider_id))
     provider.delete()
+    written(Provider)
 
     return redirect(reverse("providers_repo"))
 
+@require_POST
+def providers_bulk_delete(request):
+    
+    """
+    Elimina los proveedores seleccionados en el listado
+    """
+    
+    return delete_selected(request, Provider, "providers_repo")
+
+@cache_control(private=True, no_cache=True)
+@conditional_listing(Medicine)
+@replica_reads
 def medicine_repository(request):
     
     """
-    Renderiza el template medicine/repository.html. Este es el listado de medicamentos
+    Renderiza el template medicine/repository.html. Este es el listado de medicamentos, paginado por cursor (`?after=` / `?before=`) o en streaming con `?stream=1`
+    y ordenable con `?sort=`
     """
     
-    medicines = Medicine.objects.all()
-    return render(request, "medicine/repository.html", {"medicines": medicines})
+    return render_repository(request, Medicine.objects.all(), "medicine", "medicines")
+
+@replica_reads
+def medicine_export(request, export_format):
+    
+    """
+    Descarga el listado completo de medicamentos como CSV (`export.csv`) o JSON Lines (`export.jsonl`), en streaming. Respeta el orden `?sort=` del listado
+    """
+    
+    queryset = sort_queryset(request, Medicine.objects.all())
+    return export_repository(queryset, "medicamentos", export_format)
 
 def medicine_form(request, id=None):
     
@@ -164,17 +312,40 @@ def medicine_delete(request):
     medicine_id = request.POST.get("medicine_id")
     medicine = get_object_or_404(Medicine, pk=int(medicine_id))
     medicine.delete()
+    written(Medicine)
 
     return redirect(reverse("medicine_repo"))
 
+@require_POST
+def medicine_bulk_delete(request):
+    
+    """
+    Elimina los medicamentos seleccionados en el listado
+    """
+    
+    return delete_selected(request, Medicine, "medicine_repo")
+
+@cache_control(private=True, no_cache=True)
+@conditional_listing(Product)
+@replica_reads
 def products_repository(request):
     
     """
-    Renderiza el template products/repository.html. Este es el listado de productos
+    Renderiza el template products/repository.html. Este es el listado de productos, paginado por cursor (`?after=` / `?before=`) o en streaming con `?stream=1`
+    y ordenable con `?sort=`
     """
     
-    products = Product.objects.all()
-    return render(request, "products/repository.html", {"products": products})
+    return render_repository(request, Product.objects.all(), "products", "products")
+
+@replica_reads
+def products_export(request, export_format):
+    
+    """
+    Descarga el listado completo de productos como CSV (`export.csv`) o JSON Lines (`export.jsonl`), en streaming. Respeta el orden `?sort=` del listado
+    """
+    
+    queryset = sort_queryset(request, Product.objects.all())
+    return export_repository(queryset, "productos", export_format)
 
 def products_form(request, id=None):
     
@@ -216,17 +387,41 @@ def products_delete(request):
     product_id = request.POST.get("product_id")
     product = get_object_or_404(Product, pk=int(product_id))
     product.delete()
+    written(Product)
 
     return redirect(reverse("products_repo"))
 
+@require_POST
+def products_bulk_delete(request):
+    
+    """
+    Elimina los productos seleccionados en el listado
+    """
+    
+    return delete_selected(request, Product, "products_repo")
+
+@cache_control(private=True, no_cache=True)
+@conditional_listing(Pet)
+@replica_reads
 def pets_repository(request):
     
     """
-    Renderiza el template pets/repository.html. Este es el listado de mascotas
+    Renderiza el template pets/repository.html. Este es el listado de mascotas, paginado por cursor (`?after=` / `?before=`) o en streaming con `?stream=1`,
+    ordenable con `?sort=` y filtrado por prefijo con `?q=`
     """
     
-    pets = Pet.objects.all()
-    return render(request, "pets/repository.html", {"pets": pets})
+    q = request.GET.get("q", "")
+    return render_repository(request, search(Pet.objects.all(), q), "pets", "pets", {"q": q})
+
+@replica_reads
+def pets_export(request, export_format):
+    
+    """
+    Descarga el listado completo de mascotas como CSV (`export.csv`) o JSON Lines (`export.jsonl`), en streaming. Respeta la búsqueda `?q=` y el orden `?sort=` del listado
+    """
+    
+    queryset = sort_queryset(request, search(Pet.objects.all(), request.GET.get("q", "")))
+    return export_repository(queryset, "mascotas", export_format)
 
 def pets_form(request, id=None):
     
@@ -268,17 +463,40 @@ def pets_delete(request):
     pet_id = request.POST.get("pet_id")
     pet = get_object_or_404(Pet, pk=int(pet_id))
     pet.delete()
+    written(Pet)
 
     return redirect(reverse("pets_repo"))
 
+@require_POST
+def pets_bulk_delete(request):
+    
+    """
+    Elimina los mascotas seleccionados en el listado
+    """
+    
+    return delete_selected(request, Pet, "pets_repo")
+
+@cache_control(private=True, no_cache=True)
+@conditional_listing(Vet)
+@replica_reads
 def vets_repository(request):
     
     """
-    Renderiza el template vets/repository.html. Este es el listado de veterinarios
+    Renderiza el template vets/repository.html. Este es el listado de veterinarios, paginado por cursor (`?after=` / `?before=`) o en streaming con `?stream=1`
+    y ordenable con `?sort=`
+    """
+    
+    return render_repository(request, Vet.objects.all(), "vets", "vets")
+
+@replica_reads
+def vets_export(request, export_format):
+    
+    """
+    Descarga el listado completo de veterinarios como CSV (`export.csv`) o JSON Lines (`export.jsonl`), en streaming. Respeta el orden `?sort=` del listado
     """
     
-    vets = Vet.objects.all()
-    return render(request, "vets/repository.html", {"vets": vets})
+    queryset = sort_queryset(request, Vet.objects.all())
+    return export_repository(queryset, "veterinarios", export_format)
 
 def vets_form(request, id=None):
     
@@ -320,5 +538,143 @@ def vets_delete(request):
     vet_id = request.POST.get("vet_id")
     vet = get_object_or_404(Vet, pk=int(vet_id))
     vet.delete()
+    written(Vet)
+
+    return redirect(reverse("vets_repo"))
+
+@require_POST
+def vets_bulk_delete(request):
+    
+    """
+    Elimina los veterinarios seleccionados en el listado
+    """
+    
+    return delete_selected(request, Vet, "vets_repo")
+
+def imports_repository(request):
+    
+    """
+    Renderiza el template imports/repository.html, con el formulario para subir un CSV y las últimas importaciones.
+    El archivo subido se guarda en disco y se importa en segundo plano (ver app/jobs.py); la request redirige enseguida a la página de avance
+    """
+    
+    resume_jobs()
+    errors = {}
+
+    if request.method == "POST":
+        model = request.POST.get("model", "")
+        upsert = request.POST.get("upsert") == "on"
+        upload = request.FILES.get("file")
+
+        if model not in dict(ImportModel.choices()):
+            errors["model"] = "Por favor seleccione qué importar"
+        elif upsert and model not in UPSERTERS:
+            errors["upsert"] = "La actualización por email solo está disponible para clientes, proveedores y veterinarios"
+        if upload is None:
+            errors["file"] = "Por favor seleccione un archivo CSV"
+
+        if not errors:
+            job = spool_upload(upload, model, upsert)
+            # Si la request corre en una transacción, el hilo no ve la importación hasta el commit
+            transaction.on_commit(lambda: start_job(job.pk))
+            return redirect(reverse("imports_detail", args=[job.pk]))
+
+    return render(request, "imports/repository.html", {
+        "errors": errors,
+        "data": request.POST,
+        "models": ImportModel.choices(),
+        "jobs": ImportJob.objects.order_by("-id")[:20],
+    })
+
+def imports_detail(request, id):
+    
+    """
+    Renderiza el template imports/detail.html con el avance de una importación, que se actualiza consultando imports_progress
+    """
+    
+    resume_jobs()
+    job = get_object_or_404(ImportJob, pk=id)
+    return render(request, "imports/detail.html", {"job": job})
+
+@never_cache
+def imports_progress(request, id):
+    
+    """
+    Retorna en JSON el avance de una importación: filas procesadas, importadas y rechazadas, filas por segundo y estado
+    """
+    
+    resume_jobs()
+    job = get_object_or_404(ImportJob, pk=id)
+    return JsonResponse({
+        "status": job.status,
+        "status_display": job.get_status_display(),
+        "finished": job.finished,
+        "rows": job.rows,
+        "imported": job.imported,
+        "rejected": job.rejected,
+        "rows_per_second": round(job.rows_per_second, 1),
+        "error": job.error,
+    })
 
-    return redirect(reverse("vets_repo"))
\ No newline at end of file
+def imports_rejected(request, id):
+    
+    """
+    Descarga el CSV con las filas rechazadas de una importación y el motivo de cada rechazo
+    """
+    
+    job = get_object_or_404(ImportJob, pk=id)
+    try:
+        rejected = open(job.rejected_path, "rb")
+    except FileNotFoundError as e:
+        raise Http404("La importación no tiene filas rechazadas") from e
+
+    return FileResponse(rejected, as_attachment=True, filename=f"importacion-{job.pk}-rechazadas.csv")
+
+def fulltext_results(q):
+    
+    """
+    Busca `q` por palabras en clientes, mascotas y medicinas y arma, por sección, los `FULLTEXT_RESULTS` resultados más relevantes
+    con su nombre, detalle, relevancia y URL de edición
+    """
+    
+    return [
+        {
+            "key": key,
+            "title": title,
+            "results": [
+                {
+                    "id": record.pk,
+                    "name": record.name,
+                    "detail": getattr(record, detail),
+                    "rank": record.rank,
+                    "url": reverse(edit, args=[record.pk]),
+                }
+                for record in fulltext_search(model, q, settings.FULLTEXT_RESULTS)
+            ],
+        }
+        for key, title, model, edit, detail in FULLTEXT_SECTIONS
+    ]
+
+@replica_reads
+def fulltext_repository(request):
+    
+    """
+    Renderiza el template search/results.html: busca `?q=` por palabras (en cualquier orden, completas o por prefijo, sin distinguir
+    mayúsculas ni acentos) en los nombres de clientes y mascotas y en el nombre y la descripción de las medicinas, de la más a la menos relevante
+    """
+    
+    q = request.GET.get("q", "")
+    return render(request, "search/results.html", {"q": q, "sections": fulltext_results(q)})
+
+@replica_reads
+def fulltext_json(request):
+    
+    """
+    Retorna en JSON los resultados de la búsqueda por palabras de `?q=`, como en fulltext_repository, agrupados por sección
+    """
+    
+    q = request.GET.get("q", "")
+    return JsonResponse({
+        "q": q,
+        "results": {section["key"]: section["results"] for section in fulltext_results(q)},
+    })
@@ -0,0 +1,124 @@
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.template import engines
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.urls.converters import IntConverter, UUIDConverter
+
+# Valor de ejemplo para los parámetros de las URLs según su converter (el resto usa "x")
+CONVERTER_SAMPLES = {
+    IntConverter: 1,
+    UUIDConverter: "00000000-0000-0000-0000-000000000000",
+}
+
+
+def template_names():
+    """
+    Lista los templates propios del proyecto: los de `DIRS` y los de la aplicación `app`.
+
+    Los templates de las aplicaciones de Django (por ejemplo el admin) no se incluyen,
+    ya que no forman parte de las páginas que atiende la aplicación.
+
+    Returns:
+        list: Los nombres relativos (por ejemplo "clients/repository.html").
+    """
+    directories = [Path(apps.get_app_config("app").path) / "templates"]
+    for engine in engines.all():
+        directories.extend(Path(directory) for directory in engine.dirs)
+
+    names = set()
+    for root in directories:
+        if root.is_dir():
+            names.update(
+                path.relative_to(root).as_posix()
+                for path in root.rglob("*.html")
+            )
+    return sorted(names)
+
+
+def warm_templates():
+    """
+    Compila todos los templates para que queden en el cache del loader.
+
+    Returns:
+        int: La cantidad de templates compilados.
+    """
+    names = template_names()
+    for engine in engines.all():
+        # Importa los context processors configurados (y lo que importan a su vez)
+        engine.engine.template_context_processors
+        for name in names:
+            engine.get_template(name)
+    return len(names)
+
+
+def url_names(patterns=None, namespace=None):
+    """
+    Recorre las URLs configuradas y genera los nombres con parámetros de ejemplo.
+
+    Args:
+        patterns (list): Patrones a recorrer; por defecto los del URLconf raíz.
+        namespace (str): Namespace acumulado de los `include` recorridos.
+
+    Yields:
+        tuple: (nombre, kwargs) para usar con `reverse`.
+    """
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            inner = pattern.namespace
+            if namespace and inner:
+                inner = f"{namespace}:{inner}"
+            yield from url_names(pattern.url_patterns, inner or namespace)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            converters = pattern.pattern.converters
+            if not converters and pattern.pattern.regex.groupindex:
+                # Los patrones con expresiones regulares (re_path) no tienen un valor
+                # de ejemplo confiable para sus grupos; se omiten.
+                continue
+            kwargs = {
+                key: CONVERTER_SAMPLES.get(type(converter), "x")
+                for key, converter in converters.items()
+            }
+            name = f"{namespace}:{pattern.name}" if namespace else pattern.name
+            yield name, kwargs
+
+
+def warm_urls():
+    """
+    Carga el URLconf y resuelve todos los nombres de URL (ida y vuelta).
+
+    Returns:
+        int: La cantidad de nombres de URL resueltos.
+    """
+    resolver = get_resolver()
+    count = 0
+    for name, kwargs in url_names():
+        resolver.resolve(reverse(name, kwargs=kwargs))
+        count += 1
+    return count
+
+
+def warm_up(templates=True, urls=True):
+    """
+    Precalienta el proceso antes de atender tráfico: compila los templates y resuelve
+    las URLs, de modo que la primera request de cada worker no pague ese costo.
+
+    Args:
+        templates (bool): Si se compilan los templates.
+        urls (bool): Si se resuelven los nombres de URL.
+
+    Returns:
+        dict: Cantidad de templates y URLs precalentadas y el tiempo total en segundos.
+    """
+    start = time.perf_counter()
+    result = {"templates": 0, "urls": 0}
+    if templates:
+        result["templates"] = warm_templates()
+    if urls:
+        result["urls"] = warm_urls()
+    result["seconds"] = time.perf_counter() - start
+    return result
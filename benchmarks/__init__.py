@@ -0,0 +1,79 @@
+"""
+Benchmarks de rendimiento de Vetsoft.
+
+Cada módulo se ejecuta desde la raíz del proyecto con `python -m benchmarks.<nombre>` y
+trabaja sobre una base SQLite temporal, sin tocar la base configurada en `DB_NAME`.
+"""
+
+import atexit
+import os
+import statistics
+import tempfile
+import time
+
+
+def setup_django(db_name=None):
+    """
+    Configura Django contra una base SQLite temporal y aplica las migraciones.
+
+    Args:
+        db_name (str): Ruta de la base a utilizar. Por defecto se crea un archivo temporal
+            que se elimina al terminar el proceso.
+
+    Returns:
+        str: La ruta de la base de datos utilizada.
+    """
+    if db_name is None:
+        handle, db_name = tempfile.mkstemp(suffix=".sqlite3", prefix="vetsoft-bench-")
+        os.close(handle)
+        os.unlink(db_name)
+        atexit.register(_remove_database, db_name)
+
+    os.environ["DB_ENGINE"] = "django.db.backends.sqlite3"
+    os.environ["DB_NAME"] = db_name
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vetsoft.settings")
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", verbosity=0)
+    return db_name
+
+
+def _remove_database(db_name):
+    """Elimina la base temporal y sus archivos auxiliares (-wal, -shm, -journal)."""
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(db_name + suffix):
+            os.unlink(db_name + suffix)
+
+
+def measure(func, repeat=20):
+    """
+    Ejecuta una función varias veces y retorna la mediana y el mejor tiempo en milisegundos.
+
+    Args:
+        func (callable): La función a medir, sin argumentos.
+        repeat (int): Cantidad de ejecuciones.
+
+    Returns:
+        tuple: (mediana_ms, mejor_ms)
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), min(timings)
+
+
+def report(label, median_ms, best_ms):
+    """
+    Imprime una línea de resultados con formato uniforme.
+
+    Args:
+        label (str): Descripción de la medición.
+        median_ms (float): Mediana en milisegundos.
+        best_ms (float): Mejor tiempo en milisegundos.
+    """
+    print(f"{label:<55} mediana {median_ms:9.3f} ms   mejor {best_ms:9.3f} ms")
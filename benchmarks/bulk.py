@@ -0,0 +1,68 @@
+"""
+Benchmark de las cargas masivas `save_*_bulk` contra `save_*` fila por fila.
+
+Uso:
+    python -m benchmarks.bulk [--rows 400000] [--single-rows 5000]
+
+Arma N filas de clientes con el mismo formato que recibe `save_client` y mide cuántas
+filas por segundo se guardan con `Client.save_client_bulk` y, sobre una muestra más
+chica (fila por fila es lento), con `Client.save_client`.
+"""
+
+import argparse
+import time
+
+from benchmarks import setup_django
+
+
+def client_rows(count, start=0):
+    """Genera los datos de `count` clientes válidos."""
+    for index in range(start, start + count):
+        yield {
+            "name": "Cliente Migrado",
+            "phone": str(5422100000 + index),
+            "email": f"migrado{index}@vetsoft.com",
+            "city": "La Plata",
+        }
+
+
+def throughput(label, count, func):
+    """Ejecuta `func`, imprime las filas por segundo y retorna el valor."""
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    rate = count / seconds
+    print(f"{label:<45} {count:>9} filas en {seconds:8.2f} s   {rate:>11,.0f} filas/s")
+    return rate
+
+
+def main():
+    """Ejecuta el benchmark de cargas masivas."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=400_000)
+    parser.add_argument("--single-rows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+
+    from app.models import Client
+
+    def one_at_a_time():
+        for row in client_rows(args.single_rows):
+            Client.save_client(row)
+
+    single = throughput("save_client (fila por fila)", args.single_rows, one_at_a_time)
+
+    bulk = throughput(
+        f"save_client_bulk (lotes de {settings.BULK_BATCH_SIZE})",
+        args.rows,
+        lambda: Client.save_client_bulk(client_rows(args.rows, start=args.single_rows)),
+    )
+
+    print(f"Mejora: {bulk / single:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
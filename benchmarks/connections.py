@@ -0,0 +1,122 @@
+"""
+Benchmark del costo de conexión por request: sin conexiones persistentes, con
+`CONN_MAX_AGE` y con el pool de `app.backends.sqlite_pool`.
+
+Uso:
+    python -m benchmarks.connections [--requests 2000] [--threads 4]
+
+Atiende N requests a `/clientes/` con el handler WSGI de Django (el mismo camino que con
+gunicorn, incluida la señal `request_finished` que cierra las conexiones). Lo hace en
+`--threads` hilos nuevos por tanda, como el servidor de desarrollo, que crea un hilo por
+request. Cada configuración corre en un proceso nuevo:
+
+- `cerrar`: `CONN_MAX_AGE=0`, se abre y se cierra una conexión por request.
+- `persistente`: `CONN_MAX_AGE=60` con `CONN_HEALTH_CHECKS`, una conexión por hilo.
+- `pool`: `CONN_MAX_AGE=0` con `DB_ENGINE=app.backends.sqlite_pool`.
+
+Imprime las requests por segundo, las conexiones abiertas y, con el pool, sus métricas.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks import setup_django
+from benchmarks.bulk import client_rows
+
+MODES = {
+    "cerrar": {"DB_CONN_MAX_AGE": "0"},
+    "persistente": {"DB_CONN_MAX_AGE": "60", "DB_CONN_HEALTH_CHECKS": "True"},
+    "pool": {"DB_CONN_MAX_AGE": "0", "DB_ENGINE": "app.backends.sqlite_pool"},
+}
+
+
+def run_mode(args):
+    """Atiende las requests con la configuración indicada e imprime el resultado."""
+    engine = MODES[args.mode].get("DB_ENGINE")
+    os.environ.update(MODES[args.mode])
+    setup_django()
+    if engine:
+        # `setup_django` fija el motor SQLite estándar para migrar; las requests usan el pool.
+        from django.db import connections
+
+        connections.close_all()
+        connections.settings["default"]["ENGINE"] = engine
+        del connections["default"]
+
+    from django.core.handlers.wsgi import WSGIHandler
+    from django.db.backends.signals import connection_created
+    from django.test import RequestFactory
+
+    from app.models import Client
+
+    Client.save_client_bulk(client_rows(1_000))
+
+    opened = []
+    connection_created.connect(lambda sender, connection, **kwargs: opened.append(1), weak=False)
+    handler = WSGIHandler()
+    environ = RequestFactory().get("/clientes/", {"page_size": 10}).environ
+
+    def serve(count):
+        for _ in range(count):
+            response = handler(dict(environ), lambda status, headers: None)
+            b"".join(response)
+            response.close()
+
+    per_thread = args.requests // args.threads
+    batches = 10
+    start = time.perf_counter()
+    for _ in range(batches):
+        threads = [
+            threading.Thread(target=serve, args=(per_thread // batches,))
+            for _ in range(args.threads)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    seconds = time.perf_counter() - start
+    served = per_thread // batches * batches * args.threads
+    if engine:
+        # Con el pool `connection_created` se emite en cada préstamo; se cuentan las abiertas.
+        from app.backends.sqlite_pool.base import pool_stats
+
+        opened = [1] * sum(stats["misses"] for stats in pool_stats().values())
+
+    print(
+        f"{args.mode:<12} {served:>6} requests en {seconds:6.2f} s   "
+        f"{served / seconds:>8,.0f} req/s   {len(opened):>6} conexiones abiertas",
+    )
+    if engine:
+        for stats in pool_stats().values():
+            print(
+                f"{'':<12} pool: {stats['hits']} hits, {stats['misses']} conexiones nuevas "
+                f"({stats['setup_seconds'] * 1000:.1f} ms), {stats['waits']} esperas "
+                f"({stats['wait_seconds'] * 1000:.1f} ms)",
+            )
+
+
+def main():
+    """Ejecuta el benchmark con cada configuración, en un proceso nuevo por configuración."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--mode", choices=MODES)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args)
+        return
+
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.connections", *sys.argv[1:], "--mode", mode],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
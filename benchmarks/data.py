@@ -0,0 +1,136 @@
+"""
+Generación rápida de datos sintéticos para los benchmarks.
+
+Las filas se insertan con `executemany` dentro de una única transacción para que poblar
+millones de registros tome segundos y no minutos.
+"""
+
+import datetime
+import random
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+FIRST_NAMES = [
+    "Juan", "Guido", "Lucia", "Martina", "Sofia", "Mateo", "Valentina", "Bruno",
+    "Camila", "Tomas", "Renata", "Rocio", "Demian", "Mariano", "Luciana", "Agustin",
+]
+LAST_NAMES = [
+    "Veron", "Carrillo", "Gomez", "Perez", "Fernandez", "Lopez", "Diaz", "Martinez",
+    "Romero", "Sosa", "Alvarez", "Torres", "Ruiz", "Ramirez", "Flores", "Acosta",
+]
+CITIES = ["La Plata", "Berisso", "Ensenada"]
+BREEDS = ["Labrador", "Caniche", "Siames", "Persa", "Beagle", "Mestizo", "Bulldog"]
+SPECIALITIES = [
+    "Oftalmologia", "Quimioterapia", "Radiologia", "Ecocardiografias",
+    "Traumatologia", "Ecografias", "Urgencias",
+]
+PRODUCT_TYPES = ["Alimento", "Juguete", "Higiene", "Accesorio"]
+WORDS = [
+    "antibiotico", "analgesico", "antiinflamatorio", "antiparasitario", "vacuna",
+    "vitaminas", "oral", "inyectable", "felinos", "caninos", "cachorros", "adultos",
+]
+
+
+def _name(rng, index):
+    """Genera un nombre único y válido (solo letras y espacios) para la fila `index`."""
+    suffix = "".join(chr(ord("a") + int(digit)) for digit in str(index))
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {suffix}"
+
+
+def _insert(table, columns, rows, batch_size):
+    """
+    Inserta filas en lotes con `executemany` dentro de una transacción.
+
+    Todas las filas reciben la misma fecha de `updated_at`.
+    """
+    now = timezone.now()
+    columns = [*columns, "updated_at"]
+    rows = ((*row, now) for row in rows)
+    sql = "INSERT INTO {} ({}) VALUES ({})".format(
+        table, ", ".join(columns), ", ".join(["%s"] * len(columns)),
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                cursor.executemany(sql, batch)
+                batch = []
+        if batch:
+            cursor.executemany(sql, batch)
+
+
+def fill_clients(count, seed=1, batch_size=50_000):
+    """Inserta `count` clientes sintéticos."""
+    rng = random.Random(seed)
+    rows = (
+        (
+            _name(rng, index),
+            str(5422100000 + index),
+            f"cliente{index}@vetsoft.com",
+            rng.choice(CITIES),
+        )
+        for index in range(count)
+    )
+    _insert("app_client", ["name", "phone", "email", "city"], rows, batch_size)
+
+
+def fill_providers(count, seed=1, batch_size=50_000):
+    """Inserta `count` proveedores sintéticos."""
+    rng = random.Random(seed)
+    rows = (
+        (_name(rng, index), f"proveedor{index}@vetsoft.com", rng.choice(CITIES))
+        for index in range(count)
+    )
+    _insert("app_provider", ["name", "email", "city"], rows, batch_size)
+
+
+def fill_medicines(count, seed=1, batch_size=50_000):
+    """Inserta `count` medicamentos sintéticos."""
+    rng = random.Random(seed)
+    rows = (
+        (_name(rng, index), " ".join(rng.sample(WORDS, 4)), rng.randint(1, 10))
+        for index in range(count)
+    )
+    _insert("app_medicine", ["name", "description", "dose"], rows, batch_size)
+
+
+def fill_products(count, seed=1, batch_size=50_000):
+    """Inserta `count` productos sintéticos."""
+    rng = random.Random(seed)
+    rows = (
+        (_name(rng, index), rng.choice(PRODUCT_TYPES), round(rng.uniform(1, 5000), 2))
+        for index in range(count)
+    )
+    _insert("app_product", ["name", "type", "price"], rows, batch_size)
+
+
+def fill_pets(count, seed=1, batch_size=50_000):
+    """Inserta `count` mascotas sintéticas."""
+    rng = random.Random(seed)
+    start = datetime.date(2005, 1, 1)
+    rows = (
+        (
+            _name(rng, index),
+            rng.choice(BREEDS),
+            start + datetime.timedelta(days=rng.randint(0, 7000)),
+        )
+        for index in range(count)
+    )
+    _insert("app_pet", ["name", "breed", "birthday"], rows, batch_size)
+
+
+def fill_vets(count, seed=1, batch_size=50_000):
+    """Inserta `count` veterinarios sintéticos."""
+    rng = random.Random(seed)
+    rows = (
+        (
+            _name(rng, index),
+            f"vet{index}@vetsoft.com",
+            str(5422100000 + index),
+            rng.choice(SPECIALITIES),
+        )
+        for index in range(count)
+    )
+    _insert("app_vet", ["name", "email", "phone", "speciality"], rows, batch_size)
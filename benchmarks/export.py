@@ -0,0 +1,68 @@
+"""
+Benchmark de la exportación CSV / JSON Lines de los listados.
+
+Uso:
+    python -m benchmarks.export [--rows 1000000]
+
+Puebla una base temporal con N clientes y descarga `/clientes/export.csv` y `.jsonl`
+con el cliente de pruebas de Django, midiendo el tiempo hasta el primer bloque, el
+tiempo total, las filas por segundo y el pico de memoria (tracemalloc) mientras se
+consume la respuesta.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from benchmarks import setup_django
+
+
+def download(client, url):
+    """Descarga una exportación y retorna (primer bloque s, total s, bytes)."""
+    start = time.perf_counter()
+    response = client.get(url)
+    chunks = iter(response.streaming_content)
+    size = len(next(chunks))
+    first = time.perf_counter() - start
+    for chunk in chunks:
+        size += len(chunk)
+    return first, time.perf_counter() - start, size
+
+
+def main():
+    """Ejecuta el benchmark de exportación."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import Client as HttpClient
+    from django.test.utils import setup_test_environment
+    from django.urls import reverse
+
+    from benchmarks.data import fill_clients
+
+    setup_test_environment()
+    print(f"Poblando {args.rows} clientes...")
+    fill_clients(args.rows)
+    client = HttpClient()
+
+    for export_format in ("csv", "jsonl"):
+        url = reverse("clients_export", args=[export_format])
+        first, total, size = download(client, url)
+
+        tracemalloc.start()
+        download(client, url)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{export_format:<6} primer bloque {first * 1000:8.1f} ms   total {total:6.2f} s   "
+            f"{args.rows / total:>10,.0f} filas/s   {size / 2**20:7.1f} MiB   "
+            f"pico de memoria {peak / 2**20:5.1f} MiB",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+Validadores anteriores al esquema compilado de `app.validation`, sin cambios.
+
+Se conservan solo como referencia para `benchmarks.validation`, que compara su
+rendimiento y verifica que ambas versiones retornan los mismos errores.
+"""
+
+import datetime
+import re
+
+
+def validate_client(data):
+    """
+    Valida los datos de un cliente.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos del cliente.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+
+    name = data.get("name", "")
+    phone = data.get("phone", "")
+    email = data.get("email", "")
+    city = data.get("city", "")
+
+    if name == "":
+        errors["name"] = "Por favor ingrese un nombre"
+    elif not re.match(r"^[A-Za-z\s]+$", name):
+        errors["name"] = "El nombre debe contener solo letras y espacios"
+
+    if phone == "":
+        errors["phone"] = "Por favor ingrese un teléfono"
+    elif not phone.isdigit():
+        errors["phone"] = "El teléfono debe ser un número"
+    elif not phone.startswith("54"):
+        errors["phone"] = "El teléfono debe empezar con el prefijo 54"
+    if email == "":
+        errors["email"] = "Por favor ingrese un email"
+    elif email.count(" ") > 0:
+        errors["email"] = "Por favor ingrese un email sin espacios en blanco"
+    elif email.count("@") == 0 or email.count("@") > 1:
+        errors["email"] = "Por favor ingrese un email valido"
+    elif not email.endswith('@vetsoft.com'):
+        errors["email"] = "Por favor ingrese un email que incluya '@vetsoft.com'"
+    elif email == "@vetsoft.com":
+        errors["email"] = "Por favor ingrese un email válido, no solo '@vetsoft.com'"
+
+    if city == "":
+        errors["city"] = "Por favor seleccione una ciudad"
+
+    return errors
+
+def validate_provider(data):
+    """
+    Valida los datos de un proveedor.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos del proveedor.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+    
+    name = data.get("name", "")
+    email = data.get("email", "")
+    city = data.get("city", "")
+
+    if name == "":
+        errors["name"] = "Por favor ingrese un nombre"
+    elif not re.match(r"^[A-Za-z\s]+$", name):
+        errors["name"] = "El nombre debe contener solo letras y espacios"
+
+    if email == "":
+        errors["email"] = "Por favor ingrese un email"
+    elif email.count("@") == 0:
+        errors["email"] = "Por favor ingrese un email valido"
+
+    if city == "":
+        errors["city"] = "Por favor seleccione una ciudad"
+
+    return errors
+
+def validate_medicine(data):
+    """
+    Valida los datos de un medicamento.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos del medicamento.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+
+    name = data.get("name", "")
+    description = data.get("description", "")
+    dose = data.get("dose")
+    if dose is not None:
+        try:
+            num = int(dose)
+        except ValueError:
+            num = None     
+
+    if name == "":
+        errors["name"] = "Por favor, ingrese un nombre de la medicina"
+    elif not re.match(r"^[A-Za-z\s]+$", name):
+        errors["name"] = "El nombre debe contener solo letras y espacios"
+    
+    if description == "":
+        errors["description"] = "Por favor, ingrese una descripcion de la medicina"
+    
+    if dose is None or dose == "":
+        errors["dose"] = "Por favor, ingrese una cantidad de la dosis de la medicina"
+    elif not isinstance(dose, str) or not dose.isdigit():
+        errors["dose"] = "La dosis debe ser un numero entero"
+    elif not (num > 0 and num < 11):
+        errors["dose"] = "La dosis debe estar entre 1 y 10"
+
+    return errors
+    
+def validate_product(data):
+    """
+    Valida los datos de un producto.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos del producto.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors={}
+
+    name = data.get("name","")
+    type = data.get("type","")
+    price = data.get("price","")
+
+    if name == "":
+        errors["name"] = "Por favor ingrese un nombre"
+    elif not re.match(r"^[A-Za-z\s]+$", name):
+        errors["name"] = "El nombre debe contener solo letras y espacios"
+    
+    if type == "":
+        errors["type"] = "Por favor ingrese un tipo"
+
+    if price == "":
+        errors["price"] = "Por favor ingrese un precio"
+    else:
+        try:
+            price_value = float(price)
+            if price_value <= 0.0:
+                errors["price"] = "Por favor ingrese un precio mayor a cero"
+        except ValueError:
+            errors["price"] = "Por favor ingrese un precio válido"
+
+    return errors
+
+
+def validate_pet(data):
+    """
+    Valida los datos de una mascota.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos de la mascota.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors={}
+
+    name = data.get("name","")
+    breed = data.get("breed","")
+    birthday = data.get("birthday","")
+
+    if name == "":
+        errors["name"] = "Por favor ingrese un nombre"
+    elif not re.match(r"^[A-Za-z\s]+$", name):
+        errors["name"] = "El nombre debe contener solo letras y espacios"
+    
+    if breed == "":
+        errors["breed"] = "Por favor ingrese una raza"
+
+    date_now = datetime.date.today().strftime("%Y-%m-%d")
+
+    if birthday == "" or birthday >= date_now: 
+        errors["birthday"] = "Por favor ingrese una fecha de nacimiento valida y anterior a la de hoy"
+
+    return errors
+
+def validate_vet(data):
+    """
+    Valida los datos de un veterinario.
+
+    Args:
+        data (dict): Un diccionario que contiene los datos del veterinario.
+
+    Returns:
+        dict: Un diccionario que contiene los errores encontrados durante la validación.
+    """
+    errors = {}
+
+    name = data.get("name", "")
+    email = data.get("email", "")
+    phone = data.get("phone", "")
+    speciality = data.get("speciality", "")
+
+    if name == "":
+        errors["name"] = "Por favor ingrese un nombre"
+    elif not re.match(r"^[A-Za-z\s]+$", name):
+        errors["name"] = "El nombre debe contener solo letras y espacios"
+
+    if email == "":
+        errors["email"] = "Por favor ingrese un email"
+    elif email.count("@") == 0:
+        errors["email"] = "Por favor ingrese un email valido"
+
+    if phone == "":
+        errors["phone"] = "Por favor ingrese un teléfono"
+    elif not phone.startswith("54"):
+        errors["phone"] = "El teléfono debe empezar con el prefijo 54"
+    
+    if speciality == "":
+        errors["speciality"] = "Por favor seleccione una especialidad"
+
+    return errors
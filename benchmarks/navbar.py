@@ -0,0 +1,75 @@
+"""
+Micro-benchmark del context processor de la barra de navegación.
+
+Uso:
+    python -m benchmarks.navbar [--requests 100000]
+
+Compara el costo por request de la implementación anterior (copiar cada link y evaluar
+`startswith` en cada render) contra la actual (tuplas precalculadas por sección y
+evaluación diferida), tanto cuando el template no usa `links` como cuando los recorre.
+"""
+
+import argparse
+import timeit
+
+from benchmarks import setup_django
+
+
+def legacy_navbar(links, request):
+    """Implementación anterior de `app.context_processors.navbar`, como referencia."""
+    def add_active(link):
+        copy = link.copy()
+
+        if copy["href"] == "/":
+            copy["active"] = request.path == "/"
+        else:
+            copy["active"] = request.path.startswith(copy.get("href", ""))
+
+        return copy
+
+    return {"links": map(add_active, links)}
+
+
+def main():
+    """Ejecuta el micro-benchmark del navbar."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test import RequestFactory
+
+    from app.context_processors import links, navbar
+
+    legacy_links = [link._asdict() for link in links]
+    request = RequestFactory().get("/clientes/editar/42/")
+    number = args.requests
+
+    def legacy_unused():
+        legacy_navbar(legacy_links, request)
+
+    def legacy_used():
+        for link in legacy_navbar(legacy_links, request)["links"]:
+            link["active"]
+
+    def current_unused():
+        navbar(request)
+
+    def current_used():
+        for link in navbar(request)["links"]():
+            link.active
+
+    cases = [
+        ("anterior, template sin navbar", legacy_unused),
+        ("actual, template sin navbar", current_unused),
+        ("anterior, template que recorre links", legacy_used),
+        ("actual, template que recorre links", current_used),
+    ]
+    for label, func in cases:
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{label:<45} {seconds / number * 1e6:8.3f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
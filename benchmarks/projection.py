@@ -0,0 +1,73 @@
+"""
+Benchmark de la proyección de columnas de los listados.
+
+Uso:
+    python -m benchmarks.projection [--rows 100000]
+
+Compara, para Client, Pet y Vet, materializar N filas como instancias completas del
+modelo (`Model.objects.all()`) contra las tuplas con nombre que usan los listados
+(`app.projection.project`), midiendo tiempo de CPU y pico de memoria (tracemalloc).
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks import setup_django
+
+
+def profile(func):
+    """
+    Ejecuta `func` dos veces y retorna (segundos de CPU, pico de memoria en MiB).
+
+    El tiempo se mide sin tracemalloc activo, ya que el rastreo de memoria multiplica el
+    costo de cada asignación y distorsionaría la comparación de CPU.
+    """
+    gc.collect()
+    start = time.process_time()
+    rows = func()
+    elapsed = time.process_time() - start
+    del rows
+
+    gc.collect()
+    tracemalloc.start()
+    rows = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return elapsed, peak / (1024 * 1024)
+
+
+def main():
+    """Ejecuta el benchmark de proyección."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from app.models import Client, Pet, Vet
+    from app.projection import project
+    from benchmarks.data import fill_clients, fill_pets, fill_vets
+
+    print(f"Poblando {args.rows} filas por modelo...")
+    fill_clients(args.rows)
+    fill_pets(args.rows)
+    fill_vets(args.rows)
+
+    for model in (Client, Pet, Vet):
+        full_cpu, full_mem = profile(lambda model=model: list(model.objects.all()))
+        rows_cpu, rows_mem = profile(lambda model=model: list(project(model.objects.all())))
+
+        print(f"{model.__name__}")
+        print(f"  instancias completas   CPU {full_cpu:7.3f} s   memoria {full_mem:8.1f} MiB")
+        print(f"  filas proyectadas      CPU {rows_cpu:7.3f} s   memoria {rows_mem:8.1f} MiB")
+        print(
+            f"  reducción              CPU {1 - rows_cpu / full_cpu:7.1%}"
+            f"     memoria {1 - rows_mem / full_mem:7.1%}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark del cache de fragmentos por fila de los listados.
+
+Uso:
+    python -m benchmarks.row_cache [--rows 50000]
+
+Renderiza `clients/rows.html` con N clientes en cuatro escenarios: sin cache, con el
+cache vacío, con todas las filas en cache y luego de editar una sola fila.
+"""
+
+import argparse
+
+from benchmarks import measure, report, setup_django
+
+
+def main():
+    """Ejecuta el benchmark del cache de filas."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.core.cache import cache
+    from django.template.loader import get_template
+    from django.test import override_settings
+
+    from app.models import Client
+    from app.page_cache import CSRF_PLACEHOLDER
+    from app.projection import project
+    from benchmarks.data import fill_clients
+
+    print(f"Poblando {args.rows} clientes...")
+    fill_clients(args.rows)
+
+    template = get_template("clients/rows.html")
+
+    def render():
+        rows = list(project(Client.objects.order_by("id")))
+        context = {
+            "clients": rows,
+            "csrf_token": CSRF_PLACEHOLDER,
+            "row_cache_timeout": 600,
+        }
+        return template.render(context)
+
+    dummy = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    with override_settings(CACHES=dummy):
+        median, best = measure(render, repeat=3)
+        report("sin cache de filas", median, best)
+
+    sized = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": args.rows * 2},
+        },
+    }
+    with override_settings(CACHES=sized):
+        def cold():
+            cache.clear()
+            render()
+
+        median, best = measure(cold, repeat=3)
+        report("cache vacío (renderiza y guarda cada fila)", median, best)
+
+        render()
+        warm_median, warm_best = measure(render, repeat=3)
+        report("todas las filas en cache", warm_median, warm_best)
+
+        client = Client.objects.order_by("id")[args.rows // 2]
+        client.update_client(
+            {
+                "name": "Fila Editada",
+                "phone": "54221555232",
+                "email": "editada@vetsoft.com",
+                "city": client.city,
+            },
+        )
+        median, best = measure(render, repeat=1)
+        report("luego de editar una fila", median, best)
+
+
+if __name__ == "__main__":
+    main()
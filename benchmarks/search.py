@@ -0,0 +1,77 @@
+"""
+Benchmark de la búsqueda `?q=` del listado de clientes.
+
+Uso:
+    python -m benchmarks.search [--rows 1000000]
+
+Puebla una base temporal con N clientes y mide la primera y la segunda página de la
+búsqueda por prefijo (la misma consulta que arma `clients_repository`) contra un
+`icontains` sin índice como referencia. El objetivo es quedar por debajo de 50 ms.
+"""
+
+import argparse
+
+from benchmarks import measure, report, setup_django
+
+TARGET_MS = 50
+
+
+def main():
+    """Ejecuta el benchmark de búsqueda."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+    from django.http import QueryDict
+
+    from app.models import Client
+    from app.pagination import CursorPaginator
+    from app.search import search
+    from benchmarks.data import fill_clients
+
+    print(f"Poblando {args.rows} clientes...")
+    fill_clients(args.rows)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    def first_page(term):
+        paginator = CursorPaginator(search(Client.objects.all(), term))
+        return paginator.page(QueryDict())
+
+    def second_page(term):
+        page = first_page(term)
+        params = QueryDict(page.next_query) if page.has_next else QueryDict()
+        return CursorPaginator(search(Client.objects.all(), term)).page(params)
+
+    terms = {
+        "nombre (juan veron)": "juan veron",
+        "nombre exacto (juan veron bcd)": "juan veron bcd",
+        "email (cliente4242)": "cliente4242",
+        "teléfono (5422100042)": "5422100042",
+    }
+
+    worst = 0
+    for label, term in terms.items():
+        median, best = measure(lambda term=term: first_page(term))
+        report(f"q={label} primera página", median, best)
+        worst = max(worst, median)
+
+        median, best = measure(lambda term=term: second_page(term))
+        report(f"q={label} segunda página", median, best)
+        worst = max(worst, median)
+
+    median, best = measure(
+        lambda: list(Client.objects.filter(email__icontains="cliente4242@")[:50]),
+        repeat=5,
+    )
+    report("referencia: email icontains sin índice", median, best)
+
+    status = "OK" if worst < TARGET_MS else "FUERA DE OBJETIVO"
+    print(f"Peor mediana: {worst:.3f} ms (objetivo < {TARGET_MS} ms) -> {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark del orden `?sort=` de los listados.
+
+Uso:
+    python -m benchmarks.sorting [--rows 1000000]
+
+Puebla una base temporal con N clientes y mide la primera página y una página
+siguiente del listado ordenado por ciudad (ascendente y descendente), que se resuelven
+con el índice compuesto (city, id), contra un orden por nombre sin índice como
+referencia.
+"""
+
+import argparse
+
+from benchmarks import measure, report, setup_django
+
+
+def main():
+    """Ejecuta el benchmark de ordenamiento."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+    from django.http import QueryDict
+
+    from app.models import Client
+    from app.pagination import CursorPaginator
+    from app.projection import project
+    from app.sorting import sort_ordering
+    from benchmarks.data import fill_clients
+
+    print(f"Poblando {args.rows} clientes...")
+    fill_clients(args.rows)
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    def first_page(ordering):
+        return CursorPaginator(project(Client.objects.all()), ordering).page(QueryDict())
+
+    def second_page(ordering):
+        page = first_page(ordering)
+        params = QueryDict(page.next_query) if page.has_next else QueryDict()
+        return CursorPaginator(project(Client.objects.all()), ordering).page(params)
+
+    for sort in ["city", "-city"]:
+        ordering = sort_ordering(sort)
+        median, best = measure(lambda ordering=ordering: first_page(ordering))
+        report(f"sort={sort} primera página", median, best)
+        median, best = measure(lambda ordering=ordering: second_page(ordering))
+        report(f"sort={sort} segunda página", median, best)
+
+    median, best = measure(lambda: first_page(("name", "id")), repeat=5)
+    report("referencia: orden por nombre sin índice", median, best)
+
+
+if __name__ == "__main__":
+    main()
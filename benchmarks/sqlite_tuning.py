@@ -0,0 +1,126 @@
+"""
+Benchmark de concurrencia de SQLite con y sin el perfil de producción (`SQLITE_PRODUCTION`).
+
+Uso:
+    python -m benchmarks.sqlite_tuning [--readers 4] [--writers 2] [--seconds 5] [--rows 5000]
+
+Simula varios workers de gunicorn: lanza N procesos lectores que piden el listado de
+clientes (`/clientes/`) y M procesos escritores que crean clientes con el formulario
+(`POST /clientes/nuevo/`), todos contra la misma base SQLite y durante el mismo tiempo.
+Lo hace dos veces, cada una en un proceso nuevo y sobre una base nueva: con la
+configuración por defecto (journal de rollback) y con el perfil de producción (WAL y los
+PRAGMA de `SQLITE_PRAGMAS`). Imprime las requests por segundo, la latencia p95 y los
+errores "database is locked" de lectores y escritores.
+
+El cache se reemplaza por `DummyCache` para que cada lectura del listado llegue a la base.
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks import setup_django
+from benchmarks.bulk import client_rows
+
+PROFILES = ("default", "production")
+
+
+def worker(role, index, seconds, results):
+    """Ejecuta requests de lectura o escritura durante `seconds` y publica los resultados."""
+    from django.db import OperationalError, connections
+    from django.test import Client
+
+    connections.close_all()
+    http = Client()
+    latencies, locked, written = [], 0, 0
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            if role == "lector":
+                http.get("/clientes/")
+            else:
+                written += 1
+                http.post("/clientes/nuevo/", {
+                    "name": "Cliente Concurrente",
+                    "phone": str(5429000000 + index * 1_000_000 + written),
+                    "email": f"concurrente{index}-{written}@vetsoft.com",
+                    "city": "La Plata",
+                })
+        except OperationalError as e:
+            if "locked" not in str(e):
+                raise
+            locked += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+
+    results.put((role, latencies, locked))
+
+
+def run_profile(args):
+    """Ejecuta lectores y escritores concurrentes con el perfil indicado e imprime el resultado."""
+    os.environ["SQLITE_PRODUCTION"] = "1" if args.profile == "production" else ""
+    os.environ["CACHE_BACKEND"] = "django.core.cache.backends.dummy.DummyCache"
+    setup_django()
+
+    from django.db import connections
+
+    from app.models import Client
+
+    Client.save_client_bulk(client_rows(args.rows))
+    connections.close_all()
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    roles = [("lector", index) for index in range(args.readers)]
+    roles += [("escritor", args.readers + index) for index in range(args.writers)]
+    processes = [
+        context.Process(target=worker, args=(role, index, args.seconds, results))
+        for role, index in roles
+    ]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    for role in ("lector", "escritor"):
+        latencies = [value for name, values, _ in collected if name == role for value in values]
+        locked = sum(errors for name, _, errors in collected if name == role)
+        p95 = statistics.quantiles(latencies, n=20)[-1] * 1000 if len(latencies) > 1 else 0
+        print(
+            f"{args.profile:<11} {role + 'es':<10} {len(latencies) / args.seconds:>8,.0f} req/s   "
+            f"p95 {p95:8.1f} ms   {locked:>5} 'database is locked'",
+        )
+    total = sum(len(values) for _, values, _ in collected)
+    print(f"{args.profile:<11} {'total':<10} {total / args.seconds:>8,.0f} req/s")
+
+
+def main():
+    """Ejecuta el benchmark con cada perfil, en un proceso nuevo por perfil."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--profile", choices=PROFILES)
+    args = parser.parse_args()
+
+    if args.profile:
+        run_profile(args)
+        return
+
+    for profile in PROFILES:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.sqlite_tuning", *sys.argv[1:], "--profile", profile],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
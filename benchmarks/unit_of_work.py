@@ -0,0 +1,73 @@
+"""
+Benchmark de `Client.save_client` en autocommit contra dentro de una unidad de trabajo.
+
+Uso:
+    python -m benchmarks.unit_of_work [--rows 5000] [--batch-sizes 10,100,1000]
+
+Guarda N clientes de a uno con `Client.save_client`: primero en autocommit (una
+transacción, y un fsync de SQLite, por fila) y después dentro de `UnitOfWork` con cada
+tamaño de lote. Imprime las filas por segundo y las transacciones confirmadas por segundo
+de cada variante.
+"""
+
+import argparse
+import time
+
+from benchmarks import setup_django
+from benchmarks.bulk import client_rows
+
+
+def run(label, count, func, baseline=None):
+    """
+    Ejecuta `func`, que retorna la cantidad de COMMITs, e imprime filas y commits por segundo.
+
+    Returns:
+        float: Las filas por segundo.
+    """
+    start = time.perf_counter()
+    commits = func()
+    seconds = time.perf_counter() - start
+    rate = count / seconds
+    speedup = f"   x{rate / baseline:.1f}" if baseline else ""
+    print(
+        f"{label:<32} {count:>7} filas en {seconds:7.2f} s {rate:>9,.0f} filas/s "
+        f"{commits:>6} commits {commits / seconds:>8,.0f} commits/s{speedup}",
+    )
+    return rate
+
+
+def main():
+    """Ejecuta el benchmark de unidades de trabajo."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000)
+    parser.add_argument("--batch-sizes", default="10,100,1000")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from app.models import Client
+    from app.unit_of_work import UnitOfWork
+
+    start = 0
+
+    def autocommit():
+        for row in client_rows(args.rows, start=start):
+            Client.save_client(row)
+        return args.rows
+
+    baseline = run("autocommit", args.rows, autocommit)
+
+    for batch_size in (int(size) for size in args.batch_sizes.split(",")):
+        start += args.rows
+
+        def batched():
+            with UnitOfWork(batch_size=batch_size) as unit:
+                for row in client_rows(args.rows, start=start):
+                    Client.save_client(row)
+            return unit.commits
+
+        run(f"UnitOfWork(batch_size={batch_size})", args.rows, batched, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark de la sincronización de clientes por clave natural (email).
+
+Uso:
+    python -m benchmarks.upsert [--rows 200000] [--single-rows 5000]
+
+Sincroniza N clientes dos veces con `Client.upsert_client_bulk`: la primera pasada los
+crea y la segunda (el caso de una sincronización nocturna repetida) los actualiza. Como
+referencia se sincroniza una muestra más chica con el enfoque anterior: buscar cada
+cliente por email y luego actualizarlo o crearlo, fila por fila.
+"""
+
+import argparse
+
+from benchmarks import setup_django
+from benchmarks.bulk import throughput
+
+
+def client_rows(count, city="La Plata"):
+    """Genera los datos de `count` clientes con emails estables entre pasadas."""
+    for index in range(count):
+        yield {
+            "name": "Cliente Sincronizado",
+            "phone": str(5422100000 + index),
+            "email": f"sync{index}@vetsoft.com",
+            "city": city,
+        }
+
+
+def main():
+    """Ejecuta el benchmark de upsert."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--single-rows", type=int, default=5_000)
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from app.models import Client
+
+    def lookup_then_write(city):
+        for row in client_rows(args.single_rows, city):
+            client = Client.objects.filter(email=row["email"]).first()
+            if client is None:
+                Client.save_client(row)
+            else:
+                client.update_client(row)
+
+    throughput("buscar y escribir fila por fila (alta)", args.single_rows, lambda: lookup_then_write("La Plata"))
+    throughput("buscar y escribir fila por fila (cambio)", args.single_rows, lambda: lookup_then_write("Berisso"))
+    Client.objects.all().delete()
+
+    for label, city in (("alta", "La Plata"), ("cambio", "Berisso")):
+        with CaptureQueriesContext(connection) as queries:
+            throughput(
+                f"upsert_client_bulk ({label})",
+                args.rows,
+                lambda city=city: Client.upsert_client_bulk(client_rows(args.rows, city)),
+            )
+        print(f"{'':<45} {len(queries)} consultas")
+
+    assert Client.objects.count() == args.rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark de los validadores `validate_*` armados a partir de los esquemas contra los anteriores.
+
+Uso:
+    python -m benchmarks.validation [--rows 200000] [--column-rows 1000000]
+
+Valida N filas de cada modelo (una mezcla de filas válidas e inválidas) con los
+validadores de `app.validation` y con los anteriores (`benchmarks.legacy_validation`),
+verifica que ambos retornan exactamente los mismos errores e imprime las validaciones
+por segundo de cada uno. Falla si algún validador nuevo es más lento que el anterior.
+
+Luego valida una importación grande de clientes, mascotas y productos (una fila
+inválida cada mil) fila por fila, por columnas (`validate_*.columns`, con los datos ya
+organizados en columnas) y con `validate_rows` (que además arma las columnas a partir de
+las filas, como en `save_*_bulk`), y verifica que los tres dan los mismos errores. No usa
+la base de datos.
+"""
+
+import argparse
+import datetime
+import time
+from itertools import cycle, islice
+
+from app import validation
+from benchmarks import legacy_validation
+
+TODAY = datetime.date.today()
+
+SAMPLES = {
+    "client": [
+        {"name": "Juan Sebastian Veron", "phone": "5422149", "email": "brujita75@vetsoft.com", "city": "La Plata"},
+        {"name": "Juan Sebastian Veron", "phone": "5422149", "email": "brujita75@vetsoft.com", "city": "Berisso"},
+        {"name": "Juan 75", "phone": "22149", "email": "brujita 75@vetsoft.com", "city": ""},
+        {"name": "", "phone": "54abc", "email": "brujita75@gmail.com", "city": "Ensenada"},
+    ],
+    "provider": [
+        {"name": "Distribuidora Sur", "email": "ventas@sur.com", "city": "La Plata"},
+        {"name": "Distribuidora 2", "email": "ventas", "city": ""},
+    ],
+    "medicine": [
+        {"name": "Ibuprofeno", "description": "Antiinflamatorio", "dose": "5"},
+        {"name": "Ibuprofeno", "description": "", "dose": "15"},
+        {"name": "", "description": "Antiinflamatorio", "dose": "cinco"},
+    ],
+    "product": [
+        {"name": "Alimento Balanceado", "type": "Alimento", "price": "1500.50"},
+        {"name": "Alimento Balanceado", "type": "Alimento", "price": "-3"},
+        {"name": "Collar 2", "type": "", "price": "caro"},
+    ],
+    "pet": [
+        {"name": "Firulais", "breed": "Caniche", "birthday": "2020-01-01"},
+        {"name": "Firulais", "breed": "", "birthday": (TODAY + datetime.timedelta(days=1)).isoformat()},
+        {"name": "", "breed": "Caniche", "birthday": ""},
+    ],
+    "vet": [
+        {"name": "Ana Garcia", "email": "ana@vetsoft.com", "phone": "5422155", "speciality": "Cardiologia"},
+        {"name": "Ana 2", "email": "ana", "phone": "22155", "speciality": ""},
+    ],
+}
+
+
+def import_rows(model, count):
+    """Genera `count` filas de una importación, con una fila inválida cada mil."""
+    for index in range(count):
+        if model == "client":
+            row = {
+                "name": "Cliente Importado",
+                "phone": str(5422100000 + index),
+                "email": f"importado{index}@vetsoft.com",
+                "city": ("La Plata", "Berisso", "Ensenada")[index % 3],
+            }
+        elif model == "pet":
+            row = {
+                "name": "Mascota",
+                "breed": ("Caniche", "Labrador", "Mestizo")[index % 3],
+                "birthday": f"20{index % 20:02d}-0{index % 9 + 1}-1{index % 10}",
+            }
+        else:
+            row = {"name": "Producto", "type": "Alimento", "price": f"{index % 5000 + 1}.50"}
+
+        if index % 1000 == 999:
+            row["name"] = f"Fila {index}"
+        yield row
+
+
+def best_rate(func, count, repeat=3):
+    """Ejecuta `func` varias veces y retorna el resultado y las filas por segundo de la mejor."""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        seconds.append(time.perf_counter() - start)
+    return result, count / min(seconds)
+
+
+def compare_rates(before, after, rows, repeat=7):
+    """
+    Valida todas las filas con los dos validadores, alternándolos para que una racha de
+    ruido en la máquina no afecte a uno solo, y retorna las validaciones por segundo de
+    la mejor pasada de cada uno.
+    """
+    rates = [0.0, 0.0]
+    for _ in range(repeat):
+        for index, validate in enumerate((before, after)):
+            rate = best_rate(lambda: [validate(row) for row in rows], len(rows), repeat=1)[1]
+            rates[index] = max(rates[index], rate)
+    return rates
+
+
+def main():
+    """Ejecuta el benchmark de validación."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--column-rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for model, samples in SAMPLES.items():
+        legacy = getattr(legacy_validation, f"validate_{model}")
+        compiled = getattr(validation, f"validate_{model}")
+        for row in samples:
+            assert legacy(row) == compiled(row), (model, row)
+
+        rows = list(islice(cycle(samples), args.rows))
+        before, after = compare_rates(legacy, compiled, rows)
+        print(
+            f"validate_{model:<10} anterior {before:>12,.0f} val/s   "
+            f"esquema   {after:>12,.0f} val/s   x{after / before:.1f}",
+        )
+        assert after > before, f"validate_{model} es más lento que el validador anterior"
+
+    print()
+    for model in ("client", "pet", "product"):
+        validate = getattr(validation, f"validate_{model}")
+        rows = list(import_rows(model, args.column_rows))
+        columns = {field.name: [row[field.name] for row in rows] for field in validate.fields}
+
+        by_row, row_rate = best_rate(lambda: [validate(row) for row in rows], len(rows))
+        by_column, column_rate = best_rate(lambda: validate.columns(columns), len(rows))
+        from_rows, rows_rate = best_rate(
+            lambda: validation.validate_rows(validate, rows), len(rows),
+        )
+
+        assert by_row == by_column == from_rows, model
+        print(
+            f"validate_{model:<8} por fila {row_rate:>11,.0f} val/s   "
+            f"por columnas {column_rate:>12,.0f} val/s (x{column_rate / row_rate:.1f})   "
+            f"validate_rows {rows_rate:>11,.0f} val/s (x{rows_rate / row_rate:.1f})",
+        )
+
+
+if __name__ == "__main__":
+    main()
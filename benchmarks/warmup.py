@@ -0,0 +1,98 @@
+"""
+Benchmark de la latencia de la primera request con y sin warm-up.
+
+Uso:
+    python -m benchmarks.warmup
+
+Lanza dos procesos nuevos sobre la misma base temporal. Uno atiende directamente la
+primera request de cada página ("en frío"); el otro ejecuta antes `app.warmup.warm_up()`,
+como hace un worker con WARMUP_ON_BOOT. Se informa la latencia de la primera request a
+cada página y el total.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+from benchmarks import setup_django
+
+PAGES = [
+    ("home", {}),
+    ("clients_repo", {}),
+    ("clients_form", {}),
+    ("providers_repo", {}),
+    ("providers_form", {}),
+    ("medicine_repo", {}),
+    ("medicine_form", {}),
+    ("products_repo", {}),
+    ("products_form", {}),
+    ("pets_repo", {}),
+    ("pets_form", {}),
+    ("vets_repo", {}),
+    ("vets_form", {}),
+]
+
+
+def child(mode, db_name):
+    """Mide la primera request a cada página en un proceso nuevo e imprime JSON."""
+    setup_django(db_name)
+
+    from django.test import Client
+    from django.urls import reverse
+
+    from app.warmup import warm_up
+
+    warmup_ms = 0
+    if mode == "warm":
+        warmup_ms = warm_up()["seconds"] * 1000
+
+    browser = Client()
+    timings = {}
+    for name, kwargs in PAGES:
+        start = time.perf_counter()
+        browser.get(reverse(name, kwargs=kwargs))
+        timings[name] = (time.perf_counter() - start) * 1000
+
+    print(json.dumps({"warmup_ms": warmup_ms, "timings": timings}))
+
+
+def run(mode, db_name):
+    """Ejecuta un proceso hijo y retorna sus mediciones."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.warmup", "--child", mode, "--db", db_name],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """Compara la primera request en frío y luego del warm-up."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--child", choices=["cold", "warm"])
+    parser.add_argument("--db")
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.db)
+        return
+
+    db_name = setup_django()
+    cold = run("cold", db_name)
+    warm = run("warm", db_name)
+
+    print(f"{'página':<20} {'en frío':>12} {'con warm-up':>14}")
+    for name, _ in PAGES:
+        print(f"{name:<20} {cold['timings'][name]:9.2f} ms {warm['timings'][name]:11.2f} ms")
+    print(
+        f"{'total':<20} {sum(cold['timings'].values()):9.2f} ms "
+        f"{sum(warm['timings'].values()):11.2f} ms",
+    )
+    print(f"warm-up al iniciar el proceso: {warm['warmup_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -200,7 +200,9 @@ class ClientsRepoTestCase(PlaywrightTestCase):
             return response.url.find(reverse("clients_delete"))
 
         with self.page.expect_response(is_delete_response) as response_info:
-            self.page.get_by_role("button", name="Eliminar").click()
+            self.page.get_by_role(
+                "form", name="Formulario de eliminación de cliente",
+            ).get_by_role("button", name="Eliminar").click()
 
         response = response_info.value
         self.assertTrue(response.status < 400)
@@ -793,7 +795,9 @@ class PetsRepoTestCase(PlaywrightTestCase):
             return response.url.find(reverse("pets_delete"))
         
         with self.page.expect_response(is_delete_response) as response_info:
-            self.page.get_by_role("button", name="Eliminar").click()
+            self.page.get_by_role(
+                "form", name="Formulario de eliminación de mascotas",
+            ).get_by_role("button", name="Eliminar").click()
         
         response = response_info.value
         self.assertTrue(response.status < 400) #si es menor es exitoso
@@ -1178,7 +1182,9 @@ class VetsRepoTestCase(PlaywrightTestCase):
             return response.url.find(reverse("vets_delete"))
         
         with self.page.expect_response(is_delete_response) as response_info:
-            self.page.get_by_role("button", name="Eliminar").click()
+            self.page.get_by_role(
+                "form", name="Formulario de eliminación de veterinario",
+            ).get_by_role("button", name="Eliminar").click()
         
         response = response_info.value
         
@@ -1450,7 +1456,9 @@ class ProvidersRepoTestCase(PlaywrightTestCase):
             return response.url.find(reverse("providers_delete"))
 
         with self.page.expect_response(is_delete_response) as response_info:
-            self.page.get_by_role("button", name="Eliminar").click()
+            self.page.get_by_role(
+                "form", name="Formulario de eliminación de proveedor",
+            ).get_by_role("button", name="Eliminar").click()
 
         response = response_info.value
         self.assertTrue(response.status < 400)
@@ -59,6 +59,8 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "app.middleware.ReadYourWritesMiddleware",
+    "app.middleware.UnitOfWorkMiddleware",
 ]
 
 ROOT_URLCONF = "vetsoft.urls"
@@ -67,8 +69,19 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Loader cacheado explícito: cada template se compila una sola vez por
+            # proceso. Ver `python manage.py warmup` y WARMUP_ON_BOOT para compilarlos
+            # antes de la primera request.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -82,18 +95,159 @@ TEMPLATES = [
 
 WSGI_APPLICATION = "vetsoft.wsgi.application"
 
+# Si está activo, cada proceso compila los templates y resuelve las URLs al iniciar
+# (ver app/warmup.py), antes de atender la primera request.
+
+WARMUP_ON_BOOT = os.getenv("WARMUP_ON_BOOT", "") not in ("", "0", "False", "false")
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+# `DB_CONN_MAX_AGE` son los segundos que cada hilo conserva su conexión entre requests
+# (0 la cierra al terminar cada request, vacío la conserva sin límite) y
+# `DB_CONN_HEALTH_CHECKS` verifica una conexión conservada antes de reutilizarla.
+# Con `DB_ENGINE="app.backends.sqlite_pool"` las conexiones salen de un pool del proceso
+# (ver app/backends/sqlite_pool/base.py), útil cuando los hilos se crean y terminan.
+
+DB_CONN_MAX_AGE = os.getenv("DB_CONN_MAX_AGE", "60")
 
 DATABASES = {
     "default": {
         "ENGINE": os.getenv("DB_ENGINE", "django.db.backends.sqlite3"),
         "NAME": os.getenv("DB_NAME", str(BASE_DIR / "db.sqlite3")),
+        "CONN_MAX_AGE": int(DB_CONN_MAX_AGE) if DB_CONN_MAX_AGE else None,
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "True") not in ("", "0", "False", "false"),
+    },
+}
+
+# Réplica de lectura (app/replicas.py)
+# Con `REPLICA_DB_NAME` los listados, búsquedas y exportaciones leen de una réplica y todo
+# lo demás del primario. Con SQLite la réplica es otro archivo que `python manage.py
+# sync_replica [--interval 5]` mantiene al día con la API de backup. Una sesión que
+# escribió lee del primario durante `REPLICA_STICKY_SECONDS` segundos. Requiere un
+# `CACHE_BACKEND` compartido entre procesos (ver app/apps.py).
+
+REPLICA_DB_NAME = os.getenv("REPLICA_DB_NAME", "")
+
+REPLICA_DATABASE = "replica" if REPLICA_DB_NAME else None
+
+if REPLICA_DATABASE:
+    DATABASES[REPLICA_DATABASE] = {
+        **DATABASES["default"],
+        "NAME": REPLICA_DB_NAME,
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["app.replicas.ReplicaRouter"]
+
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "10"))
+
+REPLICA_STICKY_COOKIE = "vetsoft_primary"
+
+# Pool de conexiones (app.backends.sqlite_pool)
+# Conexiones abiertas como máximo por proceso y segundos que se espera una libre.
+
+DB_POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", "8"))
+
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+# Perfil de producción de SQLite (app/sqlite.py)
+# Si está activo, cada conexión nueva a SQLite ejecuta los PRAGMA de `SQLITE_PRAGMAS`: WAL
+# para que lectores y escritor no se bloqueen entre sí, fsync solo en los checkpoints,
+# espera ante escrituras concurrentes en lugar de "database is locked", y páginas y tablas
+# temporales en memoria. Recomendado con gunicorn y varios workers.
+
+SQLITE_PRODUCTION = os.getenv("SQLITE_PRODUCTION", "") not in ("", "0", "False", "false")
+
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    # Milisegundos que espera una escritura a que se libere el lock
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000")),
+    # Bytes de la base mapeados en memoria
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+    # Negativo: KiB de cache de páginas por conexión
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-65536")),
+    "temp_store": os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Las versiones de cambios de cada modelo (ETag / Last-Modified de los listados) viven en
+# el cache. Con varios procesos (por ejemplo gunicorn con varios workers) debe usarse un
+# backend compartido, como FileBasedCache o Redis, para que todos vean la misma versión
+# (`python manage.py check --deploy` advierte si el cache es LocMemCache).
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "vetsoft"),
     },
 }
 
 
+# Listados (repository views)
+# Cantidad de filas por página de la paginación por cursor y máximo aceptado en `?page_size=`
+
+REPOSITORY_PAGE_SIZE = int(os.getenv("REPOSITORY_PAGE_SIZE", "50"))
+
+REPOSITORY_MAX_PAGE_SIZE = int(os.getenv("REPOSITORY_MAX_PAGE_SIZE", "500"))
+
+# Cantidad de filas que se leen y renderizan por bloque en el modo `?stream=1`
+
+REPOSITORY_STREAM_CHUNK_SIZE = int(os.getenv("REPOSITORY_STREAM_CHUNK_SIZE", "500"))
+
+# Segundos que se guarda en cache el HTML de cada página de listado (0 lo desactiva).
+# Las páginas se invalidan solas con cada escritura del modelo, así que el valor solo
+# acota cuánto ocupan en el cache las páginas que ya nadie pide.
+
+REPOSITORY_CACHE_TIMEOUT = int(os.getenv("REPOSITORY_CACHE_TIMEOUT", "0"))
+
+# Segundos que se guarda en cache el HTML de cada fila de los listados. La clave incluye
+# el id y `updated_at` de la fila, así que una fila editada nunca se sirve desactualizada
+# y al cambiar un registro solo se vuelve a renderizar esa fila.
+
+REPOSITORY_ROW_CACHE_TIMEOUT = int(os.getenv("REPOSITORY_ROW_CACHE_TIMEOUT", "600"))
+
+# Búsqueda por palabras (app/fulltext.py)
+# Resultados por sección (clientes, mascotas y medicinas) en /buscar/
+
+FULLTEXT_RESULTS = int(os.getenv("FULLTEXT_RESULTS", "20"))
+
+# Cantidad de filas que las cargas masivas (`save_*_bulk`) validan y acumulan en memoria
+# antes de insertarlas con `bulk_create`. Todos los lotes de una carga van en la misma
+# transacción.
+
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "1000"))
+
+# Unidades de trabajo (app/unit_of_work.py)
+# Si las vistas que modifican datos agrupan todas sus escrituras en una transacción
+
+UNIT_OF_WORK_REQUESTS = os.getenv("UNIT_OF_WORK_REQUESTS", "True") not in ("", "0", "False", "false")
+
+# Escrituras por transacción dentro de una unidad de trabajo: al completarse el lote se
+# confirma y se abre la transacción siguiente.
+
+UNIT_OF_WORK_BATCH_SIZE = int(os.getenv("UNIT_OF_WORK_BATCH_SIZE", "500"))
+
+# Importaciones en segundo plano (app/jobs.py)
+# Directorio donde se guardan los CSV subidos y los de filas rechazadas
+
+IMPORT_JOBS_DIR = os.getenv("IMPORT_JOBS_DIR", str(BASE_DIR / "imports"))
+
+# Hilos por proceso que ejecutan importaciones. Con 0 la importación se ejecuta dentro de
+# la misma request (útil para pruebas).
+
+IMPORT_JOB_WORKERS = int(os.getenv("IMPORT_JOB_WORKERS", "1"))
+
+# Segundos sin avance tras los cuales una importación en curso se considera interrumpida
+# (por ejemplo porque se reinició el worker) y otro proceso la puede continuar. Tiene que
+# ser mayor que lo que tarda en guardarse un lote.
+
+IMPORT_JOB_STALE_SECONDS = int(os.getenv("IMPORT_JOB_STALE_SECONDS", "60"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -118,7 +272,7 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = os.getenv("LANGUAGE_CODE", "en-us")
 
-TIME_ZONE = os.getenv("TIME_ZONE")
+TIME_ZONE = os.getenv("TIME_ZONE", "UTC")
 
 USE_I18N = True
 
@@ -9,8 +9,16 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vetsoft.settings")
 
 application = get_wsgi_application()
+
+if settings.WARMUP_ON_BOOT:
+    # Con todas las aplicaciones listas (y el admin con sus modelos registrados) se
+    # compilan los templates y se resuelven las URLs antes de que el worker acepte tráfico.
+    from app.warmup import warm_up
+
+    warm_up()